@@ -39,6 +39,7 @@ from fnv_planner.parser.plugin_merge import (
 from fnv_planner.parser.spell_parser import (
     linked_spell_names_by_form,
     linked_spell_stat_bonuses_by_form,
+    merged_spell_rows,
 )
 
 
@@ -405,8 +406,9 @@ def main() -> None:
             goal.skill_books_by_av = books_by_av
         if books_by_av:
             print(f"Detected skill books in plugins: {sum(books_by_av.values())}")
-        linked_spells = linked_spell_names_by_form(plugin_datas)
-        linked_spell_bonuses = linked_spell_stat_bonuses_by_form(plugin_datas)
+        spell_rows = merged_spell_rows(plugin_datas)
+        linked_spells = linked_spell_names_by_form(plugin_datas, spell_rows=spell_rows)
+        linked_spell_bonuses = linked_spell_stat_bonuses_by_form(plugin_datas, spell_rows=spell_rows)
     else:
         gmst = GameSettings.defaults()
         perks = []
@@ -12,7 +12,9 @@ to avoid redundant computation during validation.
 from __future__ import annotations
 
 import copy
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 
 from fnv_planner.engine.build_config import BuildConfig
 from fnv_planner.graph.dependency_graph import DependencyGraph
@@ -158,6 +160,16 @@ class BuildEngine:
         """Return a deep copy of the current build state for serialisation."""
         return copy.deepcopy(self._state)
 
+    @property
+    def target_level(self) -> int:
+        """Current target level, without copying the state."""
+        return self._state.target_level
+
+    @property
+    def special(self) -> Mapping[int, int]:
+        """Read-only view of the creation SPECIAL, without copying the state."""
+        return MappingProxyType(self._state.special)
+
     @property
     def max_level(self) -> int:
         """Maximum character level from GMST, adjusted by active perk effects."""
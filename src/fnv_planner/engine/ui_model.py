@@ -6,7 +6,7 @@ data shapes that any UI toolkit can render.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Literal
 
 from fnv_planner.engine.build_engine import BuildEngine
@@ -64,6 +64,11 @@ class CatalogItem:
     weight: float
     conditional_effects: int = 0
     excluded_conditional_effects: int = 0
+    # Lowercased name for search and sorting, derived once at construction.
+    name_lower: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name_lower", self.name.lower())
 
 
 @dataclass(frozen=True, slots=True)
@@ -80,7 +85,7 @@ class UiDiagnostic:
 class BuildUiModel:
     """Read/write adapter for UI operations over a BuildEngine."""
 
-    __slots__ = ("_engine", "_armors", "_weapons")
+    __slots__ = ("_engine", "_armors", "_weapons", "_catalog", "_catalog_version")
 
     def __init__(
         self,
@@ -91,6 +96,9 @@ class BuildUiModel:
         self._engine = engine
         self._armors = armors or {}
         self._weapons = weapons or {}
+        # Full sorted catalog; built on first use.
+        self._catalog: list[CatalogItem] | None = None
+        self._catalog_version = 0
 
     def set_gear_catalog(
         self,
@@ -99,6 +107,13 @@ class BuildUiModel:
     ) -> None:
         self._armors = dict(armors)
         self._weapons = dict(weapons)
+        self._catalog = None
+        self._catalog_version += 1
+
+    @property
+    def gear_catalog_version(self) -> int:
+        """Bumped whenever the gear catalog is replaced."""
+        return self._catalog_version
 
     def selected_entities(self) -> list[SelectedEntity]:
         """Return all currently selected entities in one flat list."""
@@ -235,13 +250,20 @@ class BuildUiModel:
         )
 
     def gear_catalog(self, query: str = "") -> list[CatalogItem]:
+        if self._catalog is None:
+            self._catalog = self._build_gear_catalog()
         q = query.strip().lower()
+        if not q:
+            return list(self._catalog)
+        return [item for item in self._catalog if q in item.name_lower]
+
+    def _build_gear_catalog(self) -> list[CatalogItem]:
         items: list[CatalogItem] = []
 
         for armor in self._armors.values():
             if not armor.is_playable:
                 continue
-            item = CatalogItem(
+            items.append(CatalogItem(
                 kind="armor",
                 form_id=armor.form_id,
                 name=armor.name,
@@ -250,15 +272,12 @@ class BuildUiModel:
                 weight=armor.weight,
                 conditional_effects=sum(1 for e in armor.stat_effects if e.is_conditional),
                 excluded_conditional_effects=armor.conditional_effects_excluded,
-            )
-            if q and q not in item.name.lower():
-                continue
-            items.append(item)
+            ))
 
         for weapon in self._weapons.values():
             if not weapon.is_playable:
                 continue
-            item = CatalogItem(
+            items.append(CatalogItem(
                 kind="weapon",
                 form_id=weapon.form_id,
                 name=weapon.name,
@@ -267,12 +286,10 @@ class BuildUiModel:
                 weight=weapon.weight,
                 conditional_effects=sum(1 for e in weapon.stat_effects if e.is_conditional),
                 excluded_conditional_effects=weapon.conditional_effects_excluded,
-            )
-            if q and q not in item.name.lower():
-                continue
-            items.append(item)
+            ))
 
-        return sorted(items, key=lambda it: (it.kind, it.name.lower()))
+        items.sort(key=lambda item: (item.kind, item.name_lower))
+        return items
 
     def diagnostics(self, level: int | None = None) -> list[UiDiagnostic]:
         """Return warnings/errors for strict-mode uncertainty and exclusions."""
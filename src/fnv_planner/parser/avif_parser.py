@@ -2,6 +2,7 @@
 
 from fnv_planner.models.avif import ActorValueInfo
 from fnv_planner.models.records import Record
+from fnv_planner.parser.binary_reader import decode_zstring
 
 
 def parse_avif(record: Record) -> ActorValueInfo:
@@ -14,15 +15,15 @@ def parse_avif(record: Record) -> ActorValueInfo:
 
     for sub in record.subrecords:
         if sub.type == "EDID":
-            editor_id = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            editor_id = decode_zstring(sub.data)
         elif sub.type == "FULL":
-            name = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            name = decode_zstring(sub.data)
         elif sub.type == "DESC":
-            description = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            description = decode_zstring(sub.data)
         elif sub.type == "ANAM":
-            abbreviation = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            abbreviation = decode_zstring(sub.data)
         elif sub.type == "ICON":
-            icon_path = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            icon_path = decode_zstring(sub.data)
 
     return ActorValueInfo(
         form_id=record.header.form_id,
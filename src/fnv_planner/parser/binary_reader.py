@@ -9,6 +9,9 @@ class BinaryReader:
     Key design: slice(size) returns a new BinaryReader bounded to the next
     `size` bytes. This lets record parsers read freely without overrunning
     into the next record.
+
+    Any buffer whose slices are bytes works (bytes, mmap); other
+    buffer-protocol objects such as memoryview are copied per read.
     """
 
     __slots__ = ("_data", "_pos", "_end")
@@ -18,6 +21,11 @@ class BinaryReader:
         self._pos = offset
         self._end = end if end is not None else len(data)
 
+    @property
+    def buffer(self) -> bytes:
+        """The underlying buffer (unbounded; pair with position/remaining)."""
+        return self._data
+
     @property
     def position(self) -> int:
         return self._pos
@@ -34,7 +42,7 @@ class BinaryReader:
             )
         chunk = self._data[self._pos : self._pos + size]
         self._pos += size
-        return chunk
+        return chunk if type(chunk) is bytes else bytes(chunk)
 
     def uint8(self) -> int:
         return self._read(1)[0]
@@ -61,11 +69,15 @@ class BinaryReader:
     def cstring(self) -> str:
         """Read a null-terminated string."""
         start = self._pos
-        try:
-            null = self._data.index(b"\x00", start, self._end)
-        except ValueError:
+        data = self._data
+        if isinstance(data, memoryview):
+            null = bytes(data[start : self._end]).find(b"\x00")
+            null = null + start if null >= 0 else -1
+        else:
+            null = data.find(b"\x00", start, self._end)
+        if null < 0:
             raise ValueError(f"No null terminator found starting at offset {start}")
-        result = self._data[start:null].decode("utf-8", errors="replace")
+        result = bytes(data[start:null]).decode("utf-8", errors="replace")
         self._pos = null + 1  # skip past the null byte
         return result
 
@@ -96,3 +108,13 @@ class BinaryReader:
         if offset < 0 or offset > self._end:
             raise ValueError(f"Seek to {offset} is outside bounds [0, {self._end}]")
         self._pos = offset
+
+
+def decode_zstring(data: bytes) -> str:
+    """Decode a NUL-terminated subrecord string (EDID, FULL, DESC, ...).
+
+    Cuts at the first NUL instead of rstrip-ing the padding, so no stripped
+    copy is built; data without a terminator is decoded whole.
+    """
+    end = data.find(b"\x00")
+    return (data if end < 0 else data[:end]).decode("utf-8", errors="replace")
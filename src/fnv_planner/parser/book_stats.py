@@ -7,6 +7,7 @@ from dataclasses import dataclass
 
 from fnv_planner.models.constants import ActorValue
 from fnv_planner.models.item import Book
+from fnv_planner.parser.binary_reader import decode_zstring
 from fnv_planner.parser.record_reader import iter_records_of_types
 
 
@@ -113,7 +114,7 @@ def skill_book_source_breakdown(
                 for sub in rec.subrecords:
                     if sub.type != "EDID":
                         continue
-                    edid = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+                    edid = decode_zstring(sub.data)
                     break
                 prefix = "NVDLC03RecipeSkillBook"
                 suffix = "ITEM"
@@ -27,6 +27,7 @@ from fnv_planner.models.effect import (
     MagicEffect,
 )
 from fnv_planner.models.records import Record
+from fnv_planner.parser.binary_reader import decode_zstring
 
 
 _COMPARISON_SYMBOLS: dict[int, str] = {
@@ -67,9 +68,9 @@ def parse_mgef(record: Record) -> MagicEffect:
 
     for sub in record.subrecords:
         if sub.type == "EDID":
-            editor_id = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            editor_id = decode_zstring(sub.data)
         elif sub.type == "FULL":
-            name = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            name = decode_zstring(sub.data)
         elif sub.type == "DATA" and len(sub.data) >= 72:
             # Only read archetype and actor_value from the 72-byte DATA block
             archetype = struct.unpack_from("<I", sub.data, 64)[0]
@@ -103,9 +104,9 @@ def parse_ench(record: Record) -> Enchantment:
 
     for sub in record.subrecords:
         if sub.type == "EDID":
-            editor_id = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            editor_id = decode_zstring(sub.data)
         elif sub.type == "FULL":
-            name = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            name = decode_zstring(sub.data)
         elif sub.type == "ENIT" and len(sub.data) >= 4:
             ench_type = struct.unpack_from("<I", sub.data, 0)[0]
         elif sub.type == "EFID" and len(sub.data) >= 4:
@@ -10,6 +10,7 @@ Each has:
 import struct
 
 from fnv_planner.models.records import Record
+from fnv_planner.parser.binary_reader import decode_zstring
 
 
 def parse_gmst(record: Record) -> tuple[str, int | float | str]:
@@ -23,7 +24,7 @@ def parse_gmst(record: Record) -> tuple[str, int | float | str]:
 
     for sub in record.subrecords:
         if sub.type == "EDID":
-            editor_id = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            editor_id = decode_zstring(sub.data)
         elif sub.type == "DATA":
             raw_data = sub.data
 
@@ -37,7 +38,7 @@ def parse_gmst(record: Record) -> tuple[str, int | float | str]:
     elif prefix == "i" and len(raw_data) >= 4:
         value = struct.unpack_from("<i", raw_data, 0)[0]
     elif prefix == "s":
-        value = raw_data.rstrip(b"\x00").decode("utf-8", errors="replace")
+        value = decode_zstring(raw_data)
     else:
         # Unknown prefix or missing data — store raw as int
         value = struct.unpack_from("<i", raw_data, 0)[0] if len(raw_data) >= 4 else 0
@@ -14,6 +14,7 @@ import struct
 from fnv_planner.models.effect import EffectCondition, EnchantmentEffect
 from fnv_planner.models.item import Armor, Book, Consumable, Weapon
 from fnv_planner.models.records import Record
+from fnv_planner.parser.binary_reader import decode_zstring
 
 
 _COMPARISON_SYMBOLS: dict[int, str] = {
@@ -58,9 +59,9 @@ def parse_armor(record: Record) -> Armor:
 
     for sub in record.subrecords:
         if sub.type == "EDID":
-            editor_id = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            editor_id = decode_zstring(sub.data)
         elif sub.type == "FULL":
-            name = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            name = decode_zstring(sub.data)
         elif sub.type == "ETYP" and len(sub.data) >= 4:
             equipment_slot = struct.unpack_from("<i", sub.data, 0)[0]
         elif sub.type == "EITM" and len(sub.data) >= 4:
@@ -118,9 +119,9 @@ def parse_weapon(record: Record) -> Weapon:
 
     for sub in record.subrecords:
         if sub.type == "EDID":
-            editor_id = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            editor_id = decode_zstring(sub.data)
         elif sub.type == "FULL":
-            name = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            name = decode_zstring(sub.data)
         elif sub.type == "ETYP" and len(sub.data) >= 4:
             equipment_slot = struct.unpack_from("<i", sub.data, 0)[0]
         elif sub.type == "EITM" and len(sub.data) >= 4:
@@ -182,9 +183,9 @@ def parse_consumable(record: Record) -> Consumable:
 
     for sub in record.subrecords:
         if sub.type == "EDID":
-            editor_id = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            editor_id = decode_zstring(sub.data)
         elif sub.type == "FULL":
-            name = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            name = decode_zstring(sub.data)
         elif sub.type == "DATA" and len(sub.data) >= 4:
             # ALCH DATA is just weight (float32)
             weight = struct.unpack_from("<f", sub.data, 0)[0]
@@ -242,9 +243,9 @@ def parse_book(record: Record) -> Book:
 
     for sub in record.subrecords:
         if sub.type == "EDID":
-            editor_id = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            editor_id = decode_zstring(sub.data)
         elif sub.type == "FULL":
-            name = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            name = decode_zstring(sub.data)
         elif sub.type == "DATA" and len(sub.data) >= 10:
             # flags(u8) + skill_index(i8) + value(u32) + weight(f32)
             skill_index = struct.unpack_from("<b", sub.data, 1)[0]
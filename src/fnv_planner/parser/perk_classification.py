@@ -12,6 +12,7 @@ from dataclasses import dataclass
 
 from fnv_planner.models.perk import Perk
 from fnv_planner.models.records import Record
+from fnv_planner.parser.binary_reader import decode_zstring
 from fnv_planner.parser.record_reader import read_grup
 
 
@@ -33,7 +34,7 @@ def challenge_names_from_plugin(data: bytes) -> set[str]:
         full_name = ""
         for sub in record.subrecords:
             if sub.type == "FULL":
-                full_name = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+                full_name = decode_zstring(sub.data)
                 break
         if full_name:
             names.add(full_name)
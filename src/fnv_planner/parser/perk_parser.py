@@ -36,6 +36,7 @@ from fnv_planner.models.perk import (
     SkillRequirement,
 )
 from fnv_planner.models.records import Record, Subrecord
+from fnv_planner.parser.binary_reader import decode_zstring
 
 
 def _decode_ctda(sub: Subrecord) -> dict:
@@ -90,13 +91,13 @@ def parse_perk(record: Record) -> Perk:
 
     for sub in record.subrecords:
         if sub.type == "EDID":
-            editor_id = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            editor_id = decode_zstring(sub.data)
 
         elif sub.type == "FULL":
-            full_name = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            full_name = decode_zstring(sub.data)
 
         elif sub.type == "DESC":
-            description = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            description = decode_zstring(sub.data)
 
         elif sub.type == "DATA" and not seen_perk_data and len(sub.data) == 5:
             # Perk metadata: trait(1) + min_level(1) + ranks(1) + playable(1) + hidden(1)
@@ -3,7 +3,9 @@
 Input order matters: later plugins override earlier ones ("last wins").
 """
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+import mmap
 from pathlib import Path
 from typing import TypeVar
 
@@ -48,6 +50,46 @@ def load_plugin_bytes(paths: Iterable[Path]) -> list[bytes]:
     return [p.read_bytes() for p in paths]
 
 
+def map_plugin_file(path: Path) -> mmap.mmap | bytes:
+    """Memory-map a plugin read-only; pages are loaded only as they are touched.
+
+    Slices of the map are plain bytes, so it can stand in for the file
+    contents anywhere the parsers expect ``bytes``. Empty files (which cannot
+    be mapped) yield ``b""``.
+    """
+    with path.open("rb") as fh:
+        try:
+            return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b""
+
+
+def load_plugin_mmaps(paths: Iterable[Path]) -> list[mmap.mmap | bytes]:
+    """Like load_plugin_bytes, but maps each plugin instead of copying it to the heap."""
+    return [map_plugin_file(p) for p in paths]
+
+
+@contextmanager
+def mapped_plugins(paths: Iterable[Path]) -> Iterator[list[mmap.mmap | bytes]]:
+    """load_plugin_mmaps scoped to a ``with`` block; the maps are closed on exit.
+
+    Closing releases the file handles, which on Windows would otherwise keep
+    the plugins from being replaced while the planner runs.
+    """
+    datas = load_plugin_mmaps(paths)
+    try:
+        yield datas
+    finally:
+        for data in datas:
+            if isinstance(data, mmap.mmap):
+                try:
+                    data.close()
+                except BufferError:
+                    # A live view (e.g. held by an in-flight traceback) pins the
+                    # map; it is released when that view is collected instead.
+                    pass
+
+
 def default_vanilla_plugins(primary_esm_path: Path) -> tuple[list[Path], list[Path]]:
     """Return (existing, missing) default vanilla plugin paths in load order."""
     data_dir = primary_esm_path.parent
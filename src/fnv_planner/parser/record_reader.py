@@ -7,101 +7,145 @@ Design: everything is a generator so we never load 500k+ records into memory.
 The caller asks for a specific GRUP label and iterates over its records.
 """
 
+import struct
+import sys
 import zlib
+from collections.abc import Iterable, Iterator
 
 from fnv_planner.models.records import (
-    GroupHeader,
     Record,
     RecordHeader,
     Subrecord,
 )
-from fnv_planner.parser.binary_reader import BinaryReader
 
 
 # Sizes in bytes
 _RECORD_HEADER_SIZE = 24
 _GROUP_HEADER_SIZE = 24
+_SUBRECORD_HEADER = struct.Struct("<4sH")
+_SUBRECORD_HEADER_SIZE = _SUBRECORD_HEADER.size
 
+# Whole-header layouts, decoded with a single unpack_from each:
+#   record: sig, data_size, flags, form_id, revision, version, unknown(2)
+#   group: "GRUP", size, label, group_type, stamp, unknown(4)
+_RECORD_HEADER = struct.Struct("<4sIIIIH2x")
+_GROUP_HEADER = struct.Struct("<4sI4sII4x")
+_TES4_PREFIX = struct.Struct("<4sI")
+_U32 = struct.Struct("<I")
 
-def _read_record_header(reader: BinaryReader) -> RecordHeader:
-    return RecordHeader(
-        type=reader.signature(),
-        data_size=reader.uint32(),
-        flags=reader.uint32(),
-        form_id=reader.uint32(),
-        revision=reader.uint32(),
-        version=reader.uint16(),
-    )
+# Raw 4-byte signature -> interned str. A plugin holds millions of
+# signatures but only a few hundred distinct ones.
+_SIG_CACHE: dict[bytes, str] = {}
 
 
-def _read_group_header(reader: BinaryReader) -> GroupHeader:
-    """Read a GRUP header. Assumes the 'GRUP' signature has already been verified."""
-    return GroupHeader(
-        size=reader.uint32(),
-        label=reader.signature(),
-        group_type=reader.uint32(),
-        stamp=reader.uint32(),
-    )
+def _sig(raw: bytes) -> str:
+    """Decode a 4-byte signature, reusing a cached interned string."""
+    sig = _SIG_CACHE.get(raw)
+    if sig is None:
+        sig = sys.intern(raw.decode("ascii"))
+        _SIG_CACHE[bytes(raw)] = sig
+    return sig
 
 
-def _parse_subrecords(reader: BinaryReader) -> list[Subrecord]:
-    """Parse all subrecords from a bounded reader covering one record's data."""
+def _check_bounds(what: str, size: int, off: int, end: int) -> None:
+    if off + size > end:
+        raise ValueError(f"{what} of {size} bytes at offset {off} would exceed boundary at {end}")
+
+
+def _parse_subrecords(buf: bytes, start: int, end: int) -> list[Subrecord]:
+    """Parse all subrecords in ``buf[start:end]`` (one record's data area).
+
+    Walks the raw buffer with precompiled struct offsets; no reader object
+    is involved.
+    """
+    off = start
+    unpack = _SUBRECORD_HEADER.unpack_from
+    # bytes and mmap slice to bytes; a memoryview buffer needs an explicit copy.
+    copy_slices = isinstance(buf, memoryview)
     subrecords: list[Subrecord] = []
-    while reader.remaining > 0:
-        sig = reader.signature()
-        size = reader.uint16()
-        data = reader.bytes(size)
-        subrecords.append(Subrecord(type=sig, data=data))
+    append = subrecords.append
+    while off < end:
+        _check_bounds("Subrecord header", _SUBRECORD_HEADER_SIZE, off, end)
+        sig, size = unpack(buf, off)
+        off += _SUBRECORD_HEADER_SIZE
+        _check_bounds("Subrecord", size, off, end)
+        data = buf[off : off + size]
+        append(Subrecord(_sig(sig), bytes(data) if copy_slices else data))
+        off += size
     return subrecords
 
 
-def _read_record(reader: BinaryReader) -> Record:
-    """Read a single record (header + subrecords) at the current position."""
-    header = _read_record_header(reader)
-    # The version field read consumed 2 bytes, but the header is 24 bytes total.
-    # We read: sig(4) + data_size(4) + flags(4) + form_id(4) + revision(4) + version(2) = 22
-    # Skip the remaining 2 bytes (unknown field).
-    reader.skip(2)
-
-    data_reader = reader.slice(header.data_size)
+def _read_record_at(buf: bytes, off: int, end: int) -> tuple[Record, int]:
+    """Read the record whose header starts at *off*; return it and the next offset."""
+    _check_bounds("Record header", _RECORD_HEADER_SIZE, off, end)
+    sig, data_size, flags, form_id, revision, version = _RECORD_HEADER.unpack_from(buf, off)
+    header = RecordHeader(_sig(sig), data_size, flags, form_id, revision, version)
+    data_start = off + _RECORD_HEADER_SIZE
+    _check_bounds("Record data", data_size, data_start, end)
+    data_end = data_start + data_size
 
     if header.is_compressed:
         # First 4 bytes of data = decompressed size, rest is zlib-compressed
-        decompressed_size = data_reader.uint32()
-        compressed = data_reader.bytes(data_reader.remaining)
+        # (known exactly, so the output buffer is allocated once). The input
+        # is handed to zlib as a view so the payload is never copied.
+        _check_bounds("Record data", 4, data_start, data_end)
+        (decompressed_size,) = _U32.unpack_from(buf, data_start)
+        compressed = memoryview(buf)[data_start + 4 : data_end]
         raw = zlib.decompress(compressed, bufsize=decompressed_size)
-        data_reader = BinaryReader(raw)
-
-    subrecords = _parse_subrecords(data_reader)
-    return Record(header=header, subrecords=subrecords)
-
-
-def _read_record_after_sig(reader: BinaryReader, sig: str) -> Record:
-    """Read a single record when the 4-byte signature is already consumed."""
-    data_size = reader.uint32()
-    flags = reader.uint32()
-    form_id = reader.uint32()
-    revision = reader.uint32()
-    version = reader.uint16()
-    reader.skip(2)
-    header = RecordHeader(
-        type=sig,
-        data_size=data_size,
-        flags=flags,
-        form_id=form_id,
-        revision=revision,
-        version=version,
-    )
-
-    data_reader = reader.slice(data_size)
-    if header.is_compressed:
-        decompressed_size = data_reader.uint32()
-        compressed = data_reader.bytes(data_reader.remaining)
-        raw = zlib.decompress(compressed, bufsize=decompressed_size)
-        data_reader = BinaryReader(raw)
+        subrecords = _parse_subrecords(raw, 0, len(raw))
+    else:
+        subrecords = _parse_subrecords(buf, data_start, data_end)
+    return Record(header=header, subrecords=subrecords), data_end
+
+
+def _iter_records_between(buf: bytes, start: int, end: int) -> "Generator[Record]":
+    """Yield consecutive records filling ``buf[start:end]`` (a GRUP data area)."""
+    off = start
+    while off < end:
+        record, off = _read_record_at(buf, off, end)
+        yield record
 
-    subrecords = _parse_subrecords(data_reader)
-    return Record(header=header, subrecords=subrecords)
+
+def _first_grup_offset(data: bytes) -> int:
+    """Verify the leading TES4 record and return the offset just past it.
+
+    Only the signature and data_size are decoded; callers start their
+    reader directly at the first top-level GRUP.
+    """
+    if len(data) < _RECORD_HEADER_SIZE:
+        raise ValueError(f"Plugin data too short for a TES4 header ({len(data)} bytes)")
+    sig, data_size = _TES4_PREFIX.unpack_from(data, 0)
+    if sig != b"TES4":
+        raise ValueError(f"Expected TES4 header, got {sig.decode('ascii', 'replace')!r}")
+    offset = _RECORD_HEADER_SIZE + data_size
+    if offset > len(data):
+        raise ValueError(
+            f"TES4 data of {data_size} bytes would exceed boundary at {len(data)}"
+        )
+    return offset
+
+
+def _iter_top_level_grups(data: bytes) -> Iterator[tuple[str, int, int]]:
+    """Yield ``(label, data_start, data_end)`` for each top-level GRUP.
+
+    Hops from header to header with raw unpacks; no reader or GroupHeader is
+    built for GRUPs the caller skips.
+    """
+    off = _first_grup_offset(data)
+    end = len(data)
+    unpack = _GROUP_HEADER.unpack_from
+    while off < end:
+        if off + _GROUP_HEADER_SIZE > end:
+            raise ValueError(f"GRUP header at offset {off} would exceed boundary at {end}")
+        sig, size, label, _group_type, _stamp = unpack(data, off)
+        if sig != b"GRUP":
+            raise ValueError(f"Expected GRUP, got {sig.decode('ascii', 'replace')!r} at offset {off}")
+        if size < _GROUP_HEADER_SIZE or off + size > end:
+            raise ValueError(
+                f"GRUP of {size} bytes at offset {off} would exceed boundary at {end}"
+            )
+        yield _sig(label), off + _GROUP_HEADER_SIZE, off + size
+        off += size
 
 
 def read_grup(
@@ -139,45 +183,60 @@ def iter_grup(
     If *all_groups* is True, yields records from every matching top-level
     GRUP label encountered.
     """
-    reader = BinaryReader(data)
+    found = False
+    for group_label, start, stop in _iter_top_level_grups(data):
+        if group_label != label:
+            continue
+        found = True
+        yield from _iter_records_between(data, start, stop)
+        if not all_groups:
+            return
 
-    # Skip TES4 header: read its data_size, then jump past it
-    tes4_sig = reader.signature()
-    if tes4_sig != "TES4":
-        raise ValueError(f"Expected TES4 header, got {tes4_sig!r}")
-    tes4_data_size = reader.uint32()
-    # Skip rest of TES4 header (flags + form_id + revision + version + unknown = 16 bytes)
-    # plus the record data
-    reader.skip(16 + tes4_data_size)
+    if not found:
+        raise ValueError(f"GRUP {label!r} not found in plugin")
 
-    found = False
 
-    # Scan top-level GRUPs
-    while reader.remaining > 0:
-        sig = reader.signature()
-        if sig != "GRUP":
-            raise ValueError(f"Expected GRUP, got {sig!r} at offset {reader.position - 4}")
-
-        group = _read_group_header(reader)
-        # Skip the last 4 bytes of the GRUP header (unknown/version field)
-        reader.skip(4)
-
-        if group.label == label:
-            found = True
-            # Yield records from this GRUP
-            # Data area = group.size - 24 bytes (header size)
-            grup_data = reader.slice(group.size - _GROUP_HEADER_SIZE)
-            while grup_data.remaining > 0:
-                yield _read_record(grup_data)
-            if not all_groups:
-                return
+def iter_grups_multi(
+    data: bytes,
+    labels: Iterable[str],
+    *,
+    all_groups: bool = False,
+) -> "Generator[tuple[str, Record]]":
+    """Yield ``(label, record)`` for every wanted top-level GRUP in one pass.
+
+    Equivalent to calling iter_grup once per label, but the TES4 header and
+    the top-level GRUP chain are walked only once. Labels missing from the
+    plugin are not an error. Without *all_groups*, only the first GRUP of each
+    label is read and the scan stops once every label has been seen.
+    """
+    wanted = set(labels)
+    if not wanted:
+        return
+    for group_label, start, stop in _iter_top_level_grups(data):
+        if group_label not in wanted:
             continue
+        for record in _iter_records_between(data, start, stop):
+            yield group_label, record
+        if not all_groups:
+            wanted.discard(group_label)
+            if not wanted:
+                return
 
-        # Skip this GRUP entirely (size includes the 24-byte header we already read)
-        reader.skip(group.size - _GROUP_HEADER_SIZE)
 
-    if not found:
-        raise ValueError(f"GRUP {label!r} not found in plugin")
+def read_grups(
+    data: bytes,
+    labels: Iterable[str],
+    *,
+    all_groups: bool = False,
+) -> dict[str, list[Record]]:
+    """Collect records for several top-level GRUP labels in a single scan.
+
+    Every requested label is present in the result; missing GRUPs map to [].
+    """
+    out: dict[str, list[Record]] = {label: [] for label in labels}
+    for label, record in iter_grups_multi(data, out, all_groups=all_groups):
+        out[label].append(record)
+    return out
 
 
 def _iter_records_matching(data: bytes, wanted_types: set[str]) -> "Generator[Record]":
@@ -186,36 +245,36 @@ def _iter_records_matching(data: bytes, wanted_types: set[str]) -> "Generator[Re
     if any(len(record_type) != 4 for record_type in wanted_types):
         raise ValueError("record_type signatures must be 4 characters")
 
-    reader = BinaryReader(data)
-    tes4_sig = reader.signature()
-    if tes4_sig != "TES4":
-        raise ValueError(f"Expected TES4 header, got {tes4_sig!r}")
-    tes4_data_size = reader.uint32()
-    reader.skip(16 + tes4_data_size)
-
-    def _iter_scope(scope: BinaryReader) -> "Generator[Record]":
-        while scope.remaining > 0:
-            sig = scope.signature()
-            if sig == "GRUP":
-                group_size = scope.uint32()
-                scope.skip(4)   # label (raw; not always ASCII for nested groups)
-                scope.skip(4)   # group_type
-                scope.skip(4)   # stamp
-                scope.skip(4)   # unknown/version
-                sub_scope = scope.slice(group_size - _GROUP_HEADER_SIZE)
-                yield from _iter_scope(sub_scope)
+    wanted_raw = {record_type.encode("ascii") for record_type in wanted_types}
+    unpack_u32 = _U32.unpack_from
+
+    def _iter_scope(off: int, end: int) -> "Generator[Record]":
+        while off < end:
+            _check_bounds("Record header", _RECORD_HEADER_SIZE, off, end)
+            sig = bytes(data[off : off + 4])
+            # GRUP and record headers both carry a u32 size right after the
+            # signature: the whole group for GRUPs, the data area for records.
+            (size,) = unpack_u32(data, off + 4)
+            if sig == b"GRUP":
+                # label (raw; not always ASCII for nested groups), group_type,
+                # stamp and unknown/version are not needed here.
+                if size < _GROUP_HEADER_SIZE:
+                    raise ValueError(f"GRUP of {size} bytes at offset {off} is smaller than its header")
+                _check_bounds("GRUP", size, off, end)
+                yield from _iter_scope(off + _GROUP_HEADER_SIZE, off + size)
+                off += size
                 continue
 
-            if sig in wanted_types:
-                yield _read_record_after_sig(scope, sig)
+            if sig in wanted_raw:
+                record, off = _read_record_at(data, off, end)
+                yield record
                 continue
 
             # Fast-skip non-matching records.
-            data_size = scope.uint32()
-            scope.skip(16)  # flags + form_id + revision + version+unknown(2)
-            scope.skip(data_size)
+            _check_bounds("Record data", size, off + _RECORD_HEADER_SIZE, end)
+            off += _RECORD_HEADER_SIZE + size
 
-    yield from _iter_scope(reader)
+    yield from _iter_scope(_first_grup_offset(data), len(data))
 
 
 def iter_records_of_type(data: bytes, record_type: str) -> "Generator[Record]":
@@ -3,50 +3,94 @@
 from __future__ import annotations
 
 import struct
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from operator import itemgetter
 
-from fnv_planner.models.effect import MagicEffect
 from fnv_planner.models.spell import Spell
 from fnv_planner.models.spell import SpellEffect
 from fnv_planner.parser.effect_parser import parse_all_mgefs
 from fnv_planner.models.records import Record
+from fnv_planner.parser.binary_reader import decode_zstring
 from fnv_planner.parser.plugin_merge import parse_records_merged
-from fnv_planner.parser.record_reader import read_grup
+from fnv_planner.parser.record_reader import iter_grup, read_grup
 
 
-def parse_spell(record: Record) -> Spell:
-    editor_id = ""
-    name = ""
-    effects: list[SpellEffect] = []
+# Lightweight SPEL row for the linked-spell helpers, which never need the
+# Spell dataclass: (form_id, name, has_conditions, [(mgef_form_id, magnitude, actor_value)]).
+SpellRow = tuple[int, str, bool, list[tuple[int, float, int]]]
+
+
+@dataclass(slots=True)
+class _SpellParseState:
+    editor_id: str = ""
+    name: str = ""
+    effects: list[tuple[int, float, int]] = field(default_factory=list)
     pending_mgef_id: int | None = None
-    has_conditions = False
+    has_conditions: bool = False
+
+
+def _on_edid(data: bytes, state: _SpellParseState) -> None:
+    state.editor_id = decode_zstring(data)
+
+
+def _on_full(data: bytes, state: _SpellParseState) -> None:
+    state.name = decode_zstring(data)
+
+
+def _on_ctda(data: bytes, state: _SpellParseState) -> None:
+    # Keep condition semantics conservative for planning:
+    # any CTDA means effect is situational, not guaranteed baseline.
+    state.has_conditions = True
+
+
+def _on_efid(data: bytes, state: _SpellParseState) -> None:
+    if len(data) >= 4:
+        state.pending_mgef_id = struct.unpack_from("<I", data, 0)[0]
+
+
+def _on_efit(data: bytes, state: _SpellParseState) -> None:
+    if state.pending_mgef_id is None or len(data) < 20:
+        return
+    magnitude = float(struct.unpack_from("<I", data, 0)[0])
+    actor_value = struct.unpack_from("<i", data, 16)[0]
+    state.effects.append((int(state.pending_mgef_id), magnitude, int(actor_value)))
+    state.pending_mgef_id = None
+
+
+# One dict lookup per subrecord instead of an elif chain; subrecord types
+# without a handler (OBND, SPIT, ...) fall straight through.
+_SUBRECORD_HANDLERS: dict[str, Callable[[bytes, _SpellParseState], None]] = {
+    "EDID": _on_edid,
+    "FULL": _on_full,
+    "CTDA": _on_ctda,
+    "EFID": _on_efid,
+    "EFIT": _on_efit,
+}
+
+
+def _scan_spell(record: Record) -> _SpellParseState:
+    state = _SpellParseState()
+    handlers = _SUBRECORD_HANDLERS
     for sub in record.subrecords:
-        if sub.type == "EDID":
-            editor_id = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
-        elif sub.type == "FULL":
-            name = sub.data.rstrip(b"\x00").decode("utf-8", errors="replace")
-        elif sub.type == "CTDA":
-            # Keep condition semantics conservative for planning:
-            # any CTDA means effect is situational, not guaranteed baseline.
-            has_conditions = True
-        elif sub.type == "EFID" and len(sub.data) >= 4:
-            pending_mgef_id = struct.unpack_from("<I", sub.data, 0)[0]
-        elif sub.type == "EFIT" and pending_mgef_id is not None and len(sub.data) >= 20:
-            magnitude = float(struct.unpack_from("<I", sub.data, 0)[0])
-            actor_value = struct.unpack_from("<i", sub.data, 16)[0]
-            effects.append(
-                SpellEffect(
-                    mgef_form_id=int(pending_mgef_id),
-                    magnitude=magnitude,
-                    actor_value=int(actor_value),
-                )
-            )
-            pending_mgef_id = None
+        handler = handlers.get(sub.type)
+        if handler is not None:
+            handler(sub.data, state)
+    return state
+
+
+def parse_spell(record: Record) -> Spell:
+    state = _scan_spell(record)
     return Spell(
         form_id=record.header.form_id,
-        editor_id=editor_id,
-        name=name or editor_id,
-        effects=effects,
-        has_conditions=has_conditions,
+        editor_id=state.editor_id,
+        name=state.name or state.editor_id,
+        effects=[
+            SpellEffect(mgef_form_id=mgef_id, magnitude=magnitude, actor_value=av)
+            for mgef_id, magnitude, av in state.effects
+        ],
+        has_conditions=state.has_conditions,
     )
 
 
@@ -55,16 +99,45 @@ def parse_all_spells(data: bytes) -> list[Spell]:
     return [parse_spell(r) for r in records]
 
 
+def iter_spells(data: bytes) -> Iterator[SpellRow]:
+    """Stream SPEL records as SpellRow tuples without building Spell objects."""
+    for record in iter_grup(data, "SPEL", all_groups=True):
+        state = _scan_spell(record)
+        yield (
+            record.header.form_id,
+            state.name or state.editor_id,
+            state.has_conditions,
+            state.effects,
+        )
+
+
+def parse_all_spell_rows(data: bytes) -> list[SpellRow]:
+    return list(iter_spells(data))
+
+
+def merged_spell_rows(plugin_datas: list[bytes]) -> list[SpellRow]:
+    """SPEL rows across the load order (last plugin wins), for the linked-spell helpers."""
+    return parse_records_merged(
+        plugin_datas,
+        parse_all_spell_rows,
+        key_fn=itemgetter(0),
+        missing_group_ok=True,
+    )
+
+
 def linked_spell_names_by_form(
     plugin_datas: list[bytes],
     *,
     include_conditional: bool = False,
+    spell_rows: list[SpellRow] | None = None,
 ) -> dict[int, str]:
-    spells = parse_records_merged(plugin_datas, parse_all_spells, missing_group_ok=True)
+    """Map SPEL form ids to display names; pass *spell_rows* to skip re-parsing."""
+    if spell_rows is None:
+        spell_rows = merged_spell_rows(plugin_datas)
     return {
-        int(s.form_id): s.name
-        for s in spells
-        if s.name and (include_conditional or not s.has_conditions)
+        form_id: name
+        for form_id, name, has_conditions, _effects in spell_rows
+        if name and (include_conditional or not has_conditions)
     }
 
 
@@ -72,25 +145,29 @@ def linked_spell_stat_bonuses_by_form(
     plugin_datas: list[bytes],
     *,
     include_conditional: bool = False,
+    spell_rows: list[SpellRow] | None = None,
 ) -> dict[int, dict[int, float]]:
-    """Resolve SPEL EFID/EFIT entries into actor-value bonus maps."""
-    spells = parse_records_merged(plugin_datas, parse_all_spells, missing_group_ok=True)
-    mgefs: dict[int, MagicEffect] = {
-        int(m.form_id): m for m in parse_records_merged(plugin_datas, parse_all_mgefs, missing_group_ok=True)
+    """Resolve SPEL EFID/EFIT entries into actor-value bonus maps.
+
+    Pass *spell_rows* (from merged_spell_rows) to reuse an existing SPEL parse.
+    """
+    spells = merged_spell_rows(plugin_datas) if spell_rows is None else spell_rows
+    # Only value-modifier MGEFs with a real actor value contribute, so reduce
+    # them up front to a flat mgef_form_id -> actor_value lookup.
+    av_by_mgef: dict[int, int] = {
+        int(m.form_id): int(m.actor_value)
+        for m in parse_records_merged(plugin_datas, parse_all_mgefs, missing_group_ok=True)
+        if m.is_value_modifier and int(m.actor_value) >= 0
     }
     out: dict[int, dict[int, float]] = {}
-    for spell in spells:
-        if spell.has_conditions and not include_conditional:
+    for form_id, _name, has_conditions, effects in spells:
+        if has_conditions and not include_conditional:
             continue
-        bonuses: dict[int, float] = {}
-        for eff in spell.effects:
-            mgef = mgefs.get(int(eff.mgef_form_id))
-            if mgef is None or not mgef.is_value_modifier:
-                continue
-            av = int(mgef.actor_value)
-            if av < 0:
-                continue
-            bonuses[av] = bonuses.get(av, 0.0) + float(eff.magnitude)
+        bonuses: defaultdict[int, float] = defaultdict(float)
+        for mgef_form_id, magnitude, _effect_av in effects:
+            av = av_by_mgef.get(mgef_form_id)
+            if av is not None:
+                bonuses[av] += magnitude
         if bonuses:
-            out[int(spell.form_id)] = bonuses
+            out[form_id] = dict(bonuses)
     return out
@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+import hashlib
+import mmap
+import multiprocessing
 import os
 from pathlib import Path
+import pickle
 import re
+from typing import Any
 
 from fnv_planner.engine.build_engine import BuildEngine
 from fnv_planner.engine.ui_model import BuildUiModel
@@ -15,27 +23,29 @@ from fnv_planner.models.avif import ActorValueInfo
 from fnv_planner.models.game_settings import GameSettings
 from fnv_planner.models.item import Armor, Weapon
 from fnv_planner.models.perk import Perk
-from fnv_planner.parser.avif_parser import parse_all_avifs
+from fnv_planner.models.records import Record
+from fnv_planner.parser.avif_parser import parse_avif
 from fnv_planner.parser.book_stats import (
     placed_skill_book_copies_by_actor_value,
     skill_books_by_actor_value,
 )
 from fnv_planner.parser.effect_resolver import EffectResolver
-from fnv_planner.parser.item_parser import parse_all_armors, parse_all_books, parse_all_weapons
+from fnv_planner.parser.item_parser import parse_armor, parse_book, parse_weapon
 from fnv_planner.parser.perk_classification import detect_challenge_perk_ids
-from fnv_planner.parser.perk_parser import parse_all_perks
+from fnv_planner.parser.perk_parser import parse_perk
 from fnv_planner.parser.plugin_merge import (
     banner_title_for_game,
     detect_game_variant,
     effective_vanilla_level_cap,
     has_non_base_level_cap_override,
-    load_plugin_bytes,
-    parse_records_merged,
+    mapped_plugins,
     resolve_plugins_for_cli,
 )
+from fnv_planner.parser.record_reader import read_grups
 from fnv_planner.parser.spell_parser import (
     linked_spell_names_by_form,
     linked_spell_stat_bonuses_by_form,
+    merged_spell_rows,
 )
 from fnv_planner.ui.state import PluginSourceState, UiState
 
@@ -128,8 +138,18 @@ def _init_default_build(engine: BuildEngine) -> None:
     engine.set_target_level(engine.max_level)
 
 
+# Deletes every ASCII character outside [a-z0-9]; applied after lower().
+_TOKEN_DROP_TABLE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit() and not chr(c).islower())
+)
+
+
+@lru_cache(maxsize=512)
 def _normalize_token(text: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "", text.lower())
+    token = text.lower().translate(_TOKEN_DROP_TABLE)
+    if not token.isascii():
+        token = "".join(ch for ch in token if ch.isascii())
+    return token
 
 
 def _avif_descriptions_by_actor_value(avifs: list[ActorValueInfo]) -> dict[int, str]:
@@ -155,11 +175,236 @@ def _avif_descriptions_by_actor_value(avifs: list[ActorValueInfo]) -> dict[int,
     return out
 
 
+# Record tables that are parsed independently per plugin and merged
+# "last plugin wins" by form_id: result key -> (GRUP label, record parser).
+_MERGED_TABLES: dict[str, tuple[str, Callable[[Record], Any]]] = {
+    "perks": ("PERK", parse_perk),
+    "armors": ("ARMO", parse_armor),
+    "weapons": ("WEAP", parse_weapon),
+    "books": ("BOOK", parse_book),
+    "avifs": ("AVIF", parse_avif),
+}
+_MERGED_LABELS = tuple(label for label, _parse_fn in _MERGED_TABLES.values())
+
+
+def _parse_plugin_tables(data: mmap.mmap | bytes) -> dict[str, list]:
+    """Parse every table in _MERGED_TABLES from one plugin in a single GRUP scan."""
+    by_label = read_grups(data, _MERGED_LABELS)
+    return {
+        table: [parse_fn(r) for r in by_label[label]]
+        for table, (label, parse_fn) in _MERGED_TABLES.items()
+    }
+
+
+def _parse_plugin_file(path: Path) -> dict[str, list]:
+    """Process-pool worker: parse every merged table from one plugin file."""
+    with mapped_plugins([path]) as (data,):
+        return _parse_plugin_tables(data)
+
+
+def _parse_merged_tables(
+    paths: list[Path],
+    plugin_datas: list[mmap.mmap | bytes],
+    *,
+    max_workers: int | None = None,
+) -> dict[str, list]:
+    """Parse every table in _MERGED_TABLES, fanning out across processes.
+
+    Each plugin is an independent CPU-bound task. Workers map the plugin from
+    disk rather than receiving the (large) bytes by pickle. The pool uses the
+    "spawn" start method because bootstrap runs on a background thread of the
+    web server, where fork() can deadlock the child. A single plugin is parsed
+    in-process, since spawning a worker costs a fresh interpreter; the same
+    path is the fallback when a pool cannot be started.
+    """
+    workers = min(len(paths), max_workers or os.cpu_count() or 1)
+    results: list[dict[str, list]] | None = None
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                futures = [pool.submit(_parse_plugin_file, path) for path in paths]
+                results = [future.result() for future in futures]
+        # RuntimeError covers BrokenProcessPool and spawn refusing a __main__
+        # that is not import-safe (frozen apps, embedded interpreters).
+        except (OSError, NotImplementedError, RuntimeError):
+            results = None
+    if results is None:
+        results = [_parse_plugin_tables(data) for data in plugin_datas]
+
+    out: dict[str, list] = {}
+    for table in _MERGED_TABLES:
+        merged: dict[int, Any] = {}
+        for per_plugin in results:
+            for row in per_plugin[table]:
+                merged[row.form_id] = row
+        out[table] = list(merged.values())
+    return out
+
+
+@dataclass(slots=True)
+class _PluginData:
+    """Everything bootstrap derives from the plugin stack (the cacheable part)."""
+
+    gmst: GameSettings
+    perk_list: list[Perk]
+    challenge_perk_ids: set[int]
+    armors: dict[int, Armor]
+    weapons: dict[int, Weapon]
+    skill_books_by_av: dict[int, int]
+    linked_spells: dict[int, str]
+    linked_spell_bonuses: dict[int, dict[int, float]]
+    av_descriptions_by_av: dict[int, str]
+
+    @classmethod
+    def empty(cls) -> "_PluginData":
+        return cls(GameSettings.defaults(), [], set(), {}, {}, {}, {}, {}, {})
+
+
+def _parse_plugin_data(paths: list[Path], plugin_datas: list[mmap.mmap | bytes]) -> _PluginData:
+    gmst = GameSettings.from_plugins(plugin_datas)
+    if not gmst._values:
+        gmst = GameSettings.defaults()
+    else:
+        has_override = has_non_base_level_cap_override(paths, plugin_datas)
+        gmst._values["iMaxCharacterLevel"] = effective_vanilla_level_cap(
+            paths,
+            gmst.get_int("iMaxCharacterLevel", 50),
+            has_non_base_cap_override=has_override,
+        )
+    tables = _parse_merged_tables(paths, plugin_datas)
+    perk_list = tables["perks"]
+    challenge_perk_ids = detect_challenge_perk_ids(plugin_datas, perk_list)
+
+    resolver = EffectResolver.from_plugins(plugin_datas)
+    # Filter and index in one pass, then resolve enchantments only for
+    # the playable items the session actually keeps.
+    armors = {a.form_id: a for a in tables["armors"] if a.is_playable}
+    weapons = {w.form_id: w for w in tables["weapons"] if w.is_playable}
+    for armor in armors.values():
+        resolver.resolve_armor(armor)
+    for weapon in weapons.values():
+        resolver.resolve_weapon(weapon)
+    books = tables["books"]
+    skill_books_by_av = placed_skill_book_copies_by_actor_value(plugin_datas, books)
+    if not skill_books_by_av:
+        skill_books_by_av = skill_books_by_actor_value(books)
+    spell_rows = merged_spell_rows(plugin_datas)
+    return _PluginData(
+        gmst=gmst,
+        perk_list=perk_list,
+        challenge_perk_ids=challenge_perk_ids,
+        armors=armors,
+        weapons=weapons,
+        skill_books_by_av=skill_books_by_av,
+        linked_spells=linked_spell_names_by_form(plugin_datas, spell_rows=spell_rows),
+        linked_spell_bonuses=linked_spell_stat_bonuses_by_form(plugin_datas, spell_rows=spell_rows),
+        av_descriptions_by_av=_avif_descriptions_by_actor_value(tables["avifs"]),
+    )
+
+
+# Packages whose code shapes the pickled _PluginData; any edit to them (or to
+# this module) changes the cache key, so parser changes never hit stale entries.
+_PLUGIN_CACHE_SOURCE_PACKAGES = ("parser", "models")
+# Cache entries are named by _plugin_cache_key; pruning never touches other files.
+_PLUGIN_CACHE_ENTRY_RE = re.compile(r"[0-9a-f]{32}\.pkl")
+
+
+def _plugin_cache_dir() -> Path | None:
+    """Resolve the parse-cache directory; None when caching is disabled.
+
+    Defaults to $XDG_CACHE_HOME (or %LOCALAPPDATA%, or ~/.cache) /fnv_planner.
+    FNV_PLANNER_CACHE_DIR overrides the location; FNV_PLANNER_NO_CACHE turns
+    the cache off.
+    """
+    if os.environ.get("FNV_PLANNER_NO_CACHE"):
+        return None
+    override = os.environ.get("FNV_PLANNER_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA")
+    root = Path(base).expanduser() if base else Path.home() / ".cache"
+    return root / "fnv_planner"
+
+
+@lru_cache(maxsize=1)
+def _plugin_cache_source_digest() -> str:
+    """Digest of the parser/model sources and this module; unreadable files are skipped."""
+    package_root = Path(__file__).resolve().parents[1]
+    sources = [Path(__file__).resolve()]
+    for package in _PLUGIN_CACHE_SOURCE_PACKAGES:
+        sources.extend((package_root / package).glob("*.py"))
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(sources):
+        try:
+            data = path.read_bytes()
+        except OSError:
+            continue
+        digest.update(f"|{path.relative_to(package_root).as_posix()}:".encode())
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def _plugin_cache_key(paths: list[Path]) -> str:
+    """Digest of the parser sources, the load order and each plugin's size and mtime."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_plugin_cache_source_digest().encode())
+    for path in paths:
+        st = path.stat()
+        digest.update(f"|{path.resolve()}:{st.st_size}:{st.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def _prune_plugin_cache(cache_dir: Path, keep: Path) -> None:
+    """Delete every cache entry except *keep*, so only one load order is cached."""
+    for entry in cache_dir.glob("*.pkl"):
+        if entry == keep or not _PLUGIN_CACHE_ENTRY_RE.fullmatch(entry.name):
+            continue
+        try:
+            entry.unlink()
+        except OSError:
+            pass
+
+
+def _load_plugin_data(paths: list[Path]) -> _PluginData:
+    """Parse the plugin stack, reusing a pickled result when nothing changed.
+
+    Cache entries are keyed on (path, size, mtime) of every plugin plus a digest
+    of the parser sources, so editing or reordering plugins, or changing the
+    parsers, re-parses. Only the most recent entry is kept. Unreadable or
+    corrupt entries are treated as a miss; write failures are ignored.
+    """
+    cache_dir = _plugin_cache_dir()
+    cache_file = cache_dir / f"{_plugin_cache_key(paths)}.pkl" if cache_dir else None
+    if cache_file is not None and cache_file.is_file():
+        try:
+            cached = pickle.loads(cache_file.read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError, ImportError):
+            cached = None
+        if isinstance(cached, _PluginData):
+            return cached
+
+    with mapped_plugins(paths) as plugin_datas:
+        data = _parse_plugin_data(paths, plugin_datas)
+    if cache_dir is not None and cache_file is not None:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass
+        else:
+            _prune_plugin_cache(cache_dir, cache_file)
+    return data
+
+
 def bootstrap_default_session(
     explicit_plugin_paths: list[Path] | None = None,
 ) -> tuple[BuildSession, UiState]:
     """Build a UI session using default vanilla plugin resolution."""
-    plugin_datas: list[bytes] = []
     source = PluginSourceState(mode="defaults")
     game_variant = "fallout-nv"
 
@@ -183,52 +428,16 @@ def bootstrap_default_session(
                     continue
 
     if paths:
-        plugin_datas = load_plugin_bytes(paths)
         if source.mode == "defaults":
             source = PluginSourceState(mode="default-vanilla-order", primary_esm=paths[0])
         game_variant = detect_game_variant(paths, plugin_dir=paths[0].parent)
-
-    if not plugin_datas:
-        gmst = GameSettings.defaults()
-        perk_list: list[Perk] = []
-        challenge_perk_ids: set[int] = set()
-        armors: dict[int, Armor] = {}
-        weapons: dict[int, Weapon] = {}
-        skill_books_by_av: dict[int, int] = {}
-        linked_spells: dict[int, str] = {}
-        linked_spell_bonuses: dict[int, dict[int, float]] = {}
-        av_descriptions_by_av: dict[int, str] = {}
+        data = _load_plugin_data(paths)
     else:
-        gmst = GameSettings.from_plugins(plugin_datas)
-        if not gmst._values:
-            gmst = GameSettings.defaults()
-        else:
-            has_override = has_non_base_level_cap_override(paths, plugin_datas)
-            gmst._values["iMaxCharacterLevel"] = effective_vanilla_level_cap(
-                paths,
-                gmst.get_int("iMaxCharacterLevel", 50),
-                has_non_base_cap_override=has_override,
-            )
-        perk_list = parse_records_merged(plugin_datas, parse_all_perks, missing_group_ok=True)
-        challenge_perk_ids = detect_challenge_perk_ids(plugin_datas, perk_list)
-
-        resolver = EffectResolver.from_plugins(plugin_datas)
-        armor_list = parse_records_merged(plugin_datas, parse_all_armors, missing_group_ok=True)
-        weapon_list = parse_records_merged(plugin_datas, parse_all_weapons, missing_group_ok=True)
-        for armor in armor_list:
-            resolver.resolve_armor(armor)
-        for weapon in weapon_list:
-            resolver.resolve_weapon(weapon)
-        armors = {a.form_id: a for a in armor_list if a.is_playable}
-        weapons = {w.form_id: w for w in weapon_list if w.is_playable}
-        books = parse_records_merged(plugin_datas, parse_all_books, missing_group_ok=True)
-        skill_books_by_av = placed_skill_book_copies_by_actor_value(plugin_datas, books)
-        if not skill_books_by_av:
-            skill_books_by_av = skill_books_by_actor_value(books)
-        linked_spells = linked_spell_names_by_form(plugin_datas)
-        linked_spell_bonuses = linked_spell_stat_bonuses_by_form(plugin_datas)
-        avifs = parse_records_merged(plugin_datas, parse_all_avifs, missing_group_ok=True)
-        av_descriptions_by_av = _avif_descriptions_by_actor_value(avifs)
+        data = _PluginData.empty()
+    gmst = data.gmst
+    perk_list = data.perk_list
+    armors = data.armors
+    weapons = data.weapons
 
     graph = DependencyGraph.build(perk_list)
     engine = BuildEngine.new_build(gmst, graph)
@@ -248,11 +457,11 @@ def bootstrap_default_session(
         engine,
         ui_model,
         perks,
-        challenge_perk_ids,
-        skill_books_by_av,
-        linked_spells,
-        linked_spell_bonuses,
-        av_descriptions_by_av,
+        data.challenge_perk_ids,
+        data.skill_books_by_av,
+        data.linked_spells,
+        data.linked_spell_bonuses,
+        data.av_descriptions_by_av,
         armors,
         weapons,
     ), state
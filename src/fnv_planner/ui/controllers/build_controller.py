@@ -1,11 +1,18 @@
 """Controller for build-page mutations."""
 
 import re
-from dataclasses import dataclass, field
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import astuple, dataclass, field
+from heapq import merge
+from itertools import chain
 from pathlib import Path
+from types import MappingProxyType
 from typing import Callable
 
-from fnv_planner.engine.build_engine import BuildEngine
+from fnv_planner.engine.build_engine import BuildEngine, BuildState
 from fnv_planner.engine.ui_model import BuildUiModel, UiDiagnostic
 from fnv_planner.models.constants import (
     ACTOR_VALUE_NAMES,
@@ -20,8 +27,51 @@ from fnv_planner.optimizer.planner import plan_build
 from fnv_planner.optimizer.planner import _infer_perk_skill_effects
 from fnv_planner.optimizer.specs import GoalSpec, RequirementSpec, StartingConditions
 from fnv_planner.parser.perk_classification import classify_perk
+from fnv_planner.ui.controllers.level_maps import as_int_nested
 from fnv_planner.ui.state import UiState
 
+# Actor values a priority request may target, with display names, in AV order.
+_REQUESTABLE_AVS = SPECIAL_INDICES | SKILL_INDICES
+_ACTOR_VALUE_OPTIONS = tuple(
+    (av, ACTOR_VALUE_NAMES.get(av, f"AV{av}")) for av in sorted(_REQUESTABLE_AVS)
+)
+_SPECIAL_NAMES = tuple(
+    (av, ACTOR_VALUE_NAMES.get(av, f"AV{av}")) for av in sorted(SPECIAL_INDICES)
+)
+_SORTED_SKILL_AVS = tuple(sorted(SKILL_GOVERNING_ATTRIBUTE))
+_TAGGED_SKILL_OPTIONS = tuple(
+    (int(av), ACTOR_VALUE_NAMES.get(int(av), f"AV{av}")) for av in _SORTED_SKILL_AVS
+)
+
+# Checked in this order when an implant text names more than one attribute.
+_IMPLANT_SPECIAL_TARGETS = (
+    ("strength", 5),
+    ("perception", 6),
+    ("endurance", 7),
+    ("charisma", 8),
+    ("intelligence", 9),
+    ("agility", 10),
+    ("luck", 11),
+)
+_IMPLANT_SPECIAL_RE = re.compile("|".join(token for token, _ in _IMPLANT_SPECIAL_TARGETS))
+
+# Marker the planner puts in perk reasons when skill books close a gap.
+_BOOKS_COVER_TAG = "Books cover +"
+
+# "av:value" pairs in max-skills unmet-requirement text; only the value is used.
+_GAP_RE = re.compile(r"\d+:(\d+)")
+
+# One stripped entry per non-blank preset line that doesn't start with '#'.
+_PRESET_LINE_RE = re.compile(r"^[^\S\n]*([^#\s][^\n]*?)[^\S\n]*$", re.MULTILINE)
+
+# Planner outcomes kept per controller; enough for undo-style toggling.
+_PLAN_CACHE_SIZE = 32
+_NO_BOOKS_CACHE_SIZE = 8
+
+def _frozen_by_level(by_level: dict[int, dict[int, int]]) -> Mapping[int, Mapping[int, int]]:
+    """Wrap a level -> actor value -> count map read-only at both levels."""
+    return MappingProxyType({level: MappingProxyType(row) for level, row in by_level.items()})
+
 
 @dataclass(slots=True)
 class PriorityRequest:
@@ -36,6 +86,90 @@ class PriorityRequest:
     reason: str = ""
 
 
+@dataclass(slots=True)
+class _PlanOutcome:
+    """Everything _recompute_plan derives from one planner run."""
+
+    state: BuildState
+    skill_books_used: dict[int, int]
+    skill_books_needed: int
+    skill_books_used_by_level: Mapping[int, Mapping[int, int]]
+    skill_book_points_by_level: Mapping[int, Mapping[int, int]]
+    perk_selection_reasons: dict[int, str]
+    book_dependency_warning: str | None
+    feasible: bool
+    feasibility_message: str
+
+
+@dataclass(slots=True, frozen=True)
+class _RequestSnapshot:
+    """Request-derived lookups shared by the selected-* row builders."""
+
+    direct_traits: frozenset[int]
+    direct_tagged_skills: frozenset[int]
+    direct_perks: frozenset[int]
+    has_max_skills: bool
+    auto_perk_source: str
+
+
+def _actor_value_spec(req: PriorityRequest, priority: int) -> RequirementSpec | None:
+    if req.actor_value is None or req.value is None:
+        return None
+    return RequirementSpec(
+        kind="actor_value",
+        priority=priority,
+        reason=req.reason,
+        actor_value=req.actor_value,
+        operator=req.operator,
+        value=req.value,
+    )
+
+
+def _perk_spec(req: PriorityRequest, priority: int) -> RequirementSpec | None:
+    if req.perk_id is None:
+        return None
+    return RequirementSpec(
+        kind="perk",
+        priority=priority,
+        reason=req.reason,
+        perk_id=req.perk_id,
+        perk_rank=req.perk_rank,
+    )
+
+
+def _trait_spec(req: PriorityRequest, priority: int) -> RequirementSpec | None:
+    if req.trait_id is None:
+        return None
+    return RequirementSpec(kind="trait", priority=priority, reason=req.reason, trait_id=req.trait_id)
+
+
+def _meta_spec(req: PriorityRequest, priority: int) -> RequirementSpec | None:
+    return RequirementSpec(kind=req.kind, priority=priority, reason=req.reason)
+
+
+def _crit_damage_potential_spec(req: PriorityRequest, priority: int) -> RequirementSpec | None:
+    return RequirementSpec(
+        kind="crit_damage_potential",
+        priority=priority,
+        reason=req.reason,
+        operator=req.operator,
+        value=req.value,
+    )
+
+
+# Request kind -> planner requirement; kinds missing here (tagged_skill) feed
+# StartingConditions instead of the goal.
+_SPEC_BUILDERS: dict[str, Callable[[PriorityRequest, int], RequirementSpec | None]] = {
+    "actor_value": _actor_value_spec,
+    "perk": _perk_spec,
+    "trait": _trait_spec,
+    "max_skills": _meta_spec,
+    "max_crit": _meta_spec,
+    "max_crit_damage": _meta_spec,
+    "crit_damage_potential": _crit_damage_potential_spec,
+}
+
+
 @dataclass(slots=True)
 class BuildController:
     """Owns build-page actions.
@@ -60,25 +194,65 @@ class BuildController:
     _last_feasible: bool = True
     _last_feasibility_message: str = "No priority requests set yet."
     _last_skill_books_used: dict[int, int] = field(default_factory=dict)
-    _last_skill_books_used_by_level: dict[int, dict[int, int]] = field(default_factory=dict)
-    _last_skill_book_points_by_level: dict[int, dict[int, int]] = field(default_factory=dict)
+    # Per-level book maps are int-keyed at write time (_recompute_plan), never
+    # mutated afterwards, and shared with the plan cache; accessors hand out views.
+    _last_skill_books_used_by_level: Mapping[int, Mapping[int, int]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    _last_skill_book_points_by_level: Mapping[int, Mapping[int, int]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
     _last_perk_selection_reasons: dict[int, str] = field(default_factory=dict)
     _last_book_dependency_warning: str | None = None
     _last_perk_request_statuses: dict[int, dict[str, str]] = field(default_factory=dict)
     _inferred_effects_by_id: dict[int, object] = field(default_factory=dict)
+    _inferred_effects_scope: tuple = ()
+    _skill_book_avs_sorted: list[int] = field(default_factory=list)
+    _total_skill_books: int = 0
+    _needed_skill_books: int = 0
+    _flat_skill_bonus_by_id: dict[int, tuple[int, tuple[tuple[int, int], ...]]] = field(
+        default_factory=dict
+    )
+    _plan_cache: dict[tuple, _PlanOutcome] = field(default_factory=dict)
+    _plan_cache_scope: tuple = ()
+    _applied_plan: _PlanOutcome | None = None
+    _no_books_gap_cache: dict[tuple, int] = field(default_factory=dict)
+    _batch_depth: int = 0
+    _requests_by_kind: dict[str, list[int]] = field(default_factory=dict)
+    _perk_request_idx_by_id: dict[int, int] = field(default_factory=dict)
+    _snapshot: _RequestSnapshot | None = None
+    # Request-derived lists, cleared with the request indexes.
+    _goal_specs: tuple[RequirementSpec, ...] | None = None
+    _requested_trait_ids: tuple[int, ...] | None = None
+    _requested_tag_avs: tuple[int, ...] | None = None
+    _auto_tag_avs: tuple[int, ...] | None = None
+    _request_rows: tuple[tuple[int, str], ...] | None = None
+    _perk_index_scope: tuple = ()
+    _perk_category: dict[int, str] = field(default_factory=dict)
+    _perk_name_lower: dict[int, str] = field(default_factory=dict)
+    _perk_edid_lower: dict[int, str] = field(default_factory=dict)
+    _perk_id_by_edid_lower: dict[str, int] = field(default_factory=dict)
+    _perk_id_by_name_lower: dict[str, int] = field(default_factory=dict)
+    _perk_id_by_preset_token: dict[str, int] = field(default_factory=dict)
+    _sorted_build_perks: list[Perk] = field(default_factory=list)
+    _build_perks_by_name: list[Perk] = field(default_factory=list)
+    _sorted_traits: list[Perk] = field(default_factory=list)
+    _perk_option_rows: list[tuple[int, str, str]] = field(default_factory=list)
+    _trait_option_rows: list[tuple[int, str]] = field(default_factory=list)
+    _special_implant_by_target_av: dict[int, int] = field(default_factory=dict)
+    _perk_option_haystacks: list[str] = field(default_factory=list)
+    _perk_option_corpus: str = ""
+    _perk_option_offsets: list[int] = field(default_factory=list)
+    _batch_dirty: bool = False
     quick_perk_preset_path: Path = Path("config/quick_perks.txt")
 
     def __post_init__(self) -> None:
         if self.requests is None:
             self.requests = []
-        self._inferred_effects_by_id = {
-            int(perk_id): _infer_perk_skill_effects(
-                perk,
-                linked_spell_names_by_form=self.linked_spell_names_by_form,
-                linked_spell_stat_bonuses_by_form=self.linked_spell_stat_bonuses_by_form,
-            )
-            for perk_id, perk in self.perks.items()
-        }
+        self._reindex_requests()
+        self._skill_book_avs_sorted = sorted(self.skill_books_by_av)
+        self._total_skill_books = sum(max(0, int(v)) for v in self.skill_books_by_av.values())
+        self._ensure_inferred_effects()
         self._recompute_plan()
         self._sync_state()
         self.current_level = min(max(1, self.current_level), self.state.target_level)
@@ -87,13 +261,32 @@ class BuildController:
         """Refresh UI-bound state after any build mutation."""
         self._sync_state()
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer replanning and change notification until the block exits.
+
+        Mutations inside the block only mark the plan dirty, so several
+        request edits cost one planner run. Read models inside the block
+        still reflect the plan from before it was entered.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                self._recompute_plan()
+                self._sync_state()
+                self._notify_changed()
+
     @property
     def max_level(self) -> int:
         return self.engine.max_level
 
     @property
     def target_level(self) -> int:
-        return self.engine.state.target_level
+        return self.engine.target_level
 
     @property
     def special_budget(self) -> int:
@@ -107,72 +300,57 @@ class BuildController:
     def special_max(self) -> int:
         return self.engine.special_max
 
-    def special_values(self) -> dict[int, int]:
-        return dict(self.engine.state.special)
+    def special_values(self) -> Mapping[int, int]:
+        """Read-only view of the current SPECIAL."""
+        return self.engine.special
 
     def total_skill_books(self) -> int:
-        return sum(max(0, int(v)) for v in self.skill_books_by_av.values())
+        return self._total_skill_books
 
     def needed_skill_books(self) -> int:
-        return sum(max(0, int(v)) for v in self._last_skill_books_used.values())
+        return self._needed_skill_books
 
     def skill_book_rows(self) -> list[tuple[str, int, int]]:
         rows: list[tuple[str, int, int]] = []
-        avs = sorted(set(self.skill_books_by_av.keys()) | set(self._last_skill_books_used.keys()))
-        for av in avs:
-            available = max(0, int(self.skill_books_by_av.get(int(av), 0)))
-            needed = max(0, int(self._last_skill_books_used.get(int(av), 0)))
+        extra = sorted(av for av in self._last_skill_books_used if av not in self.skill_books_by_av)
+        for av in merge(self._skill_book_avs_sorted, extra):
+            available = max(0, int(self.skill_books_by_av.get(av, 0)))
+            needed = max(0, int(self._last_skill_books_used.get(av, 0)))
             if available == 0 and needed == 0:
                 continue
             name = ACTOR_VALUE_NAMES.get(int(av), f"AV{av}")
             rows.append((name, needed, available))
         return rows
 
-    def skill_book_usage_by_level(self) -> dict[int, dict[int, int]]:
-        return {
-            int(level): {int(av): int(count) for av, count in per_level.items()}
-            for level, per_level in self._last_skill_books_used_by_level.items()
-        }
+    def skill_book_usage_by_level(self) -> Mapping[int, Mapping[int, int]]:
+        """Read-only view of the plan's per-level skill book usage."""
+        return self._last_skill_books_used_by_level
 
-    def skill_book_points_by_level(self) -> dict[int, dict[int, int]]:
-        return {
-            int(level): {int(av): int(points) for av, points in per_level.items()}
-            for level, per_level in self._last_skill_book_points_by_level.items()
-        }
+    def skill_book_points_by_level(self) -> Mapping[int, Mapping[int, int]]:
+        """Read-only view of the plan's per-level skill book points."""
+        return self._last_skill_book_points_by_level
 
     def implant_points_by_level(self) -> dict[int, dict[int, int]]:
         """Estimated SPECIAL points granted by implants before each level-up."""
-        special_implants = self._special_implants_by_target_av()
+        self._ensure_perk_index()
+        special_implants = self._special_implant_by_target_av
         if not special_implants:
             return {}
 
-        out: dict[int, dict[int, int]] = {}
-        used_targets: set[int] = set()
-
+        state = self.engine.state
         # Creation-phase implant points are applied before level 2.
-        for av, pts in self.engine.state.creation_special_points.items():
-            iav = int(av)
-            if iav not in special_implants or iav in used_targets:
-                continue
-            if int(pts) <= 0:
-                continue
-            out.setdefault(2, {})
-            out[2][iav] = out[2].get(iav, 0) + 1
-            used_targets.add(iav)
-
-        for level in sorted(self.engine.state.level_plans):
-            plan = self.engine.state.level_plans[level]
-            for av, pts in plan.special_points.items():
-                iav = int(av)
-                if iav not in special_implants or iav in used_targets:
-                    continue
-                if int(pts) <= 0:
-                    continue
-                out.setdefault(int(level), {})
-                out[int(level)][iav] = out[int(level)].get(iav, 0) + 1
-                used_targets.add(iav)
-
-        return out
+        sources = chain(
+            ((2, state.creation_special_points),),
+            ((level, plan.special_points) for level, plan in sorted(state.level_plans.items())),
+        )
+        out: defaultdict[int, dict[int, int]] = defaultdict(dict)
+        used_targets: set[int] = set()
+        for level, points in sources:
+            for av, pts in points.items():
+                if av in special_implants and av not in used_targets and pts > 0:
+                    used_targets.add(av)
+                    out[level][av] = 1
+        return dict(out)
 
     def perk_reason_for_level(self, level: int) -> str | None:
         reason = self._last_perk_selection_reasons.get(int(level))
@@ -180,36 +358,69 @@ class BuildController:
             return reason
         return None
 
+    def _ensure_inferred_effects(self) -> None:
+        """(Re)infer per-perk skill effects for this controller's tables.
+
+        Like the perk index, the perk and linked-spell tables are only replaced
+        wholesale, so the inferences are dropped only when one of them changes
+        identity.
+        """
+        scope = (self.perks, self.linked_spell_names_by_form, self.linked_spell_stat_bonuses_by_form)
+        if self._inferred_effects_scope and all(a is b for a, b in zip(scope, self._inferred_effects_scope)):
+            return
+        self._inferred_effects_scope = scope
+        self._inferred_effects_by_id = {
+            int(perk_id): _infer_perk_skill_effects(
+                perk,
+                linked_spell_names_by_form=self.linked_spell_names_by_form,
+                linked_spell_stat_bonuses_by_form=self.linked_spell_stat_bonuses_by_form,
+            )
+            for perk_id, perk in self.perks.items()
+        }
+        # (all_skills_bonus, per-skill items) flattened for the per-level walk.
+        self._flat_skill_bonus_by_id = {
+            perk_id: (
+                int(getattr(effects, "all_skills_bonus", 0)),
+                tuple(
+                    (int(av), int(bonus))
+                    for av, bonus in getattr(effects, "per_skill_bonus", {}).items()
+                ),
+            )
+            for perk_id, effects in self._inferred_effects_by_id.items()
+        }
+
     def flat_skill_bonuses_by_level(self) -> dict[int, dict[int, int]]:
         """Cumulative inferred flat skill bonuses active at each level."""
+        self._ensure_inferred_effects()
         by_level: dict[int, dict[int, int]] = {}
-        active_perks: list[int] = []
-        active_traits = [int(tid) for tid in self.engine.state.traits]
-        for level in range(1, int(self.engine.state.target_level) + 1):
+        all_skills = 0
+        per_skill: dict[int, int] = {}
+
+        def _activate(perk_id: int) -> None:
+            nonlocal all_skills
+            bonus = self._flat_skill_bonus_by_id.get(perk_id)
+            if bonus is None:
+                return
+            all_skills += bonus[0]
+            for av, amount in bonus[1]:
+                per_skill[av] = per_skill.get(av, 0) + amount
+
+        state = self.engine.state
+        for level in range(1, int(state.target_level) + 1):
             if level == 1:
-                active_perks.extend(active_traits)
+                for tid in state.traits:
+                    _activate(int(tid))
             else:
-                plan = self.engine.state.level_plans.get(int(level))
+                plan = state.level_plans.get(level)
                 if plan is not None and plan.perk is not None:
-                    active_perks.append(int(plan.perk))
-
-            all_skills = 0
-            per_skill: dict[int, int] = {}
-            for perk_id in active_perks:
-                effects = self._inferred_effects_by_id.get(int(perk_id))
-                if effects is None:
-                    continue
-                all_skills += int(getattr(effects, "all_skills_bonus", 0))
-                for av, bonus in getattr(effects, "per_skill_bonus", {}).items():
-                    iav = int(av)
-                    per_skill[iav] = per_skill.get(iav, 0) + int(bonus)
+                    _activate(int(plan.perk))
 
             level_bonuses: dict[int, int] = {}
             for av in SKILL_INDICES:
-                total = int(per_skill.get(int(av), 0)) + all_skills
+                total = per_skill.get(int(av), 0) + all_skills
                 if total != 0:
                     level_bonuses[int(av)] = total
-            by_level[int(level)] = level_bonuses
+            by_level[level] = level_bonuses
         return by_level
 
     def perk_reasons(self) -> dict[int, str]:
@@ -249,19 +460,16 @@ class BuildController:
 
     def set_target_level(self, level: int) -> tuple[bool, str | None]:
         if level != self.engine.max_level:
-            self._recompute_plan()
-            self._sync_state()
-            self._notify_changed()
             return False, f"Target level is fixed to max level ({self.engine.max_level})."
-        self._recompute_plan()
-        self._sync_state()
-        self._notify_changed()
+        if level == self.engine.target_level and self._plan_cache_valid():
+            return True, None
+        self._mark_dirty()
         return True, None
 
     def set_preview_level(self, level: int) -> tuple[bool, str | None]:
         if level < 1 or level > self.engine.max_level:
             return False, f"Preview level must be in range 1..{self.engine.max_level}"
-        if level > self.engine.state.target_level:
+        if level > self.engine.target_level:
             self._recompute_plan()
         self.current_level = level
         self._sync_state()
@@ -269,84 +477,134 @@ class BuildController:
 
     def summary(self) -> tuple[CharacterStats, CharacterStats, dict[str, float], bool]:
         now = self.ui_model.level_snapshot(self.current_level).stats
-        target_level = self.engine.state.target_level
+        target_level = self.engine.target_level
         goal = self.ui_model.level_snapshot(target_level).stats
         delta = self.ui_model.compare_levels(self.current_level, target_level).stat_deltas
         return now, goal, delta, self.engine.is_valid()
 
     def special_totals(self) -> tuple[int, int]:
-        used = sum(self.engine.state.special.values())
+        used = sum(self.engine.special.values())
         return used, self.engine.special_budget - used
 
     def diagnostics(self) -> list[UiDiagnostic]:
         return self.ui_model.diagnostics(level=self.current_level)
 
     def trait_options(self) -> list[tuple[int, str]]:
-        rows: list[tuple[int, str]] = []
-        for perk in sorted(self.perks.values(), key=lambda p: p.name.lower()):
-            if not perk.is_trait:
-                continue
-            rows.append((perk.form_id, perk.name))
-        return rows
+        self._ensure_perk_index()
+        return list(self._trait_option_rows)
 
     def selected_trait_ids(self) -> set[int]:
-        assert self.requests is not None
-        return {int(r.trait_id) for r in self.requests if r.kind == "trait" and r.trait_id is not None}
+        return set(self._requested_traits())
 
     def tagged_skill_options(self) -> list[tuple[int, str]]:
-        rows: list[tuple[int, str]] = []
-        for av in sorted(int(s) for s in SKILL_GOVERNING_ATTRIBUTE):
-            rows.append((int(av), ACTOR_VALUE_NAMES.get(int(av), f"AV{av}")))
-        return rows
+        return list(_TAGGED_SKILL_OPTIONS)
 
     def selected_tagged_skill_ids(self) -> set[int]:
-        assert self.requests is not None
         return {
-            int(r.tagged_skill_av)
-            for r in self.requests
-            if r.kind == "tagged_skill" and r.tagged_skill_av is not None
+            int(req.tagged_skill_av)
+            for req in self._requests_of_kind("tagged_skill")
+            if req.tagged_skill_av is not None
         }
 
     def perk_rows(self, query: str = "") -> list[tuple[int, str, str, bool]]:
+        self._ensure_perk_index()
         q = query.strip().lower()
-        rows: list[tuple[int, str, str, bool]] = []
-        sortable: list[tuple[int, int, str, Perk]] = []
-        selected_perks = {r.perk_id for r in self.requests if r.kind == "perk"}
-        for perk in self.perks.values():
-            category = classify_perk(perk, self.challenge_perk_ids).name
-            if category not in {"normal", "challenge"}:
-                continue
-            if q and q not in perk.name.lower() and q not in perk.editor_id.lower():
-                continue
-            # Keep challenge perks at the bottom of the picker.
-            group = 1 if category == "challenge" else 0
-            sortable.append((group, perk.min_level, perk.name.lower(), perk))
-
-        for _group, _min_level, _name, perk in sorted(sortable):
-            category = classify_perk(perk, self.challenge_perk_ids).name
-            rows.append(
-                (
-                    perk.form_id,
-                    perk.name,
-                    category,
-                    perk.form_id in selected_perks,
-                )
-            )
-        return rows
+        selected_perks = self._perk_request_idx_by_id
+        if not q:
+            return [
+                (pid, name, category, pid in selected_perks)
+                for pid, name, category in self._perk_option_rows
+            ]
+        rows = self._perk_option_rows
+        return [
+            (rows[i][0], rows[i][1], rows[i][2], rows[i][0] in selected_perks)
+            for i in self._perk_option_hits(q)
+        ]
+
+    def _perk_option_hits(self, q: str) -> Iterator[int]:
+        """Indexes of perk option rows whose haystack contains ``q``.
+
+        Scans one newline-joined corpus with str.find and jumps to the next
+        row after each hit instead of testing every haystack separately.
+        """
+        if "\n" in q:
+            return
+        corpus = self._perk_option_corpus
+        offsets = self._perk_option_offsets
+        pos = corpus.find(q)
+        while pos != -1:
+            idx = bisect_right(offsets, pos) - 1
+            yield idx
+            if idx + 1 >= len(offsets):
+                return
+            pos = corpus.find(q, offsets[idx + 1])
 
     def perk_options(self) -> list[tuple[int, str, str]]:
-        rows: list[tuple[int, str, str]] = []
-        sortable: list[tuple[int, int, str, Perk]] = []
+        self._ensure_perk_index()
+        return list(self._perk_option_rows)
+
+    def _ensure_perk_index(self) -> None:
+        """(Re)build the sorted perk lists and lowercase lookups.
+
+        The perk table and challenge ids are treated as immutable and only
+        replaced wholesale, so the index is rebuilt only when either object
+        changes identity.
+        """
+        scope = (self.perks, self.challenge_perk_ids)
+        if self._perk_index_scope and all(a is b for a, b in zip(scope, self._perk_index_scope)):
+            return
+        self._perk_index_scope = scope
+        self._request_rows = None
+        self._perk_category = {
+            int(pid): classify_perk(perk, self.challenge_perk_ids).name
+            for pid, perk in self.perks.items()
+        }
+        self._perk_name_lower = {int(pid): perk.name.lower() for pid, perk in self.perks.items()}
+        self._perk_edid_lower = {int(pid): perk.editor_id.lower() for pid, perk in self.perks.items()}
+        self._perk_id_by_edid_lower = {edid: pid for pid, edid in self._perk_edid_lower.items()}
+        self._perk_id_by_name_lower = {name: pid for pid, name in self._perk_name_lower.items()}
+        self._perk_id_by_preset_token = {}
+        for perk in sorted(self.perks.values(), key=lambda p: int(p.form_id)):
+            for key in (perk.editor_id, perk.name):
+                token = self._normalize_preset_token(key)
+                if token and token not in self._perk_id_by_preset_token:
+                    self._perk_id_by_preset_token[token] = int(perk.form_id)
+        by_name = sorted(self.perks.values(), key=lambda p: self._perk_name_lower[p.form_id])
+        self._build_perks_by_name = [
+            perk for perk in by_name
+            if self._perk_category[perk.form_id] in {"normal", "challenge"}
+        ]
+        # Keep challenge perks at the bottom of the picker.
+        self._sorted_build_perks = sorted(
+            self._build_perks_by_name,
+            key=lambda p: (
+                1 if self._perk_category[p.form_id] == "challenge" else 0,
+                p.min_level,
+                self._perk_name_lower[p.form_id],
+            ),
+        )
+        self._sorted_traits = [perk for perk in by_name if perk.is_trait]
+        self._trait_option_rows = [(perk.form_id, perk.name) for perk in self._sorted_traits]
+        self._special_implant_by_target_av = {}
         for perk in self.perks.values():
-            category = classify_perk(perk, self.challenge_perk_ids).name
-            if category not in {"normal", "challenge"}:
-                continue
-            group = 1 if category == "challenge" else 0
-            sortable.append((group, perk.min_level, perk.name.lower(), perk))
-        for _group, _min_level, _name, perk in sorted(sortable):
-            category = classify_perk(perk, self.challenge_perk_ids).name
-            rows.append((perk.form_id, perk.name, category))
-        return rows
+            target = self._implant_special_target(perk)
+            if target is not None:
+                self._special_implant_by_target_av[target] = int(perk.form_id)
+        self._perk_option_rows = [
+            (perk.form_id, perk.name, self._perk_category[perk.form_id])
+            for perk in self._sorted_build_perks
+        ]
+        # Name and editor id joined by NUL so one `in` test covers both.
+        self._perk_option_haystacks = [
+            f"{self._perk_name_lower[perk.form_id]}\x00{self._perk_edid_lower[perk.form_id]}"
+            for perk in self._sorted_build_perks
+        ]
+        self._perk_option_corpus = "\n".join(self._perk_option_haystacks)
+        self._perk_option_offsets = []
+        offset = 0
+        for haystack in self._perk_option_haystacks:
+            self._perk_option_offsets.append(offset)
+            offset += len(haystack) + 1
 
     @staticmethod
     def _planner_failure_message(result) -> str:
@@ -481,18 +739,13 @@ class BuildController:
         }
 
     def selected_perk_ids(self) -> set[int]:
-        assert self.requests is not None
-        return {int(r.perk_id) for r in self.requests if r.kind == "perk" and r.perk_id is not None}
+        return set(self._perk_request_idx_by_id)
 
     def set_desired_perk_selected(self, perk_id: int, selected: bool) -> None:
-        assert self.requests is not None
-        existing_idx = next(
-            (i for i, r in enumerate(self.requests) if r.kind == "perk" and r.perk_id == perk_id),
-            None,
-        )
+        existing_idx = self._perk_request_idx_by_id.get(perk_id)
         if selected:
             if existing_idx is None:
-                self.requests.append(
+                self._append_request(
                     PriorityRequest(
                         kind="perk",
                         perk_id=perk_id,
@@ -502,10 +755,8 @@ class BuildController:
                 )
         else:
             if existing_idx is not None:
-                del self.requests[existing_idx]
-        self._recompute_plan()
-        self._sync_state()
-        self._notify_changed()
+                self._remove_request_at(existing_idx)
+        self._mark_dirty()
 
     def feasibility_warning(self) -> tuple[bool, str]:
         return self._last_feasible, self._last_feasibility_message
@@ -517,15 +768,16 @@ class BuildController:
             for labels in self.zero_cost_perk_events_by_level().values()
             for label in labels
         }
+        self._ensure_perk_index()
         labels: list[str] = []
-        for req in self.requests:
-            if req.kind != "perk" or req.perk_id is None:
+        for req in self._requests_of_kind("perk"):
+            if req.perk_id is None:
                 continue
             pid = req.perk_id
             perk = self.perks.get(pid)
             if perk is None:
                 continue
-            category = classify_perk(perk, self.challenge_perk_ids).name
+            category = self._perk_category[perk.form_id]
             if category in {"challenge", "special"}:
                 label = f"{perk.name} [{category}]"
                 if label not in scheduled:
@@ -535,16 +787,17 @@ class BuildController:
     def zero_cost_perk_events_by_level(self) -> dict[int, list[str]]:
         """Between-level timeline events for zero-cost perk requests."""
         assert self.requests is not None
+        self._ensure_perk_index()
         out: dict[int, list[str]] = {}
         seen: set[tuple[int, str]] = set()
-        target = int(self.engine.state.target_level)
-        for req in self.requests:
-            if req.kind != "perk" or req.perk_id is None:
+        target = int(self.engine.target_level)
+        for req in self._requests_of_kind("perk"):
+            if req.perk_id is None:
                 continue
             perk = self.perks.get(int(req.perk_id))
             if perk is None:
                 continue
-            category = classify_perk(perk, self.challenge_perk_ids).name
+            category = self._perk_category[perk.form_id]
             if category not in {"challenge", "special"}:
                 continue
             level = max(2, min(target, int(perk.min_level)))
@@ -559,10 +812,7 @@ class BuildController:
         return out
 
     def actor_value_options(self) -> list[tuple[int, str]]:
-        options: list[tuple[int, str]] = []
-        for av in sorted(SPECIAL_INDICES | SKILL_INDICES):
-            options.append((int(av), ACTOR_VALUE_NAMES.get(int(av), f"AV{av}")))
-        return options
+        return list(_ACTOR_VALUE_OPTIONS)
 
     def add_actor_value_request(
         self,
@@ -572,9 +822,9 @@ class BuildController:
         reason: str = "",
     ) -> tuple[bool, str | None]:
         assert self.requests is not None
-        if actor_value not in SPECIAL_INDICES and actor_value not in SKILL_INDICES:
+        if actor_value not in _REQUESTABLE_AVS:
             return False, "Unsupported actor value for request"
-        self.requests.append(
+        self._append_request(
             PriorityRequest(
                 kind="actor_value",
                 actor_value=int(actor_value),
@@ -583,26 +833,15 @@ class BuildController:
                 reason=reason.strip() or "Actor value request",
             )
         )
-        self._recompute_plan()
-        self._sync_state()
-        self._notify_changed()
+        self._mark_dirty()
         return True, None
 
     def add_perk_request_by_query(self, query: str) -> tuple[bool, str | None]:
         text = query.strip().lower()
         if not text:
             return False, "Enter a perk name or editor ID"
-        match: Perk | None = None
-        for perk in sorted(self.perks.values(), key=lambda p: p.name.lower()):
-            category = classify_perk(perk, self.challenge_perk_ids).name
-            if category not in {"normal", "challenge"}:
-                continue
-            if text == perk.name.lower() or text == perk.editor_id.lower():
-                match = perk
-                break
-            if text in perk.name.lower() or text in perk.editor_id.lower():
-                match = perk
-                break
+        self._ensure_perk_index()
+        match = self._first_perk_matching(text, self._build_perks_by_name, {"normal", "challenge"})
         if match is None:
             return False, "No matching perk found"
         self.set_desired_perk_selected(match.form_id, True)
@@ -610,9 +849,9 @@ class BuildController:
 
     def set_perk_requests(self, perk_ids: set[int]) -> None:
         assert self.requests is not None
-        self.requests = [r for r in self.requests if r.kind != "perk"]
+        self._remove_requests_of_kind("perk")
         for pid in sorted(perk_ids):
-            self.requests.append(
+            self._append_request(
                 PriorityRequest(
                     kind="perk",
                     perk_id=int(pid),
@@ -620,9 +859,7 @@ class BuildController:
                     reason="Perk request",
                 )
             )
-        self._recompute_plan()
-        self._sync_state()
-        self._notify_changed()
+        self._mark_dirty()
 
     def apply_quick_perk_preset(self) -> tuple[bool, str | None]:
         return self._apply_perk_preset(self.quick_perk_preset_path, "quick perk")
@@ -632,27 +869,18 @@ class BuildController:
             return False, f"{label.title()} preset not found: {path}"
 
         try:
-            lines = path.read_text().splitlines()
+            tokens = _PRESET_LINE_RE.findall(path.read_text())
         except OSError as exc:
             return False, f"Could not read {label} preset: {exc}"
 
-        tokens = [
-            line.strip()
-            for line in lines
-            if line.strip() and not line.strip().startswith("#")
-        ]
         if not tokens:
             self.set_perk_requests(set())
             return True, f"{label.title()} preset is empty; cleared perk requests."
 
-        by_edid = {p.editor_id.lower(): int(p.form_id) for p in self.perks.values()}
-        by_name = {p.name.lower(): int(p.form_id) for p in self.perks.values()}
-        by_norm: dict[str, int] = {}
-        for perk in sorted(self.perks.values(), key=lambda p: int(p.form_id)):
-            for key in (perk.editor_id, perk.name):
-                token = self._normalize_preset_token(key)
-                if token and token not in by_norm:
-                    by_norm[token] = int(perk.form_id)
+        self._ensure_perk_index()
+        by_edid = self._perk_id_by_edid_lower
+        by_name = self._perk_id_by_name_lower
+        by_norm = self._perk_id_by_preset_token
 
         selected: set[int] = set()
         unresolved: list[str] = []
@@ -692,6 +920,25 @@ class BuildController:
             )
         return True, f"Applied {label} preset ({len(selected)} perks)."
 
+    def _first_perk_matching(
+        self,
+        text: str,
+        perks: list[Perk],
+        categories: set[str],
+    ) -> Perk | None:
+        """Resolve a lowercase query to a perk from `perks` (of `categories`).
+
+        An exact name or editor-id hit wins outright; otherwise the first perk
+        in name order whose name or editor id contains `text` is returned.
+        """
+        for exact_id in (self._perk_id_by_name_lower.get(text), self._perk_id_by_edid_lower.get(text)):
+            if exact_id is not None and self._perk_category[exact_id] in categories:
+                return self.perks[exact_id]
+        for perk in perks:
+            if text in self._perk_name_lower[perk.form_id] or text in self._perk_edid_lower[perk.form_id]:
+                return perk
+        return None
+
     @staticmethod
     def _normalize_preset_token(text: str) -> str:
         return re.sub(r"[^a-z0-9]+", "", text.lower())
@@ -700,49 +947,36 @@ class BuildController:
         text = query.strip().lower()
         if not text:
             return False, "Enter a trait name or editor ID"
-        match: Perk | None = None
-        for perk in sorted(self.perks.values(), key=lambda p: p.name.lower()):
-            if not perk.is_trait:
-                continue
-            if text == perk.name.lower() or text == perk.editor_id.lower():
-                match = perk
-                break
-            if text in perk.name.lower() or text in perk.editor_id.lower():
-                match = perk
-                break
+        self._ensure_perk_index()
+        match = self._first_perk_matching(text, self._sorted_traits, {"trait"})
         if match is None:
             return False, "No matching trait found"
         assert self.requests is not None
-        existing = any(r.kind == "trait" and r.trait_id == match.form_id for r in self.requests)
-        if not existing:
-            self.requests.append(
+        if match.form_id not in self._requested_traits():
+            self._append_request(
                 PriorityRequest(
                     kind="trait",
                     trait_id=match.form_id,
                     reason="Trait request",
                 )
             )
-            self._recompute_plan()
-            self._sync_state()
-            self._notify_changed()
+            self._mark_dirty()
         return True, None
 
     def set_trait_requests(self, trait_ids: set[int]) -> tuple[bool, str | None]:
         assert self.requests is not None
         ordered = [tid for tid, _name in self.trait_options() if tid in trait_ids]
         trimmed = ordered[: self.max_traits]
-        self.requests = [r for r in self.requests if r.kind != "trait"]
+        self._remove_requests_of_kind("trait")
         for tid in trimmed:
-            self.requests.append(
+            self._append_request(
                 PriorityRequest(
                     kind="trait",
                     trait_id=int(tid),
                     reason="Trait request",
                 )
             )
-        self._recompute_plan()
-        self._sync_state()
-        self._notify_changed()
+        self._mark_dirty()
         if len(ordered) > len(trimmed):
             return (
                 False,
@@ -754,18 +988,16 @@ class BuildController:
         assert self.requests is not None
         ordered = [av for av, _name in self.tagged_skill_options() if av in skill_avs]
         trimmed = ordered[:3]
-        self.requests = [r for r in self.requests if r.kind != "tagged_skill"]
+        self._remove_requests_of_kind("tagged_skill")
         for av in trimmed:
-            self.requests.append(
+            self._append_request(
                 PriorityRequest(
                     kind="tagged_skill",
                     tagged_skill_av=int(av),
                     reason="Tagged skill request",
                 )
             )
-        self._recompute_plan()
-        self._sync_state()
-        self._notify_changed()
+        self._mark_dirty()
         if len(ordered) > len(trimmed):
             return (
                 False,
@@ -775,48 +1007,39 @@ class BuildController:
 
     def add_max_skills_request(self) -> None:
         assert self.requests is not None
-        existing = any(r.kind == "max_skills" for r in self.requests)
-        if existing:
+        if self._has_request("max_skills"):
             return
-        self.requests.append(
+        self._append_request(
             PriorityRequest(
                 kind="max_skills",
                 reason="Max out all skills",
             )
         )
-        self._recompute_plan()
-        self._sync_state()
-        self._notify_changed()
+        self._mark_dirty()
 
     def add_max_crit_request(self) -> None:
         assert self.requests is not None
-        existing = any(r.kind == "max_crit" for r in self.requests)
-        if existing:
+        if self._has_request("max_crit"):
             return
-        self.requests.append(
+        self._append_request(
             PriorityRequest(
                 kind="max_crit",
                 reason="Maximize critical chance bonuses",
             )
         )
-        self._recompute_plan()
-        self._sync_state()
-        self._notify_changed()
+        self._mark_dirty()
 
     def add_max_crit_damage_request(self) -> None:
         assert self.requests is not None
-        existing = any(r.kind == "max_crit_damage" for r in self.requests)
-        if existing:
+        if self._has_request("max_crit_damage"):
             return
-        self.requests.append(
+        self._append_request(
             PriorityRequest(
                 kind="max_crit_damage",
                 reason="Maximize critical damage potential",
             )
         )
-        self._recompute_plan()
-        self._sync_state()
-        self._notify_changed()
+        self._mark_dirty()
 
     def add_crit_damage_potential_request(
         self,
@@ -825,7 +1048,7 @@ class BuildController:
         reason: str = "",
     ) -> tuple[bool, str | None]:
         assert self.requests is not None
-        self.requests.append(
+        self._append_request(
             PriorityRequest(
                 kind="crit_damage_potential",
                 operator=operator,
@@ -833,18 +1056,15 @@ class BuildController:
                 reason=reason.strip() or "Crit damage potential request",
             )
         )
-        self._recompute_plan()
-        self._sync_state()
-        self._notify_changed()
+        self._mark_dirty()
         return True, None
 
     def set_meta_request_enabled(self, kind: str, enabled: bool) -> None:
         assert self.requests is not None
         if kind not in {"max_skills", "max_crit", "max_crit_damage"}:
             raise ValueError(f"Unsupported meta request kind: {kind}")
-        existing_indices = [i for i, req in enumerate(self.requests) if req.kind == kind]
         if enabled:
-            if existing_indices:
+            if self._has_request(kind):
                 return
             if kind == "max_skills":
                 self.add_max_skills_request()
@@ -854,43 +1074,43 @@ class BuildController:
                 self.add_max_crit_damage_request()
             return
 
-        if not existing_indices:
+        if not self._has_request(kind):
             return
-        for idx in reversed(existing_indices):
-            del self.requests[idx]
-        self._recompute_plan()
-        self._sync_state()
-        self._notify_changed()
+        self._remove_requests_of_kind(kind)
+        self._mark_dirty()
 
     def priority_request_rows(self) -> list[tuple[int, str]]:
         assert self.requests is not None
-        rows: list[tuple[int, str]] = []
-        for idx, req in enumerate(self.requests):
-            if req.kind == "actor_value":
-                av_name = ACTOR_VALUE_NAMES.get(int(req.actor_value or 0), "AV?")
-                text = f"{av_name} {req.operator} {req.value} [{req.reason}]"
-            elif req.kind == "perk":
-                perk_name = self.perks.get(int(req.perk_id or 0)).name if req.perk_id in self.perks else f"{req.perk_id:#x}"
-                text = f"Perk: {perk_name} (rank {req.perk_rank}) [{req.reason}]"
-            elif req.kind == "trait":
-                trait_name = self.perks.get(int(req.trait_id or 0)).name if req.trait_id in self.perks else f"{req.trait_id:#x}"
-                text = f"Trait: {trait_name} [{req.reason}]"
-            elif req.kind == "tagged_skill":
-                av = int(req.tagged_skill_av or 0)
-                skill_name = ACTOR_VALUE_NAMES.get(av, f"AV{av}")
-                text = f"Tagged Skill: {skill_name} [{req.reason}]"
-            elif req.kind == "max_skills":
-                text = f"Max Skills: all skills to 100 [{req.reason}]"
-            elif req.kind == "max_crit":
-                text = f"Max Crit: prioritize crit-bonus perks [{req.reason}]"
-            elif req.kind == "max_crit_damage":
-                text = f"Max Crit Dmg: prioritize crit-damage potential [{req.reason}]"
-            elif req.kind == "crit_damage_potential":
-                text = f"Crit Dmg Potential {req.operator} {req.value} [{req.reason}]"
-            else:
-                text = f"Unknown request [{req.reason}]"
-            rows.append((idx, text))
-        return rows
+        self._ensure_perk_index()
+        if self._request_rows is None:
+            self._request_rows = tuple(
+                (idx, self._format_request_row(req)) for idx, req in enumerate(self.requests)
+            )
+        return list(self._request_rows)
+
+    def _format_request_row(self, req: PriorityRequest) -> str:
+        if req.kind == "actor_value":
+            av_name = ACTOR_VALUE_NAMES.get(int(req.actor_value or 0), "AV?")
+            return f"{av_name} {req.operator} {req.value} [{req.reason}]"
+        if req.kind == "perk":
+            perk_name = self.perks.get(int(req.perk_id or 0)).name if req.perk_id in self.perks else f"{req.perk_id:#x}"
+            return f"Perk: {perk_name} (rank {req.perk_rank}) [{req.reason}]"
+        if req.kind == "trait":
+            trait_name = self.perks.get(int(req.trait_id or 0)).name if req.trait_id in self.perks else f"{req.trait_id:#x}"
+            return f"Trait: {trait_name} [{req.reason}]"
+        if req.kind == "tagged_skill":
+            av = int(req.tagged_skill_av or 0)
+            skill_name = ACTOR_VALUE_NAMES.get(av, f"AV{av}")
+            return f"Tagged Skill: {skill_name} [{req.reason}]"
+        if req.kind == "max_skills":
+            return f"Max Skills: all skills to 100 [{req.reason}]"
+        if req.kind == "max_crit":
+            return f"Max Crit: prioritize crit-bonus perks [{req.reason}]"
+        if req.kind == "max_crit_damage":
+            return f"Max Crit Dmg: prioritize crit-damage potential [{req.reason}]"
+        if req.kind == "crit_damage_potential":
+            return f"Crit Dmg Potential {req.operator} {req.value} [{req.reason}]"
+        return f"Unknown request [{req.reason}]"
 
     def priority_request_payloads(self) -> list[dict[str, int | str | None]]:
         assert self.requests is not None
@@ -921,98 +1141,151 @@ class BuildController:
             return
         req = self.requests.pop(index)
         self.requests.insert(new_index, req)
-        self._recompute_plan()
-        self._sync_state()
-        self._notify_changed()
+        self._reindex_requests(min(index, new_index))
+        self._mark_dirty()
 
     def remove_priority_request(self, index: int) -> None:
         assert self.requests is not None
         if index < 0 or index >= len(self.requests):
             return
-        del self.requests[index]
-        self._recompute_plan()
-        self._sync_state()
-        self._notify_changed()
+        self._remove_request_at(index)
+        self._mark_dirty()
 
     def special_rows(self) -> list[tuple[int, str, int]]:
         special = self.special_values()
         rows: list[tuple[int, str, int]] = []
-        for av in sorted(SPECIAL_INDICES):
-            rows.append((av, ACTOR_VALUE_NAMES.get(av, f"AV{av}"), special.get(av, 1)))
+        for av, name in _SPECIAL_NAMES:
+            rows.append((av, name, special.get(av, 1)))
         return rows
 
     def selected_traits_rows(self) -> list[tuple[str, str]]:
-        trait_ids = [int(tid) for tid in self.engine.state.traits]
-        direct_requested = set(self._requested_traits())
-        has_max_skills = any(r.kind == "max_skills" for r in self.requests or [])
+        snapshot = self._request_snapshot()
+        auto_source = "Auto (Max Skills)" if snapshot.has_max_skills else "Auto (Derived)"
         rows: list[tuple[str, str]] = []
-        for tid in trait_ids:
+        for tid in self.engine.state.traits:
             perk = self.perks.get(tid)
             name = perk.name if perk is not None else f"{tid:#x}"
-            if tid in direct_requested:
-                source = "Direct request"
-            elif has_max_skills:
-                source = "Auto (Max Skills)"
-            else:
-                source = "Auto (Derived)"
-            rows.append((name, source))
+            rows.append((name, "Direct request" if tid in snapshot.direct_traits else auto_source))
         rows.sort(key=lambda x: x[0].lower())
         return rows
 
     def selected_tagged_skills_rows(self) -> list[tuple[str, str]]:
-        tagged = sorted(int(av) for av in self.engine.state.tagged_skills)
-        direct_requested = set(self._requested_tagged_skills())
-        has_max_skills = any(r.kind == "max_skills" for r in self.requests or [])
+        snapshot = self._request_snapshot()
+        auto_source = "Auto (Max Skills)" if snapshot.has_max_skills else "Current build"
         rows: list[tuple[str, str]] = []
-        for av in tagged:
-            name = ACTOR_VALUE_NAMES.get(int(av), f"AV{av}")
-            if av in direct_requested:
-                source = "Direct request"
-            elif has_max_skills:
-                source = "Auto (Max Skills)"
-            else:
-                source = "Current build"
-            rows.append((name, source))
+        for av in sorted(self.engine.state.tagged_skills):
+            name = ACTOR_VALUE_NAMES.get(av, f"AV{av}")
+            rows.append((name, "Direct request" if av in snapshot.direct_tagged_skills else auto_source))
         return rows
 
     def selected_perks_rows(self) -> list[tuple[str, int, str]]:
-        direct_requested = self.selected_perk_ids()
-        has_max_skills = any(r.kind == "max_skills" for r in self.requests or [])
-        has_max_crit = any(r.kind == "max_crit" for r in self.requests or [])
-        has_max_crit_damage = any(r.kind == "max_crit_damage" for r in self.requests or [])
+        snapshot = self._request_snapshot()
+        level_plans = self.engine.state.level_plans
         rows: list[tuple[str, int, str]] = []
-        for level in sorted(self.engine.state.level_plans):
-            plan = self.engine.state.level_plans[level]
-            if plan.perk is None:
+        for level in sorted(level_plans):
+            perk_id = level_plans[level].perk
+            if perk_id is None:
                 continue
-            perk_id = int(plan.perk)
             perk = self.perks.get(perk_id)
             name = perk.name if perk is not None else f"{perk_id:#x}"
-            if perk_id in direct_requested:
-                source = "Direct request"
-            elif has_max_crit_damage:
-                source = "Auto (Max Crit Dmg)"
-            elif has_max_crit:
-                source = "Auto (Max Crit)"
-            elif has_max_skills:
-                source = "Auto (Max Skills)"
-            else:
-                source = "Auto (Derived)"
-            rows.append((name, int(level), source))
+            source = "Direct request" if perk_id in snapshot.direct_perks else snapshot.auto_perk_source
+            rows.append((name, level, source))
         return rows
 
+    def _request_snapshot(self) -> _RequestSnapshot:
+        """Request-derived facts for the selection rows, rebuilt after request edits."""
+        if self._snapshot is None:
+            if self._has_request("max_crit_damage"):
+                auto_perk_source = "Auto (Max Crit Dmg)"
+            elif self._has_request("max_crit"):
+                auto_perk_source = "Auto (Max Crit)"
+            elif self._has_request("max_skills"):
+                auto_perk_source = "Auto (Max Skills)"
+            else:
+                auto_perk_source = "Auto (Derived)"
+            self._snapshot = _RequestSnapshot(
+                direct_traits=frozenset(self._requested_traits()),
+                direct_tagged_skills=frozenset(self._requested_tagged_skills()),
+                direct_perks=frozenset(self._perk_request_idx_by_id),
+                has_max_skills=self._has_request("max_skills"),
+                auto_perk_source=auto_perk_source,
+            )
+        return self._snapshot
+
+    def _append_request(self, req: PriorityRequest) -> None:
+        assert self.requests is not None
+        self.requests.append(req)
+        self._reindex_requests(len(self.requests) - 1)
+
+    def _remove_request_at(self, index: int) -> None:
+        assert self.requests is not None
+        del self.requests[index]
+        self._reindex_requests(index)
+
+    def _remove_requests_of_kind(self, kind: str) -> None:
+        assert self.requests is not None
+        indices = self._requests_by_kind.get(kind)
+        if not indices:
+            return
+        first = indices[0]
+        self.requests[first:] = [r for r in self.requests[first:] if r.kind != kind]
+        self._reindex_requests(first)
+
+    def _reindex_requests(self, start: int = 0) -> None:
+        """Refresh the per-kind request indexes for positions >= start.
+
+        Every mutation of self.requests must end here (the helpers above do)
+        so read paths can look requests up by kind or perk id directly.
+        """
+        assert self.requests is not None
+        self._snapshot = None
+        self._goal_specs = None
+        self._requested_trait_ids = None
+        self._requested_tag_avs = None
+        self._auto_tag_avs = None
+        self._request_rows = None
+        for indices in self._requests_by_kind.values():
+            del indices[bisect_left(indices, start):]
+        self._perk_request_idx_by_id = {
+            pid: idx for pid, idx in self._perk_request_idx_by_id.items() if idx < start
+        }
+        for idx in range(start, len(self.requests)):
+            req = self.requests[idx]
+            self._requests_by_kind.setdefault(req.kind, []).append(idx)
+            if req.kind == "perk" and req.perk_id is not None:
+                self._perk_request_idx_by_id.setdefault(int(req.perk_id), idx)
+
+    def _requests_of_kind(self, kind: str) -> list[PriorityRequest]:
+        assert self.requests is not None
+        return [self.requests[idx] for idx in self._requests_by_kind.get(kind, ())]
+
+    def _has_request(self, kind: str) -> bool:
+        return bool(self._requests_by_kind.get(kind))
+
     def _sync_state(self) -> None:
-        self.state.target_level = self.engine.state.target_level
-        self.state.max_level = self.engine.max_level
+        # Only write on change so a no-op refresh leaves UiState untouched.
+        target_level = self.engine.target_level
+        if self.state.target_level != target_level:
+            self.state.target_level = target_level
+        max_level = self.engine.max_level
+        if self.state.max_level != max_level:
+            self.state.max_level = max_level
+
+    def _mark_dirty(self) -> None:
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        self._recompute_plan()
+        self._sync_state()
+        self._notify_changed()
 
     def _notify_changed(self) -> None:
         if self.on_change is not None:
             self.on_change()
 
-    def _recompute_plan(self) -> None:
+    def _plan_inputs(self) -> tuple[BuildState, StartingConditions, GoalSpec]:
         assert self.requests is not None
         state = self.engine.state
-        self._last_perk_request_statuses = {}
         requested_traits = self._requested_traits()
         tagged_skills = self._resolved_tagged_skills(state_tags=set(state.tagged_skills))
         start = StartingConditions(
@@ -1033,6 +1306,29 @@ class BuildController:
             maximize_skills=True,
             fill_perk_slots=True,
         )
+        return state, start, goal
+
+    def _plan_cache_valid(self) -> bool:
+        """True when replanning now would just re-apply the current outcome."""
+        if self._applied_plan is None:
+            return False
+        key = self._plan_cache_key(*self._plan_inputs())
+        return (
+            self._plan_cache.get(key) is self._applied_plan
+            and self._applied_plan.state == self.engine.state
+        )
+
+    def _recompute_plan(self) -> None:
+        state, start, goal = self._plan_inputs()
+        self._last_perk_request_statuses = {}
+        key = self._plan_cache_key(state, start, goal)
+        cached = self._plan_cache.pop(key, None)
+        if cached is not None:
+            # Re-insert so the dict's order doubles as LRU order.
+            self._plan_cache[key] = cached
+            self._restore_plan_outcome(cached)
+            return
+
         result = plan_build(
             self.engine,
             goal,
@@ -1046,36 +1342,109 @@ class BuildController:
         )
         self.engine.replace_state(result.state)
         self._last_skill_books_used = dict(result.skill_books_used)
-        self._last_skill_books_used_by_level = {
-            int(level): {int(av): int(count) for av, count in per_level.items()}
-            for level, per_level in result.skill_books_used_by_level.items()
-        }
-        self._last_skill_book_points_by_level = {
-            int(level): {int(av): int(points) for av, points in per_level.items()}
-            for level, per_level in result.skill_book_points_by_level.items()
-        }
+        self._needed_skill_books = sum(max(0, int(v)) for v in self._last_skill_books_used.values())
+        # Frozen at capture time: the same maps back _plan_cache entries.
+        self._last_skill_books_used_by_level = _frozen_by_level(
+            as_int_nested(result.skill_books_used_by_level)
+        )
+        self._last_skill_book_points_by_level = _frozen_by_level(
+            as_int_nested(result.skill_book_points_by_level)
+        )
         self._last_perk_selection_reasons = dict(result.perk_selection_reasons)
-        self._last_book_dependency_warning = self._derive_book_dependency_warning(
-            goal=goal,
-            start=start,
-            result=result,
+        # Only max-skills plans can depend on books; skip the probe otherwise.
+        self._last_book_dependency_warning = (
+            self._derive_book_dependency_warning(goal=goal, start=start, result=result)
+            if self._has_request("max_skills")
+            else None
         )
 
         if result.success:
             self._last_feasible = True
             self._last_feasibility_message = "Build possible: all priority requests can be satisfied."
-            return
-
-        self._last_feasible = False
-        if result.unmet_requirements:
-            suffix = "" if len(result.unmet_requirements) <= 2 else " ..."
-            self._last_feasibility_message = (
-                "Build not possible: " + " | ".join(result.unmet_requirements[:2]) + suffix
-            )
-        elif result.messages:
-            self._last_feasibility_message = "Build not possible: " + result.messages[0]
         else:
-            self._last_feasibility_message = "Build not possible with current constraints."
+            self._last_feasible = False
+            if result.unmet_requirements:
+                suffix = "" if len(result.unmet_requirements) <= 2 else " ..."
+                self._last_feasibility_message = (
+                    "Build not possible: " + " | ".join(result.unmet_requirements[:2]) + suffix
+                )
+            elif result.messages:
+                self._last_feasibility_message = "Build not possible: " + result.messages[0]
+            else:
+                self._last_feasibility_message = "Build not possible with current constraints."
+
+        self._applied_plan = self._plan_cache[key] = _PlanOutcome(
+            state=result.state,
+            skill_books_used=self._last_skill_books_used,
+            skill_books_needed=self._needed_skill_books,
+            skill_books_used_by_level=self._last_skill_books_used_by_level,
+            skill_book_points_by_level=self._last_skill_book_points_by_level,
+            perk_selection_reasons=self._last_perk_selection_reasons,
+            book_dependency_warning=self._last_book_dependency_warning,
+            feasible=self._last_feasible,
+            feasibility_message=self._last_feasibility_message,
+        )
+        while len(self._plan_cache) > _PLAN_CACHE_SIZE:
+            del self._plan_cache[next(iter(self._plan_cache))]
+
+    def _plan_cache_key(
+        self,
+        state: BuildState,
+        start: StartingConditions,
+        goal: GoalSpec,
+    ) -> tuple:
+        """Freeze every planner input into a hashable key.
+
+        The cache is dropped whenever the engine or the perk/item tables are
+        swapped for different objects, since those feed plan_build by reference.
+        """
+        self._check_plan_cache_scope()
+        return self._freeze_plan_inputs(state.creation_special_points, start, goal)
+
+    def _check_plan_cache_scope(self) -> None:
+        scope = (self.engine, self.perks, self.armors_by_id, self.weapons_by_id)
+        if len(scope) != len(self._plan_cache_scope) or any(
+            a is not b for a, b in zip(scope, self._plan_cache_scope)
+        ):
+            self._plan_cache.clear()
+            self._no_books_gap_cache.clear()
+            self._plan_cache_scope = scope
+
+    def _freeze_plan_inputs(
+        self,
+        creation_special_points: dict[int, int],
+        start: StartingConditions,
+        goal: GoalSpec,
+    ) -> tuple:
+        return (
+            start.name,
+            start.sex,
+            tuple(sorted((start.special or {}).items())),
+            tuple(sorted(start.tagged_skills or ())),
+            tuple(start.traits or ()),
+            tuple(sorted((start.equipment or {}).items())),
+            start.target_level,
+            tuple(sorted(creation_special_points.items())),
+            tuple(goal.required_perks),
+            tuple(astuple(spec) for spec in goal.requirements),
+            tuple(sorted(goal.skill_books_by_av.items())),
+            goal.target_level,
+            goal.maximize_skills,
+            goal.fill_perk_slots,
+            frozenset(self.challenge_perk_ids),
+        )
+
+    def _restore_plan_outcome(self, outcome: _PlanOutcome) -> None:
+        self._applied_plan = outcome
+        self.engine.replace_state(outcome.state)
+        self._last_skill_books_used = outcome.skill_books_used
+        self._needed_skill_books = outcome.skill_books_needed
+        self._last_skill_books_used_by_level = outcome.skill_books_used_by_level
+        self._last_skill_book_points_by_level = outcome.skill_book_points_by_level
+        self._last_perk_selection_reasons = outcome.perk_selection_reasons
+        self._last_book_dependency_warning = outcome.book_dependency_warning
+        self._last_feasible = outcome.feasible
+        self._last_feasibility_message = outcome.feasibility_message
 
     def _derive_book_dependency_warning(
         self,
@@ -1084,16 +1453,19 @@ class BuildController:
         start: StartingConditions,
         result,
     ) -> str | None:
-        if not any(r.kind == "max_skills" for r in goal.requirements):
-            return None
         if not result.skill_books_used:
             return None
+        if not any(r.kind == "max_skills" for r in goal.requirements):
+            return None
 
-        book_reason_lines = [
-            text for text in self._last_perk_selection_reasons.values()
-            if "Books cover +" in text
-        ]
-        if not book_reason_lines:
+        lead = next(
+            (
+                text for text in self._last_perk_selection_reasons.values()
+                if _BOOKS_COVER_TAG in text
+            ),
+            None,
+        )
+        if lead is None:
             return None
 
         zero_books_goal = GoalSpec(
@@ -1104,167 +1476,138 @@ class BuildController:
             maximize_skills=goal.maximize_skills,
             fill_perk_slots=goal.fill_perk_slots,
         )
-        no_books = plan_build(
-            self.engine,
-            zero_books_goal,
-            starting=start,
-            perks_by_id=self.perks,
-            challenge_perk_ids=self.challenge_perk_ids,
-            linked_spell_names_by_form=self.linked_spell_names_by_form,
-            linked_spell_stat_bonuses_by_form=self.linked_spell_stat_bonuses_by_form,
-            armors_by_id=self.armors_by_id,
-            weapons_by_id=self.weapons_by_id,
-        )
-        deficit_points = self._extract_max_skills_gap_points(no_books.unmet_requirements)
+        deficit_points = self._no_books_gap_points(zero_books_goal, start)
         books_needed = sum(int(v) for v in result.skill_books_used.values())
-        lead = book_reason_lines[0]
         return (
             f"{lead} Book dependency: needs {books_needed} books in this plan; "
             f"without books, max-skills misses by ~{deficit_points} points."
         )
 
+    def _no_books_gap_points(self, zero_books_goal: GoalSpec, start: StartingConditions) -> int:
+        """Max-skills gap of the zero-books plan, memoized on its planner inputs."""
+        self._check_plan_cache_scope()
+        key = self._freeze_plan_inputs(
+            self.engine.state.creation_special_points,
+            start,
+            zero_books_goal,
+        )
+        cached = self._no_books_gap_cache.pop(key, None)
+        if cached is None:
+            no_books = plan_build(
+                self.engine,
+                zero_books_goal,
+                starting=start,
+                perks_by_id=self.perks,
+                challenge_perk_ids=self.challenge_perk_ids,
+                linked_spell_names_by_form=self.linked_spell_names_by_form,
+                linked_spell_stat_bonuses_by_form=self.linked_spell_stat_bonuses_by_form,
+                armors_by_id=self.armors_by_id,
+                weapons_by_id=self.weapons_by_id,
+            )
+            cached = self._extract_max_skills_gap_points(no_books.unmet_requirements)
+        self._no_books_gap_cache[key] = cached
+        while len(self._no_books_gap_cache) > _NO_BOOKS_CACHE_SIZE:
+            del self._no_books_gap_cache[next(iter(self._no_books_gap_cache))]
+        return cached
+
     @staticmethod
     def _extract_max_skills_gap_points(unmet: list[str]) -> int:
         # Parse snippets like "(32:81, 34:81, ...)" and sum (100-value).
-        text = " | ".join(unmet)
-        pairs = re.findall(r"(\d+):(\d+)", text)
-        if not pairs:
+        if not unmet:
             return 0
-        total = 0
-        for _av, value in pairs:
-            total += max(0, 100 - int(value))
-        return total
+        return sum(max(0, 100 - int(value)) for value in _GAP_RE.findall(" | ".join(unmet)))
 
     def _requests_as_goal_specs(self) -> list[RequirementSpec]:
+        if self._goal_specs is None:
+            self._goal_specs = tuple(self._build_goal_specs())
+        return list(self._goal_specs)
+
+    def _build_goal_specs(self) -> list[RequirementSpec]:
         assert self.requests is not None
         specs: list[RequirementSpec] = []
         total = len(self.requests)
         for idx, req in enumerate(self.requests):
-            priority = max(1, total - idx) * 100
-            if req.kind == "actor_value" and req.actor_value is not None and req.value is not None:
-                specs.append(
-                    RequirementSpec(
-                        kind="actor_value",
-                        priority=priority,
-                        reason=req.reason,
-                        actor_value=req.actor_value,
-                        operator=req.operator,
-                        value=req.value,
-                    )
-                )
-            elif req.kind == "perk" and req.perk_id is not None:
-                specs.append(
-                    RequirementSpec(
-                        kind="perk",
-                        priority=priority,
-                        reason=req.reason,
-                        perk_id=req.perk_id,
-                        perk_rank=req.perk_rank,
-                    )
-                )
-            elif req.kind == "trait" and req.trait_id is not None:
-                specs.append(
-                    RequirementSpec(
-                        kind="trait",
-                        priority=priority,
-                        reason=req.reason,
-                        trait_id=req.trait_id,
-                    )
-                )
-            elif req.kind == "max_skills":
-                specs.append(
-                    RequirementSpec(
-                        kind="max_skills",
-                        priority=priority,
-                        reason=req.reason,
-                    )
-                )
-            elif req.kind == "max_crit":
-                specs.append(
-                    RequirementSpec(
-                        kind="max_crit",
-                        priority=priority,
-                        reason=req.reason,
-                    )
-                )
-            elif req.kind == "max_crit_damage":
-                specs.append(
-                    RequirementSpec(
-                        kind="max_crit_damage",
-                        priority=priority,
-                        reason=req.reason,
-                    )
-                )
-            elif req.kind == "crit_damage_potential":
-                specs.append(
-                    RequirementSpec(
-                        kind="crit_damage_potential",
-                        priority=priority,
-                        reason=req.reason,
-                        operator=req.operator,
-                        value=req.value,
-                    )
-                )
+            builder = _SPEC_BUILDERS.get(req.kind)
+            if builder is None:
+                continue
+            spec = builder(req, max(1, total - idx) * 100)
+            if spec is not None:
+                specs.append(spec)
         return specs
 
     def _requested_traits(self) -> list[int]:
-        assert self.requests is not None
+        if self._requested_trait_ids is None:
+            self._requested_trait_ids = tuple(self._collect_requested_traits())
+        return list(self._requested_trait_ids)
+
+    def _collect_requested_traits(self) -> list[int]:
+        seen: set[int] = set()
         out: list[int] = []
-        for req in self.requests:
-            if req.kind != "trait" or req.trait_id is None:
+        for req in self._requests_of_kind("trait"):
+            if req.trait_id is None:
                 continue
-            if req.trait_id in out:
+            trait_id = int(req.trait_id)
+            if trait_id in seen:
                 continue
-            out.append(int(req.trait_id))
+            seen.add(trait_id)
+            out.append(trait_id)
         return out
 
     def _requested_tagged_skills(self) -> list[int]:
-        assert self.requests is not None
+        if self._requested_tag_avs is None:
+            self._requested_tag_avs = tuple(self._collect_requested_tagged_skills())
+        return list(self._requested_tag_avs)
+
+    def _collect_requested_tagged_skills(self) -> list[int]:
+        seen: set[int] = set()
         out: list[int] = []
-        for req in self.requests:
-            if req.kind != "tagged_skill" or req.tagged_skill_av is None:
+        for req in self._requests_of_kind("tagged_skill"):
+            if req.tagged_skill_av is None:
                 continue
             av = int(req.tagged_skill_av)
             if av not in SKILL_GOVERNING_ATTRIBUTE:
                 continue
-            if av in out:
+            if av in seen:
                 continue
+            seen.add(av)
             out.append(av)
         return out
 
     def _resolved_tagged_skills(self, *, state_tags: set[int]) -> set[int]:
         direct = self._requested_tagged_skills()
         if direct:
-            chosen = list(direct)
-        elif any(r.kind == "max_skills" for r in (self.requests or [])):
-            chosen = self._auto_tagged_skills_for_max_skills()
+            primary = direct
+        elif self._has_request("max_skills"):
+            primary = self._auto_tagged_skills_for_max_skills()
         else:
-            chosen = sorted(int(av) for av in state_tags if int(av) in SKILL_GOVERNING_ATTRIBUTE)
-
-        for av in sorted(int(v) for v in state_tags):
-            if av not in SKILL_GOVERNING_ATTRIBUTE or av in chosen:
+            primary = []
+        # Top up from the current tags, then from skills in actor-value order.
+        seen: set[int] = set()
+        for av in chain(primary, sorted(int(v) for v in state_tags), _SORTED_SKILL_AVS):
+            if av not in SKILL_GOVERNING_ATTRIBUTE or av in seen:
                 continue
-            chosen.append(av)
-            if len(chosen) >= 3:
+            seen.add(av)
+            if len(seen) >= 3:
                 break
-        for av in sorted(int(v) for v in SKILL_GOVERNING_ATTRIBUTE):
-            if av in chosen:
-                continue
-            chosen.append(av)
-            if len(chosen) >= 3:
-                break
-        return set(chosen[:3])
+        return seen
 
     def _auto_tagged_skills_for_max_skills(self) -> list[int]:
+        if self._auto_tag_avs is None:
+            self._auto_tag_avs = tuple(self._pick_auto_tagged_skills())
+        return list(self._auto_tag_avs)
+
+    def _pick_auto_tagged_skills(self) -> list[int]:
         assert self.requests is not None
+        seen: set[int] = set()
         ordered: list[int] = []
         # First, prioritize explicit skill targets in request order.
-        for req in self.requests:
-            if req.kind != "actor_value" or req.actor_value is None:
+        for req in self._requests_of_kind("actor_value"):
+            if req.actor_value is None:
                 continue
             av = int(req.actor_value)
-            if av not in SKILL_GOVERNING_ATTRIBUTE or av in ordered:
+            if av not in SKILL_GOVERNING_ATTRIBUTE or av in seen:
                 continue
+            seen.add(av)
             ordered.append(av)
             if len(ordered) >= 3:
                 return ordered
@@ -1278,37 +1621,21 @@ class BuildController:
             ),
         )
         for av in candidates:
-            if av in ordered:
+            if av in seen:
                 continue
+            seen.add(av)
             ordered.append(av)
             if len(ordered) >= 3:
                 break
         return ordered
 
-    def _special_implants_by_target_av(self) -> dict[int, int]:
-        out: dict[int, int] = {}
-        for perk in self.perks.values():
-            target = self._implant_special_target(perk)
-            if target is None:
-                continue
-            out[int(target)] = int(perk.form_id)
-        return out
-
     @staticmethod
     def _implant_special_target(perk: Perk) -> int | None:
         text = f"{perk.name} {perk.editor_id} {perk.description}".lower()
         if "implant" not in text:
             return None
-        mapping = (
-            ("strength", 5),
-            ("perception", 6),
-            ("endurance", 7),
-            ("charisma", 8),
-            ("intelligence", 9),
-            ("agility", 10),
-            ("luck", 11),
-        )
-        for token, av in mapping:
-            if token in text:
-                return int(av)
+        found = set(_IMPLANT_SPECIAL_RE.findall(text))
+        for token, av in _IMPLANT_SPECIAL_TARGETS:
+            if token in found:
+                return av
         return None
@@ -0,0 +1,26 @@
+"""Helpers for the level -> actor value -> count maps shared by controllers."""
+
+from collections.abc import Mapping
+
+
+def as_int_nested(by_level: Mapping[int, Mapping[int, int]]) -> dict[int, dict[int, int]]:
+    """Copy a level -> actor value -> count map, coercing to int only if needed.
+
+    The planner already produces plain ints, so the first non-empty row decides
+    whether a shallow copy is enough.
+    """
+    for level, per_level in by_level.items():
+        if type(level) is not int:
+            break
+        if not per_level:
+            continue
+        av, value = next(iter(per_level.items()))
+        if type(av) is int and type(value) is int:
+            return {lv: dict(row) for lv, row in by_level.items()}
+        break
+    else:
+        return {lv: dict(row) for lv, row in by_level.items()}
+    return {
+        int(level): {int(av): int(value) for av, value in per_level.items()}
+        for level, per_level in by_level.items()
+    }
@@ -1,6 +1,6 @@
 """Controller for library-page browse/select flows."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Callable
 
 from fnv_planner.engine.build_engine import BuildEngine
@@ -9,6 +9,15 @@ from fnv_planner.models.effect import StatEffect
 from fnv_planner.models.item import Armor, Weapon
 from fnv_planner.ui.state import UiState
 
+_CATALOG_CACHE_SIZE = 32
+# Catalog kinds shown for each (include_armor, include_weapons) toggle pair.
+_KINDS_BY_TOGGLES: dict[tuple[bool, bool], frozenset[str]] = {
+    (True, True): frozenset({"armor", "weapon"}),
+    (True, False): frozenset({"armor"}),
+    (False, True): frozenset({"weapon"}),
+    (False, False): frozenset(),
+}
+
 
 @dataclass(slots=True)
 class LibraryController:
@@ -20,6 +29,14 @@ class LibraryController:
     weapons: dict[int, Weapon]
     state: UiState
     on_change: Callable[[], None] | None = None
+    # Armors and weapons merged for single-lookup get_item; rebuilt when either
+    # dict is replaced.
+    _items_scope: tuple = ()
+    _item_by_form: dict[int, Armor | Weapon] = field(default_factory=dict)
+    # Filtered, sorted catalog rows keyed by (query, armor, weapons); dropped
+    # when the ui model or its gear catalog changes.
+    _catalog_cache: dict[tuple[str, bool, bool], tuple[CatalogItem, ...]] = field(default_factory=dict)
+    _catalog_cache_scope: tuple = ()
 
     def refresh(self) -> None:
         """Refresh query results and selected item inspector."""
@@ -32,33 +49,47 @@ class LibraryController:
         include_armor: bool = True,
         include_weapons: bool = True,
     ) -> list[CatalogItem]:
-        items = self.ui_model.gear_catalog(query=query)
-        filtered: list[CatalogItem] = []
-        for item in items:
-            if item.kind == "armor" and not include_armor:
-                continue
-            if item.kind == "weapon" and not include_weapons:
-                continue
-            filtered.append(item)
-        return sorted(filtered, key=lambda it: (it.slot, it.kind, it.name.lower()))
+        scope = (self.ui_model, self.ui_model.gear_catalog_version)
+        if self._catalog_cache_scope != scope:
+            self._catalog_cache.clear()
+            self._catalog_cache_scope = scope
+        key = (query.strip().lower(), bool(include_armor), bool(include_weapons))
+        rows = self._catalog_cache.get(key)
+        if rows is None:
+            kinds = _KINDS_BY_TOGGLES[key[1:]]
+            items = self.ui_model.gear_catalog(query=query) if kinds else []
+            # The index keeps the sort stable without comparing items.
+            decorated = [
+                (item.slot, item.kind, item.name_lower, idx, item)
+                for idx, item in enumerate(items)
+                if item.kind in kinds
+            ]
+            decorated.sort()
+            rows = tuple(row[4] for row in decorated)
+            if len(self._catalog_cache) >= _CATALOG_CACHE_SIZE:
+                del self._catalog_cache[next(iter(self._catalog_cache))]
+            self._catalog_cache[key] = rows
+        return list(rows)
 
     def get_item(self, form_id: int) -> Armor | Weapon | None:
-        if form_id in self.armors:
-            return self.armors[form_id]
-        if form_id in self.weapons:
-            return self.weapons[form_id]
-        return None
+        return self._items().get(form_id)
 
     def equipped_slots(self) -> list[tuple[int, int, str]]:
+        items = self._items()
         rows: list[tuple[int, int, str]] = []
         for slot, form_id in sorted(self.engine.state.equipment.items()):
-            item = self.get_item(form_id)
-            if item is None:
-                rows.append((slot, form_id, f"Item {form_id:#x}"))
-            else:
-                rows.append((slot, form_id, item.name))
+            item = items.get(form_id)
+            rows.append((slot, form_id, f"Item {form_id:#x}" if item is None else item.name))
         return rows
 
+    def _items(self) -> dict[int, Armor | Weapon]:
+        scope = (self.armors, self.weapons)
+        if len(self._items_scope) != 2 or any(a is not b for a, b in zip(scope, self._items_scope)):
+            # Armor wins on a form id collision, as the old two-step lookup did.
+            self._item_by_form = {**self.weapons, **self.armors}
+            self._items_scope = scope
+        return self._item_by_form
+
     def equip_catalog_item(self, item: CatalogItem) -> tuple[bool, str | None]:
         self.engine.set_equipment(item.slot, item.form_id)
         self.refresh()
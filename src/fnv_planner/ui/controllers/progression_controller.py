@@ -1,14 +1,33 @@
 """Controller for progression-page interactions."""
 
-from dataclasses import dataclass
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 
 from fnv_planner.engine.build_engine import BuildEngine
 from fnv_planner.engine.ui_model import BuildUiModel, LevelComparison, LevelSnapshot
 from fnv_planner.models.constants import ACTOR_VALUE_NAMES
 from fnv_planner.models.perk import Perk
+from fnv_planner.ui.controllers.level_maps import as_int_nested
 from fnv_planner.ui.state import UiState
 
 
+# Display names indexed by actor value; fallbacks are formatted once here.
+_AV_NAME_TABLE = tuple(
+    ACTOR_VALUE_NAMES.get(av, f"AV{av}") for av in range(max(ACTOR_VALUE_NAMES) + 1)
+)
+
+# Bound format methods for the per-level event labels built on every snapshot.
+_BETWEEN_LEVELS_FMT = "Between L{} and L{}: {}".format
+_BOOK_EVENT_FMT = "{} +{} book(s) (+{} skill)".format
+_IMPLANT_EVENT_FMT = "{} +{} implant point(s)".format
+
+
+def _av_name(av: int) -> str:
+    return _AV_NAME_TABLE[av] if 0 <= av < len(_AV_NAME_TABLE) else f"AV{av}"
+
+
 @dataclass(slots=True)
 class ProgressionController:
     """Owns progression-page actions."""
@@ -31,18 +50,44 @@ class ProgressionController:
     implant_points_by_level: dict[int, dict[int, int]] | None = None
     zero_cost_perks_by_level: dict[int, list[str]] | None = None
     flat_skill_bonus_by_level: dict[int, dict[int, int]] | None = None
+    # Prefix sums of skill_book_usage_by_level, rebuilt when that dict is replaced.
+    _book_usage_source: dict[int, dict[int, int]] | None = None
+    _book_usage_levels: tuple[int, ...] = ()
+    _book_delta_texts: dict[int, str] = field(default_factory=dict)
+    _cumulative_book_texts: list[str | None] = field(default_factory=list)
+    # Running book points indexed directly by level, rebuilt when
+    # skill_book_points_by_level is replaced.
+    _book_points_source: dict[int, dict[int, int]] | None = None
+    _cumulative_book_points: list[dict[int, int]] = field(default_factory=list)
+    # Inputs and result of the last refresh(); equal inputs make it a no-op.
+    _refreshed_bounds: tuple = ()
 
     def __post_init__(self) -> None:
         self._sync_bounds()
         if self.to_level is None:
-            self.to_level = self.engine.state.target_level
+            self.to_level = self.engine.target_level
 
     def refresh(self) -> None:
         """Refresh progression snapshots and deltas."""
-        self._sync_bounds()
+        target_level = self.engine.target_level
+        max_level = self.engine.max_level
+        key = (target_level, max_level, self.from_level, self.to_level, self.active_level)
+        if key == self._refreshed_bounds:
+            return
+        self._sync_bounds(target_level, max_level)
+        self._clamp_bounds(target_level)
+        self._refreshed_bounds = (
+            target_level,
+            max_level,
+            self.from_level,
+            self.to_level,
+            self.active_level,
+        )
+
+    def _clamp_bounds(self, target_level: int) -> None:
         if self.to_level is None:
-            self.to_level = self.engine.state.target_level
-        self.to_level = max(self.from_level, min(self.to_level, self.engine.state.target_level))
+            self.to_level = target_level
+        self.to_level = max(self.from_level, min(self.to_level, target_level))
         if self.active_level is None:
             self.active_level = self.to_level
         self.active_level = max(self.from_level, min(self.active_level, self.to_level))
@@ -53,17 +98,17 @@ class ProgressionController:
 
     @property
     def target_level(self) -> int:
-        return self.engine.state.target_level
+        return self.engine.target_level
 
     def set_range(self, from_level: int, to_level: int) -> tuple[bool, str | None]:
         if from_level < 1 or to_level < 1:
             return False, "Levels must be >= 1"
         if from_level > to_level:
             return False, "From level must be <= To level"
-        if to_level > self.engine.state.target_level:
+        if to_level > self.engine.target_level:
             return (
                 False,
-                f"To level cannot exceed target level ({self.engine.state.target_level})",
+                f"To level cannot exceed target level ({self.engine.target_level})",
             )
         self.from_level = from_level
         self.to_level = to_level
@@ -74,7 +119,7 @@ class ProgressionController:
 
     def set_active_level(self, level: int) -> tuple[bool, str | None]:
         if self.to_level is None:
-            self.to_level = self.engine.state.target_level
+            self.to_level = self.engine.target_level
         if level < self.from_level or level > self.to_level:
             return False, f"Active level must be in range L{self.from_level}..L{self.to_level}"
         self.active_level = level
@@ -110,15 +155,11 @@ class ProgressionController:
         plan = self.engine.state.level_plans.get(level)
         if plan is None or not plan.skill_points:
             return "No allocation yet"
-        parts = []
-        for av, pts in sorted(plan.skill_points.items()):
-            name = ACTOR_VALUE_NAMES.get(av, f"AV{av}")
-            parts.append(f"{name} +{pts}")
-        return ", ".join(parts)
+        return ", ".join(f"{_av_name(av)} +{pts}" for av, pts in sorted(plan.skill_points.items()))
 
-    def _sync_bounds(self) -> None:
-        self.state.target_level = self.engine.state.target_level
-        self.state.max_level = self.engine.max_level
+    def _sync_bounds(self, target_level: int | None = None, max_level: int | None = None) -> None:
+        self.state.target_level = self.engine.target_level if target_level is None else target_level
+        self.state.max_level = self.engine.max_level if max_level is None else max_level
 
     def set_anytime_perks(self, labels: list[str]) -> None:
         self.anytime_perk_labels = list(labels)
@@ -136,38 +177,26 @@ class ProgressionController:
         needed: int,
         available: int,
         rows: list[tuple[str, int, int]],
-        by_level: dict[int, dict[int, int]] | None = None,
-        points_by_level: dict[int, dict[int, int]] | None = None,
+        by_level: Mapping[int, Mapping[int, int]] | None = None,
+        points_by_level: Mapping[int, Mapping[int, int]] | None = None,
     ) -> None:
         self.skill_books_needed = max(0, int(needed))
         self.skill_books_available = max(0, int(available))
         self.skill_book_rows_data = [(str(name), int(req), int(have)) for name, req, have in rows]
-        self.skill_book_usage_by_level = {
-            int(level): {int(av): int(count) for av, count in per_level.items()}
-            for level, per_level in (by_level or {}).items()
-        }
-        self.skill_book_points_by_level = {
-            int(level): {int(av): int(points) for av, points in per_level.items()}
-            for level, per_level in (points_by_level or {}).items()
-        }
+        self.skill_book_usage_by_level = as_int_nested(by_level or {})
+        self.skill_book_points_by_level = as_int_nested(points_by_level or {})
 
     def set_flat_skill_bonus_by_level(
         self,
         by_level: dict[int, dict[int, int]] | None,
     ) -> None:
-        self.flat_skill_bonus_by_level = {
-            int(level): {int(av): int(points) for av, points in per_level.items()}
-            for level, per_level in (by_level or {}).items()
-        }
+        self.flat_skill_bonus_by_level = as_int_nested(by_level or {})
 
     def set_implant_usage_by_level(
         self,
         by_level: dict[int, dict[int, int]] | None,
     ) -> None:
-        self.implant_points_by_level = {
-            int(level): {int(av): int(points) for av, points in per_level.items()}
-            for level, per_level in (by_level or {}).items()
-        }
+        self.implant_points_by_level = as_int_nested(by_level or {})
 
     def set_zero_cost_perks_by_level(
         self,
@@ -198,31 +227,38 @@ class ProgressionController:
         )
 
     def skill_books_timeline_label_for_level(self, level: int) -> str:
-        by_level = self.skill_book_usage_by_level or {}
-        delta = by_level.get(int(level), {})
-
-        cumulative: dict[int, int] = {}
-        for lv in sorted(by_level):
-            if int(lv) > int(level):
-                break
-            for av, count in by_level[lv].items():
-                cumulative[int(av)] = cumulative.get(int(av), 0) + max(0, int(count))
+        self._ensure_book_cumulatives()
+        delta_text = self._book_delta_texts.get(int(level))
+        idx = bisect_right(self._book_usage_levels, int(level)) - 1
+        cum_text = self._cumulative_book_texts[idx] if idx >= 0 else None
 
-        if not delta and not cumulative:
+        if delta_text is None and cum_text is None:
             return "Skill books: none"
+        return (
+            f"Skill books: {delta_text or 'none this level'}"
+            f" (cumulative: {cum_text or 'none'})"
+        )
 
-        delta_parts: list[str] = []
-        for av in sorted(delta):
-            name = ACTOR_VALUE_NAMES.get(int(av), f"AV{av}")
-            delta_parts.append(f"{name} +{int(delta[av])}")
-        cum_parts: list[str] = []
-        for av in sorted(cumulative):
-            name = ACTOR_VALUE_NAMES.get(int(av), f"AV{av}")
-            cum_parts.append(f"{name} {int(cumulative[av])}")
-
-        delta_text = ", ".join(delta_parts) if delta_parts else "none this level"
-        cum_text = ", ".join(cum_parts) if cum_parts else "none"
-        return f"Skill books: {delta_text} (cumulative: {cum_text})"
+    def _ensure_book_cumulatives(self) -> None:
+        by_level = self.skill_book_usage_by_level
+        if by_level is self._book_usage_source:
+            return
+        self._book_usage_source = by_level
+        self._book_usage_levels = tuple(sorted(by_level or {}))
+        self._book_delta_texts = {}
+        self._cumulative_book_texts = []
+        running: Counter[int] = Counter()
+        for lv in self._book_usage_levels:
+            delta = by_level[lv]
+            if delta:
+                self._book_delta_texts[lv] = ", ".join(
+                    f"{_av_name(av)} +{delta[av]}" for av in sorted(delta)
+                )
+            # update() rather than += so zero counts stay listed.
+            running.update({int(av): max(0, int(count)) for av, count in by_level[lv].items()})
+            self._cumulative_book_texts.append(
+                ", ".join(f"{_av_name(av)} {running[av]}" for av in sorted(running)) or None
+            )
 
     def skill_books_between_levels_label(self, from_level: int, to_level: int) -> str | None:
         if int(to_level) <= 1:
@@ -232,14 +268,11 @@ class ProgressionController:
         if not count_delta and not point_delta:
             return None
 
-        parts: list[str] = []
-        for av in sorted(set(count_delta) | set(point_delta)):
-            name = ACTOR_VALUE_NAMES.get(int(av), f"AV{av}")
-            books = int(count_delta.get(int(av), 0))
-            points = int(point_delta.get(int(av), 0))
-            parts.append(f"{name} +{books} book(s) (+{points} skill)")
-        detail = ", ".join(parts) if parts else "none"
-        return f"Between L{int(from_level)} and L{int(to_level)}: {detail}"
+        detail = ", ".join(
+            _BOOK_EVENT_FMT(_av_name(av), count_delta.get(av, 0), point_delta.get(av, 0))
+            for av in sorted(count_delta.keys() | point_delta.keys())
+        )
+        return _BETWEEN_LEVELS_FMT(int(from_level), int(to_level), detail)
 
     def implants_between_levels_label(self, from_level: int, to_level: int) -> str | None:
         if int(to_level) <= 1:
@@ -247,13 +280,8 @@ class ProgressionController:
         delta = (self.implant_points_by_level or {}).get(int(to_level), {})
         if not delta:
             return None
-        parts: list[str] = []
-        for av in sorted(delta):
-            name = ACTOR_VALUE_NAMES.get(int(av), f"AV{av}")
-            points = int(delta.get(int(av), 0))
-            parts.append(f"{name} +{points} implant point(s)")
-        detail = ", ".join(parts) if parts else "none"
-        return f"Between L{int(from_level)} and L{int(to_level)}: {detail}"
+        detail = ", ".join(_IMPLANT_EVENT_FMT(_av_name(av), delta[av]) for av in sorted(delta))
+        return _BETWEEN_LEVELS_FMT(int(from_level), int(to_level), detail)
 
     def zero_cost_perks_between_levels_label(self, from_level: int, to_level: int) -> str | None:
         if int(to_level) <= 1:
@@ -261,8 +289,7 @@ class ProgressionController:
         labels = (self.zero_cost_perks_by_level or {}).get(int(to_level), [])
         if not labels:
             return None
-        detail = ", ".join(labels)
-        return f"Between L{int(from_level)} and L{int(to_level)}: {detail}"
+        return _BETWEEN_LEVELS_FMT(int(from_level), int(to_level), ", ".join(labels))
 
     def effective_skills_for_level(
         self,
@@ -270,18 +297,19 @@ class ProgressionController:
         base_skills: dict[int, int],
     ) -> dict[int, int]:
         adjusted = {int(av): int(value) for av, value in base_skills.items()}
-        points = self._cumulative_book_points_up_to_level(level)
-        for av, bonus in points.items():
-            if int(av) not in adjusted:
-                continue
-            adjusted[int(av)] = int(adjusted[int(av)]) + int(bonus)
-        flats = self._flat_skill_bonus_at_level(level)
-        for av, bonus in flats.items():
-            if int(av) not in adjusted:
-                continue
-            adjusted[int(av)] = int(adjusted[int(av)]) + int(bonus)
-        for av in list(adjusted):
-            adjusted[int(av)] = max(0, min(100, int(adjusted[int(av)])))
+        for bonuses in (
+            self._cumulative_book_points_up_to_level(level),
+            self._flat_skill_bonus_at_level(level),
+        ):
+            for av, bonus in bonuses.items():
+                if av in adjusted:
+                    adjusted[av] += bonus
+        # Clamp in place; only values change, so iterating while writing is safe.
+        for av, value in adjusted.items():
+            if value < 0:
+                adjusted[av] = 0
+            elif value > 100:
+                adjusted[av] = 100
         return adjusted
 
     def actor_value_description(self, actor_value: int) -> str | None:
@@ -294,22 +322,38 @@ class ProgressionController:
     def snapshot_stats_tooltip(self) -> str:
         rows: list[str] = []
         for av in (16, 12, 14):
-            name = ACTOR_VALUE_NAMES.get(int(av), f"AV{av}")
-            desc = self.actor_value_description(int(av))
+            desc = self.actor_value_description(av)
             if desc:
-                rows.append(f"{name}: {desc}")
+                rows.append(f"{_AV_NAME_TABLE[av]}: {desc}")
         return "\n".join(rows)
 
     def _cumulative_book_points_up_to_level(self, level: int) -> dict[int, int]:
-        points_by_level = self.skill_book_points_by_level or {}
-        cumulative: dict[int, int] = {}
-        for lv in sorted(points_by_level):
-            if int(lv) > int(level):
-                break
-            for av, points in points_by_level[lv].items():
-                cumulative[int(av)] = cumulative.get(int(av), 0) + max(0, int(points))
-        return cumulative
+        """Book points earned through `level`; shared, so callers must not mutate it."""
+        if not self.skill_book_points_by_level:
+            return {}
+        self._ensure_book_point_cumulatives()
+        table = self._cumulative_book_points
+        if int(level) < 0 or not table:
+            return {}
+        return table[min(int(level), len(table) - 1)]
+
+    def _ensure_book_point_cumulatives(self) -> None:
+        points_by_level = self.skill_book_points_by_level
+        if points_by_level is self._book_points_source:
+            return
+        self._book_points_source = points_by_level
+        self._cumulative_book_points = []
+        running: Counter[int] = Counter()
+        current: dict[int, int] = {}
+        for lv in range(max(points_by_level or {}, default=-1) + 1):
+            row = points_by_level.get(lv)
+            if row:
+                running.update({int(av): max(0, int(points)) for av, points in row.items()})
+                current = dict(running)
+            # Levels without books share the previous level's dict.
+            self._cumulative_book_points.append(current)
 
     def _flat_skill_bonus_at_level(self, level: int) -> dict[int, int]:
         by_level = self.flat_skill_bonus_by_level or {}
-        return {int(av): int(points) for av, points in by_level.get(int(level), {}).items()}
+        # Values were coerced on the way in; callers only read the row.
+        return by_level.get(int(level), {})
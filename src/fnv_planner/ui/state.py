@@ -1,10 +1,10 @@
 """Shared UI state and lightweight app metadata."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class PluginSourceState:
     """Tracks where plugin data is loaded from."""
 
@@ -12,6 +12,10 @@ class PluginSourceState:
     primary_esm: Path | None = None
 
 
+# Immutable, so every UiState can share it instead of allocating its own.
+_DEFAULT_PLUGIN_SOURCE = PluginSourceState()
+
+
 @dataclass(slots=True)
 class UiState:
     """Top-level app state used by controllers and views."""
@@ -21,4 +25,4 @@ class UiState:
     max_level: int = 1
     game_variant: str = "fallout-nv"
     banner_title: str = "FNV Planner"
-    plugin_source: PluginSourceState = field(default_factory=PluginSourceState)
+    plugin_source: PluginSourceState = _DEFAULT_PLUGIN_SOURCE
@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from fnv_planner.models.constants import ACTOR_VALUE_NAMES
+from fnv_planner.models.constants import ACTOR_VALUE_NAMES, SKILL_INDICES
 from fnv_planner.models.item import Armor, Weapon
 from fnv_planner.ui.bootstrap import BuildSession, bootstrap_default_session
 from fnv_planner.ui.controllers.build_controller import BuildController
@@ -16,6 +16,9 @@ from fnv_planner.ui.controllers.progression_controller import ProgressionControl
 from fnv_planner.ui.state import UiState
 
 
+_SKILL_AV_NAMES = tuple((av, ACTOR_VALUE_NAMES.get(av, f"AV{av}")) for av in sorted(SKILL_INDICES))
+
+
 def _stats_payload(stats) -> dict[str, Any]:
     return {
         "hit_points": int(stats.hit_points),
@@ -98,9 +101,9 @@ def build_webui_state_from_controllers(
                 "allocation_label": progression.skill_allocation_label_for_level(snap.level),
                 "stats": _stats_payload(snap.stats),
                 "skills": {
-                    ACTOR_VALUE_NAMES.get(int(av), f"AV{av}"): int(val)
-                    for av, val in sorted(effective_skills.items())
-                    if 32 <= int(av) <= 45
+                    name: int(effective_skills[av])
+                    for av, name in _SKILL_AV_NAMES
+                    if av in effective_skills
                 },
                 "event_skill_books": progression.skill_books_between_levels_label(
                     max(1, snap.level - 1), snap.level
@@ -133,6 +136,7 @@ def build_webui_state_from_controllers(
         )
 
     special_used, special_remaining = build.special_totals()
+    request_kinds = {req["kind"] for req in request_entries}
 
     perk_rows = build.perk_rows("")
     perk_statuses = build.perk_request_statuses(sorted(int(v) for v in selected_perk_ids))
@@ -213,9 +217,9 @@ def build_webui_state_from_controllers(
             },
             "meta": {
                 "fill_perk_slots": True,
-                "max_skills": any(req["kind"] == "max_skills" for req in request_entries),
-                "max_crit": any(req["kind"] == "max_crit" for req in request_entries),
-                "max_crit_damage": any(req["kind"] == "max_crit_damage" for req in request_entries),
+                "max_skills": "max_skills" in request_kinds,
+                "max_crit": "max_crit" in request_kinds,
+                "max_crit_damage": "max_crit_damage" in request_kinds,
             },
             "request_controls": {
                 "actor_values": actor_value_controls,
@@ -253,12 +257,13 @@ def build_webui_state_from_controllers(
                 {"name": name, "level": int(level), "source": source}
                 for name, level, source in build.selected_perks_rows()
             ],
+            # sync_progression_from_build already pulled these from the build.
             "skill_books": {
-                "needed": int(build.needed_skill_books()),
-                "available": int(build.total_skill_books()),
+                "needed": progression.skill_books_needed,
+                "available": progression.skill_books_available,
                 "rows": [
-                    {"skill": name, "needed": int(needed), "available": int(available)}
-                    for name, needed, available in build.skill_book_rows()
+                    {"skill": name, "needed": needed, "available": available}
+                    for name, needed, available in progression.skill_book_rows_data or []
                 ],
             },
             "perk_rationale": list(build.perk_reason_rows()),
@@ -273,6 +278,9 @@ def build_webui_state_from_controllers(
         "library": {
             "perks": perk_payload,
             "selected_perk_ids": [int(v) for v in sorted(selected_perk_ids)],
+            # Changes only when the gear catalog is replaced; lets the page
+            # tell an equip/clear refresh from a new catalog.
+            "gear_version": int(library.ui_model.gear_catalog_version),
             "gear": gear_payload,
             "equipped": equipped_payload,
         },
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import json
 import threading
+from collections.abc import Callable
 import webbrowser
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from functools import partial
 from http import HTTPStatus
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
@@ -73,27 +75,40 @@ class WebUiRuntime:
             state=state,
         )
 
-        if include_max_skills:
-            self.build.add_max_skills_request()
-        if include_max_crit:
-            self.build.add_max_crit_request()
-        if include_max_crit_damage:
-            self.build.add_max_crit_damage_request()
+        with self.build.batch():
+            if include_max_skills:
+                self.build.add_max_skills_request()
+            if include_max_crit:
+                self.build.add_max_crit_request()
+            if include_max_crit_damage:
+                self.build.add_max_crit_damage_request()
 
         self._lock = threading.RLock()
+        self._snapshot: dict | None = None
 
     def snapshot(self) -> dict:
+        """Current state payload with a fresh generated_at.
+
+        The export is rebuilt only after an action has been applied, so page
+        loads and polling between actions do not re-run it. Each call returns
+        a new top-level dict; the nested sections are shared between callers
+        and must not be mutated.
+        """
         with self._lock:
-            return build_webui_state_from_controllers(
-                session=self.session,
-                state=self.state,
-                build=self.build,
-                progression=self.progression,
-                library=self.library,
-            )
+            if self._snapshot is None:
+                self._snapshot = build_webui_state_from_controllers(
+                    session=self.session,
+                    state=self.state,
+                    build=self.build,
+                    progression=self.progression,
+                    library=self.library,
+                )
+            return {**self._snapshot, "generated_at": datetime.now(timezone.utc).isoformat()}
 
     def apply(self, path: str, payload: dict) -> ActionResult:
         with self._lock:
+            # Even rejected actions may have touched controller state.
+            self._snapshot = None
             if path == "/api/requests/actor-value":
                 return self._action_actor_value(payload)
             if path == "/api/requests/crit-damage":
@@ -199,10 +214,46 @@ class WebUiRuntime:
         return ActionResult(ok=True)
 
 
+class BackgroundRuntime:
+    """Builds a WebUiRuntime on a worker thread so static files serve immediately.
+
+    API calls block until the runtime is ready; bootstrap failures are
+    re-raised to every caller as RuntimeError.
+    """
+
+    def __init__(self, factory: Callable[[], WebUiRuntime]) -> None:
+        self._factory = factory
+        self._runtime: WebUiRuntime | None = None
+        self._error: BaseException | None = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._load, name="webui-bootstrap", daemon=True)
+        self._thread.start()
+
+    def _load(self) -> None:
+        try:
+            self._runtime = self._factory()
+        except BaseException as exc:  # surfaced to callers via get()
+            self._error = exc
+        finally:
+            self._ready.set()
+
+    def get(self) -> WebUiRuntime:
+        self._ready.wait()
+        if self._runtime is None:
+            raise RuntimeError(f"Planner runtime failed to load: {self._error}") from self._error
+        return self._runtime
+
+    def snapshot(self) -> dict:
+        return self.get().snapshot()
+
+    def apply(self, path: str, payload: dict) -> ActionResult:
+        return self.get().apply(path, payload)
+
+
 class WebUiRequestHandler(SimpleHTTPRequestHandler):
     """Static-file handler with JSON API routes."""
 
-    def __init__(self, *args, runtime: WebUiRuntime, directory: str, **kwargs):
+    def __init__(self, *args, runtime: WebUiRuntime | BackgroundRuntime, directory: str, **kwargs):
         self._runtime = runtime
         super().__init__(*args, directory=directory, **kwargs)
 
@@ -218,7 +269,12 @@ class WebUiRequestHandler(SimpleHTTPRequestHandler):
     def do_GET(self) -> None:  # noqa: N802
         path = urlparse(self.path).path
         if path in {"/api/state", "/state.json"}:
-            self._send_json(self._runtime.snapshot())
+            try:
+                snapshot = self._runtime.snapshot()
+            except RuntimeError as exc:
+                self._send_json({"ok": False, "message": str(exc)}, status=HTTPStatus.SERVICE_UNAVAILABLE)
+                return
+            self._send_json(snapshot)
             return
         super().do_GET()
 
@@ -244,7 +300,11 @@ class WebUiRequestHandler(SimpleHTTPRequestHandler):
             self._send_json({"ok": False, "message": "JSON body must be an object"}, status=HTTPStatus.BAD_REQUEST)
             return
 
-        result = self._runtime.apply(path, payload)
+        try:
+            result = self._runtime.apply(path, payload)
+        except RuntimeError as exc:
+            self._send_json({"ok": False, "message": str(exc)}, status=HTTPStatus.SERVICE_UNAVAILABLE)
+            return
         response = {
             "ok": bool(result.ok),
             "message": result.message,
@@ -257,7 +317,7 @@ class WebUiRequestHandler(SimpleHTTPRequestHandler):
 def write_state(
     path: Path = STATE_PATH,
     *,
-    runtime: WebUiRuntime | None = None,
+    runtime: WebUiRuntime | BackgroundRuntime | None = None,
     plugin_paths: list[Path] | None = None,
 ) -> dict:
     """Write a one-shot JSON snapshot for offline inspection."""
@@ -272,7 +332,7 @@ def make_server(
     port: int,
     directory: Path = WEBUI_DIR,
     *,
-    runtime: WebUiRuntime | None = None,
+    runtime: WebUiRuntime | BackgroundRuntime | None = None,
 ) -> ThreadingHTTPServer:
     active_runtime = runtime or WebUiRuntime()
     handler = partial(
@@ -292,14 +352,24 @@ def serve(
     open_browser: bool = True,
     plugin_paths: list[Path] | None = None,
 ) -> None:
-    runtime = WebUiRuntime(plugin_paths=plugin_paths)
-    state = write_state(STATE_PATH, runtime=runtime)
+    # Plugin parsing takes seconds; serve the page shell right away and let
+    # /api/state wait for the runtime instead of blocking startup on it.
+    runtime = BackgroundRuntime(partial(WebUiRuntime, plugin_paths=plugin_paths))
     server = make_server(host, port, WEBUI_DIR, runtime=runtime)
     url = f"http://{host}:{port}/index.html"
-    print(f"State written: {STATE_PATH}")
-    print(f"Target level: {state['app']['target_level']} | plugin mode: {state['app']['plugin_mode']}")
     print(f"Serving {WEBUI_DIR} at {url}")
 
+    def _report_loaded() -> None:
+        try:
+            state = write_state(STATE_PATH, runtime=runtime)
+        except RuntimeError as exc:
+            print(exc)
+            return
+        print(f"State written: {STATE_PATH}")
+        print(f"Target level: {state['app']['target_level']} | plugin mode: {state['app']['plugin_mode']}")
+
+    threading.Thread(target=_report_loaded, name="webui-state-writer", daemon=True).start()
+
     if open_browser:
         webbrowser.open(url)
 
@@ -4,7 +4,7 @@ import struct
 
 import pytest
 
-from fnv_planner.parser.binary_reader import BinaryReader
+from fnv_planner.parser.binary_reader import BinaryReader, decode_zstring
 
 
 def test_uint8():
@@ -130,3 +130,18 @@ def test_seek():
     assert r.uint32() == 300
     r.seek(0)
     assert r.uint32() == 100
+
+
+def test_memoryview_reads_return_bytes():
+    r = BinaryReader(memoryview(b"GRUPhello\x00"))
+    assert r.bytes(4) == b"GRUP"
+    assert type(r.bytes(0)) is bytes
+    assert r.cstring() == "hello"
+
+
+def test_decode_zstring_cuts_at_first_nul():
+    assert decode_zstring(b"Toughness\x00") == "Toughness"
+    assert decode_zstring(b"Name\x00\x00junk") == "Name"
+    assert decode_zstring(b"unterminated") == "unterminated"
+    assert decode_zstring(b"") == ""
+    assert decode_zstring(b"bad\xff\x00") == "bad�"
@@ -0,0 +1,161 @@
+"""Tests for UI bootstrap helpers — synthetic plugin files only."""
+
+import struct
+import threading
+import warnings
+
+import pytest
+
+from fnv_planner.parser.avif_parser import parse_all_avifs
+from fnv_planner.parser.plugin_merge import parse_records_merged
+from fnv_planner.ui import bootstrap
+from fnv_planner.ui.bootstrap import (
+    _normalize_token,
+    _parse_merged_tables,
+    _parse_plugin_tables,
+)
+
+
+def _tes4() -> bytes:
+    return struct.pack("<4sIIIIHH", b"TES4", 0, 0, 0, 0, 0, 0)
+
+
+def _avif_record(form_id: int, editor_id: str) -> bytes:
+    payload = editor_id.encode("ascii") + b"\x00"
+    body = struct.pack("<4sH", b"EDID", len(payload)) + payload
+    return struct.pack("<4sIIIIHH", b"AVIF", len(body), 0, form_id, 0, 0, 0) + body
+
+
+def _grup(label: str, records: list[bytes]) -> bytes:
+    body = b"".join(records)
+    return struct.pack("<4sI4sIII", b"GRUP", 24 + len(body), label.encode("ascii"), 0, 0, 0) + body
+
+
+def test_parse_merged_tables_last_plugin_wins(tmp_path):
+    base = tmp_path / "Base.esm"
+    base.write_bytes(_tes4() + _grup("AVIF", [_avif_record(1, "AVBase"), _avif_record(2, "AVKeep")]))
+    patch = tmp_path / "Patch.esp"
+    patch.write_bytes(_tes4() + _grup("AVIF", [_avif_record(1, "AVPatched")]))
+    paths = [base, patch]
+    datas = [p.read_bytes() for p in paths]
+
+    tables = _parse_merged_tables(paths, datas, max_workers=2)
+
+    assert set(tables) == {"perks", "armors", "weapons", "books", "avifs"}
+    assert tables["perks"] == []
+    avifs = {a.form_id: a.editor_id for a in tables["avifs"]}
+    assert avifs == {1: "AVPatched", 2: "AVKeep"}
+    expected = parse_records_merged(datas, parse_all_avifs, missing_group_ok=True)
+    assert [a.editor_id for a in tables["avifs"]] == [a.editor_id for a in expected]
+
+    base_tables, patch_tables = (_parse_plugin_tables(d) for d in datas)
+    assert [a.editor_id for a in base_tables["avifs"]] == ["AVBase", "AVKeep"]
+    assert [a.editor_id for a in patch_tables["avifs"]] == ["AVPatched"]
+    assert patch_tables["perks"] == []
+
+
+def test_parse_merged_tables_from_worker_thread(tmp_path):
+    paths = [tmp_path / "Base.esm", tmp_path / "Patch.esp"]
+    paths[0].write_bytes(_tes4() + _grup("AVIF", [_avif_record(1, "AVBase")]))
+    paths[1].write_bytes(_tes4() + _grup("AVIF", [_avif_record(2, "AVPatch")]))
+    datas = [p.read_bytes() for p in paths]
+    idle = threading.Event()
+    bystander = threading.Thread(target=idle.wait, daemon=True)
+    bystander.start()
+    outcome: dict[str, object] = {}
+
+    def _run() -> None:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            outcome["tables"] = _parse_merged_tables(paths, datas, max_workers=2)
+        outcome["warnings"] = [str(w.message) for w in caught]
+
+    worker = threading.Thread(target=_run)
+    worker.start()
+    worker.join(timeout=60)
+    idle.set()
+
+    assert not worker.is_alive()
+    assert not [msg for msg in outcome["warnings"] if "fork()" in msg]
+    assert [a.editor_id for a in outcome["tables"]["avifs"]] == ["AVBase", "AVPatch"]
+
+
+def test_parse_merged_tables_runs_serially_for_one_plugin_or_when_spawn_fails(tmp_path, monkeypatch):
+    paths = [tmp_path / "Base.esm", tmp_path / "Patch.esp"]
+    paths[0].write_bytes(_tes4() + _grup("AVIF", [_avif_record(1, "AVBase")]))
+    paths[1].write_bytes(_tes4() + _grup("AVIF", [_avif_record(1, "AVPatched")]))
+    datas = [p.read_bytes() for p in paths]
+    pools: list[int] = []
+
+    def _refusing_pool(*_args, **kwargs):
+        pools.append(kwargs["max_workers"])
+        raise RuntimeError("__main__ is not import-safe")
+
+    monkeypatch.setattr(bootstrap, "ProcessPoolExecutor", _refusing_pool)
+
+    single = _parse_merged_tables(paths[:1], datas[:1], max_workers=8)
+    assert [a.editor_id for a in single["avifs"]] == ["AVBase"]
+    assert pools == []
+
+    merged = _parse_merged_tables(paths, datas, max_workers=8)
+    assert [a.editor_id for a in merged["avifs"]] == ["AVPatched"]
+    assert pools == [2]
+
+
+def test_normalize_token_keeps_only_lowercase_alphanumerics():
+    assert _normalize_token("Energy Weapons") == "energyweapons"
+    assert _normalize_token("Melee_Weapons-2!") == "meleeweapons2"
+    assert _normalize_token("Ünarmed") == "narmed"
+
+
+def test_load_plugin_data_reuses_disk_cache(tmp_path, monkeypatch):
+    plugin = tmp_path / "Base.esm"
+    plugin.write_bytes(_tes4() + _grup("AVIF", [_avif_record(1, "AVBase")]))
+    monkeypatch.setenv("FNV_PLANNER_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("FNV_PLANNER_NO_CACHE", raising=False)
+
+    first = bootstrap._load_plugin_data([plugin])
+    assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+
+    def _no_parse(*_args, **_kwargs):
+        raise AssertionError("cache hit expected")
+
+    monkeypatch.setattr(bootstrap, "_parse_plugin_data", _no_parse)
+    second = bootstrap._load_plugin_data([plugin])
+    assert second.gmst._values == first.gmst._values
+    assert second.perk_list == first.perk_list
+
+    # Changing the parser sources invalidates the entry.
+    monkeypatch.setattr(bootstrap, "_plugin_cache_source_digest", lambda: "edited-parser")
+    with pytest.raises(AssertionError, match="cache hit expected"):
+        bootstrap._load_plugin_data([plugin])
+
+    # Changing the plugin invalidates the entry.
+    plugin.write_bytes(_tes4() + _grup("AVIF", [_avif_record(1, "AVBase"), _avif_record(2, "AVMore")]))
+    with pytest.raises(AssertionError, match="cache hit expected"):
+        bootstrap._load_plugin_data([plugin])
+
+
+def test_load_plugin_data_keeps_one_cache_entry_and_ignores_corrupt_ones(tmp_path, monkeypatch):
+    plugin = tmp_path / "Base.esm"
+    plugin.write_bytes(_tes4() + _grup("AVIF", [_avif_record(1, "AVBase")]))
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / "notes.pkl").write_bytes(b"not ours")
+    monkeypatch.setenv("FNV_PLANNER_CACHE_DIR", str(cache_dir))
+    monkeypatch.delenv("FNV_PLANNER_NO_CACHE", raising=False)
+
+    bootstrap._load_plugin_data([plugin])
+    first_entry = next(p for p in cache_dir.glob("*.pkl") if p.name != "notes.pkl")
+    plugin.write_bytes(_tes4() + _grup("AVIF", [_avif_record(1, "AVBase"), _avif_record(2, "AVMore")]))
+    bootstrap._load_plugin_data([plugin])
+
+    entries = sorted(p.name for p in cache_dir.glob("*.pkl"))
+    assert len(entries) == 2 and "notes.pkl" in entries
+    assert first_entry.name not in entries
+
+    # A corrupt entry is a miss: the stack is re-parsed and the entry rewritten.
+    entry = cache_dir / next(n for n in entries if n != "notes.pkl")
+    entry.write_bytes(b"\x80garbage")
+    bootstrap._load_plugin_data([plugin])
+    assert entry.read_bytes() != b"\x80garbage"
@@ -1,3 +1,5 @@
+import pytest
+
 from fnv_planner.engine.build_engine import BuildEngine
 from fnv_planner.engine.ui_model import BuildUiModel
 from fnv_planner.graph.dependency_graph import DependencyGraph
@@ -5,6 +7,7 @@ from fnv_planner.models.constants import ActorValue
 from fnv_planner.models.game_settings import GameSettings
 from fnv_planner.models.perk import Perk
 from fnv_planner.optimizer.planner import PlanResult
+from fnv_planner.ui.controllers import build_controller
 from fnv_planner.ui.controllers.build_controller import BuildController
 from fnv_planner.ui.state import UiState
 
@@ -45,6 +48,42 @@ def _controller(
     )
 
 
+def _perk(
+    form_id: int,
+    name: str,
+    *,
+    description: str = "",
+    is_trait: bool = False,
+    min_level: int = 2,
+    is_playable: bool = True,
+    is_hidden: bool = False,
+) -> Perk:
+    return Perk(
+        form_id=form_id,
+        editor_id=name.replace(" ", ""),
+        name=name,
+        description=description,
+        is_trait=is_trait,
+        min_level=min_level,
+        ranks=1,
+        is_playable=is_playable,
+        is_hidden=is_hidden,
+    )
+
+
+def _count_plan_builds(monkeypatch) -> list[int]:
+    """Wrap the controller's plan_build; the returned list grows once per call."""
+    calls: list[int] = []
+    real_plan_build = build_controller.plan_build
+
+    def _counting_plan_build(*args, **kwargs):
+        calls.append(1)
+        return real_plan_build(*args, **kwargs)
+
+    monkeypatch.setattr(build_controller, "plan_build", _counting_plan_build)
+    return calls
+
+
 def test_max_skills_auto_selects_tagged_skills():
     c = _controller(
         {
@@ -386,3 +425,423 @@ def test_perk_request_statuses_primary_vs_secondary(monkeypatch):
     assert statuses[int(green.form_id)]["status"] == "green"
     assert statuses[int(yellow.form_id)]["status"] == "yellow"
     assert statuses[int(red.form_id)]["status"] == "red"
+
+
+def test_recompute_plan_reuses_cached_planner_outcome(monkeypatch):
+    c = _controller({int(AV.SCIENCE): 2})
+    calls = _count_plan_builds(monkeypatch)
+
+    c.add_actor_value_request(int(AV.GUNS), 60, reason="gate")
+    state_after_add = c.engine.state
+    message_after_add = c.feasibility_warning()
+    c.set_target_level(c.max_level)
+    c.set_target_level(c.max_level)
+    runs = len(calls)
+    c.set_target_level(c.max_level)
+    assert len(calls) == runs
+    assert c.engine.state == state_after_add
+    assert c.feasibility_warning() == message_after_add
+
+    # A new request misses; removing it again lands back on a cached key.
+    c.add_actor_value_request(int(AV.SCIENCE), 70, reason="second")
+    assert len(calls) > runs
+    runs = len(calls)
+    c.remove_priority_request(1)
+    assert len(calls) == runs
+    assert c.feasibility_warning() == message_after_add
+
+
+def test_batch_coalesces_replans_and_notifications(monkeypatch):
+    c = _controller({})
+    notified: list[int] = []
+    c.on_change = lambda: notified.append(1)
+    calls = _count_plan_builds(monkeypatch)
+
+    with c.batch():
+        c.set_tagged_skill_requests({int(AV.SCIENCE), int(AV.MEDICINE), int(AV.REPAIR)})
+        with c.batch():
+            c.add_actor_value_request(int(AV.SCIENCE), 60, reason="nested")
+        c.add_max_skills_request()
+        assert calls == []
+        assert notified == []
+
+    assert len(calls) == 1  # no skill books, so no book-dependency probe
+    assert notified == [1]
+    names = {name for name, _source in c.selected_tagged_skills_rows()}
+    assert names == {"Science", "Medicine", "Repair"}
+
+
+def test_perk_pickers_use_sorted_index_and_rebuild_when_perks_change():
+    late = _perk(0x7401, "Alpha", min_level=8)
+    early = _perk(0x7402, "beta", min_level=2)
+    challenge = _perk(0x7403, "Aardvark", min_level=2)
+    trait = _perk(0x7404, "Wild Wasteland", min_level=1, is_trait=True)
+    c = _controller({}, perks={p.form_id: p for p in [late, early, challenge, trait]})
+    c.challenge_perk_ids = {challenge.form_id}
+
+    assert [row[1] for row in c.perk_options()] == ["beta", "Alpha", "Aardvark"]
+    assert [row[2] for row in c.perk_options()] == ["normal", "normal", "challenge"]
+    assert [row[1] for row in c.perk_rows("ALP")] == ["Alpha"]
+    assert c.perk_rows("aardvark") == [(challenge.form_id, "Aardvark", "challenge", False)]
+    assert [row[0] for row in c.perk_rows("  ")] == [early.form_id, late.form_id, challenge.form_id]
+    assert [row[1] for row in c.perk_rows("a")] == ["beta", "Alpha", "Aardvark"]
+    assert c.perk_rows("beta\nalpha") == []
+    assert c.trait_options() == [(trait.form_id, "Wild Wasteland")]
+
+    ok, _message = c.add_trait_request_by_query("wastel")
+    assert ok is True
+    ok, _message = c.add_perk_request_by_query("a")
+    assert ok is True
+    assert c.selected_perk_ids() == {challenge.form_id}
+    assert c.perk_rows("aard")[0][3] is True
+
+    c.perks = {early.form_id: early}
+    assert [row[1] for row in c.perk_options()] == ["beta"]
+    assert c.trait_options() == []
+
+
+def test_option_lists_are_cached_but_returned_as_fresh_lists():
+    c = _controller({})
+    tagged = c.tagged_skill_options()
+    assert [av for av, _name in tagged] == sorted(av for av, _name in tagged)
+    tagged.clear()
+    assert c.tagged_skill_options()
+    traits = c.trait_options()
+    traits.append((1, "x"))
+    assert c.trait_options() == []
+
+
+def test_request_indexes_track_moves_and_removals():
+    c = _controller({})
+    c.set_desired_perk_selected(0x7501, True)
+    c.add_max_skills_request()
+    c.set_desired_perk_selected(0x7502, True)
+    c.set_trait_requests(set())
+    assert c.selected_perk_ids() == {0x7501, 0x7502}
+
+    c.move_priority_request(2, -2)
+    assert [req["kind"] for req in c.priority_request_payloads()] == ["perk", "perk", "max_skills"]
+    c.set_desired_perk_selected(0x7501, False)
+    assert [req["perk_id"] for req in c.priority_request_payloads()] == [0x7502, None]
+    assert c.selected_perk_ids() == {0x7502}
+
+    c.set_meta_request_enabled("max_skills", False)
+    assert all(req["kind"] != "max_skills" for req in c.priority_request_payloads())
+    c.remove_priority_request(0)
+    assert c.selected_perk_ids() == set()
+    assert c.priority_request_payloads() == []
+
+
+def test_add_perk_request_by_query_prefers_exact_name_or_editor_id():
+    broad = _perk(0x7601, "Almost Educated")
+    exact = _perk(0x7602, "Educated")
+    c = _controller({}, perks={broad.form_id: broad, exact.form_id: exact})
+
+    ok, _message = c.add_perk_request_by_query("EDUCATED")
+    assert ok is True
+    assert c.selected_perk_ids() == {exact.form_id}
+
+    ok, _message = c.add_perk_request_by_query("almost")
+    assert ok is True
+    assert c.selected_perk_ids() == {exact.form_id, broad.form_id}
+
+
+def test_query_matching_returns_first_substring_hit_in_name_order():
+    gunslinger = _perk(0x7701, "Gunslinger")
+    rapid = _perk(0x7702, "Rapid Reload")
+    wild = _perk(0x7703, "Wild Wasteland", is_trait=True)
+    c = _controller({}, perks={p.form_id: p for p in [gunslinger, rapid, wild]})
+    c._ensure_perk_index()
+
+    assert c._first_perk_matching("rapid rel", c._build_perks_by_name, {"normal"}) is rapid
+    assert c._first_perk_matching("slinger", c._build_perks_by_name, {"normal"}) is gunslinger
+    assert c._first_perk_matching("wild", c._build_perks_by_name, {"normal"}) is None
+    assert c._first_perk_matching("wild", c._sorted_traits, {"trait"}) is wild
+    assert c._first_perk_matching("reload rapid", c._build_perks_by_name, {"normal"}) is None
+
+    # A mid-word match earlier in name order beats a later word-start match.
+    betray = _perk(0x7704, "Betray")
+    ray_gun = _perk(0x7705, "Ray Gun Master")
+    c = _controller({}, perks={p.form_id: p for p in [betray, ray_gun]})
+    c._ensure_perk_index()
+    assert c._first_perk_matching("ray", c._build_perks_by_name, {"normal"}) is betray
+    assert c._first_perk_matching("ray gun", c._build_perks_by_name, {"normal"}) is ray_gun
+
+
+def test_flat_skill_bonuses_by_level_accumulates_traits_then_level_perks():
+    from fnv_planner.engine.build_engine import LevelPlan
+
+    c = _controller({})
+    c._flat_skill_bonus_by_id = {
+        0x7801: (1, ()),
+        0x7802: (0, ((int(AV.GUNS), 5),)),
+    }
+    state = c.engine.state
+    state.traits = [0x7801]
+    state.target_level = 4
+    state.level_plans = {
+        2: LevelPlan(level=2, perk=0x7802),
+        4: LevelPlan(level=4, perk=0x7802),
+    }
+    c.engine.replace_state(state)
+
+    by_level = c.flat_skill_bonuses_by_level()
+    assert sorted(by_level) == [1, 2, 3, 4]
+    assert by_level[1][int(AV.GUNS)] == 1
+    assert by_level[1][int(AV.SCIENCE)] == 1
+    assert by_level[3][int(AV.GUNS)] == 6
+    assert by_level[4][int(AV.GUNS)] == 11
+    assert by_level[4][int(AV.SCIENCE)] == 1
+
+
+def test_inferred_perk_effects_are_cached_per_controller_until_tables_change(monkeypatch):
+    perk = _perk(0x7901, "Educated", description="Gain two more skill points every time you level up.")
+    c = _controller({}, perks={perk.form_id: perk})
+    calls: list[int] = []
+    real_infer = build_controller._infer_perk_skill_effects
+
+    def _counting_infer(*args, **kwargs):
+        calls.append(1)
+        return real_infer(*args, **kwargs)
+
+    monkeypatch.setattr(build_controller, "_infer_perk_skill_effects", _counting_infer)
+    c.flat_skill_bonuses_by_level()
+    assert calls == []
+
+    c.linked_spell_names_by_form = {}
+    c.flat_skill_bonuses_by_level()
+    assert calls == [1]
+    c.flat_skill_bonuses_by_level()
+    assert calls == [1]
+
+    # A second controller never sees the first one's inferences.
+    _controller({}, perks={perk.form_id: perk})
+    assert calls == [1, 1]
+
+
+def test_skill_book_rows_merge_available_and_used_in_actor_value_order():
+    c = _controller({int(AV.SCIENCE): 2, int(AV.BARTER): 0, int(AV.GUNS): 1})
+    c._last_skill_books_used = {int(AV.SCIENCE): 1, int(AV.SPEECH): 3}
+
+    rows = c.skill_book_rows()
+
+    expected_avs = sorted([int(AV.SCIENCE), int(AV.GUNS), int(AV.SPEECH)])
+    names = {int(AV.SCIENCE): "Science", int(AV.GUNS): "Guns", int(AV.SPEECH): "Speech"}
+    assert [row[0] for row in rows] == [names[av] for av in expected_avs]
+    assert ("Science", 1, 2) in rows
+    assert ("Speech", 3, 0) in rows
+
+
+def test_skill_book_level_maps_are_read_only_views():
+    c = _controller({int(AV.SCIENCE): 4})
+    c.add_max_skills_request()
+
+    view = c.skill_book_usage_by_level()
+    assert view == {50: {int(AV.SCIENCE): 4}}
+    with pytest.raises(TypeError):
+        view[4] = {}  # type: ignore[index]
+    with pytest.raises(TypeError):
+        view[50][int(AV.SCIENCE)] = 99  # type: ignore[index]
+    assert c.skill_book_usage_by_level()[50][int(AV.SCIENCE)] == 4
+
+
+def test_set_target_level_skips_replan_when_plan_is_current(monkeypatch):
+    c = _controller({})
+    notified: list[int] = []
+    c.on_change = lambda: notified.append(1)
+    calls = _count_plan_builds(monkeypatch)
+
+    ok, message = c.set_target_level(c.max_level - 1)
+    assert ok is False
+    assert message is not None
+    assert calls == [] and notified == []
+
+    # Settle on a fixed point; afterwards re-applying the level is a no-op.
+    for _ in range(3):
+        c.set_target_level(c.max_level)
+    settled_calls, settled_notified = len(calls), len(notified)
+    assert c.set_target_level(c.max_level) == (True, None)
+    assert (len(calls), len(notified)) == (settled_calls, settled_notified)
+
+
+def test_selected_rows_snapshot_follows_request_edits():
+    c = _controller({})
+    assert {source for _name, source in c.selected_tagged_skills_rows()} == {"Current build"}
+
+    c.set_tagged_skill_requests({int(AV.SCIENCE), int(AV.MEDICINE), int(AV.REPAIR)})
+    assert {source for _name, source in c.selected_tagged_skills_rows()} == {"Direct request"}
+
+    c.set_tagged_skill_requests(set())
+    c.add_max_skills_request()
+    assert {source for _name, source in c.selected_tagged_skills_rows()} == {"Auto (Max Skills)"}
+
+
+def test_implant_points_by_level_counts_each_implant_once_in_level_order():
+    from fnv_planner.engine.build_engine import LevelPlan
+
+    implants = [
+        _perk(
+            form_id,
+            f"{stat} Implant",
+            description=f"An implant that increases your {stat} by 1.",
+            min_level=1,
+            is_playable=False,
+        )
+        for form_id, stat in [(0x9201, "Strength"), (0x9202, "Agility")]
+    ]
+    c = _controller({}, perks={p.form_id: p for p in implants})
+    state = c.engine.state
+    state.creation_special_points = {int(AV.STRENGTH): 1}
+    state.level_plans = {
+        5: LevelPlan(level=5, special_points={int(AV.STRENGTH): 1}),
+        3: LevelPlan(level=3, special_points={int(AV.AGILITY): 1, int(AV.LUCK): 1}),
+        7: LevelPlan(level=7, special_points={int(AV.AGILITY): 1}),
+    }
+    c.engine.replace_state(state)
+
+    assert c.implant_points_by_level() == {
+        2: {int(AV.STRENGTH): 1},
+        3: {int(AV.AGILITY): 1},
+    }
+
+
+def test_preset_line_pattern_strips_and_skips_comments():
+    from fnv_planner.ui.controllers.build_controller import _PRESET_LINE_RE
+
+    text = "# header\n  Educated \n\n\t# indented comment\nLead Belly\n0x31DD8\t\n   \n"
+    assert _PRESET_LINE_RE.findall(text) == ["Educated", "Lead Belly", "0x31DD8"]
+
+
+def test_priority_request_rows_reuse_formatted_text_until_requests_change(monkeypatch):
+    c = _controller({})
+    c.add_actor_value_request(int(AV.GUNS), 50, reason="gate")
+    c.add_max_crit_request()
+    first = c.priority_request_rows()
+    assert [text for _idx, text in first] == [
+        "Guns >= 50 [gate]",
+        "Max Crit: prioritize crit-bonus perks [Maximize critical chance bonuses]",
+    ]
+
+    def _no_format(_self, _req):
+        raise AssertionError("cached row expected")
+
+    monkeypatch.setattr(BuildController, "_format_request_row", _no_format)
+    assert c.priority_request_rows() == first
+
+    monkeypatch.undo()
+    c.remove_priority_request(0)
+    assert c.priority_request_rows() == [
+        (0, "Max Crit: prioritize crit-bonus perks [Maximize critical chance bonuses]"),
+    ]
+
+
+def test_skill_book_totals_are_cached_per_plan():
+    c = _controller({int(AV.SCIENCE): 3, int(AV.GUNS): 2, int(AV.BARTER): -1})
+    assert c.total_skill_books() == 5
+    c.add_max_skills_request()
+    used = c.skill_book_rows()
+    assert c.needed_skill_books() == sum(needed for _name, needed, _available in used)
+
+
+def test_actor_value_options_and_request_validation_use_requestable_set():
+    c = _controller({})
+    options = c.actor_value_options()
+    assert options[0] == (int(AV.STRENGTH), "Strength")
+    assert [av for av, _name in options] == sorted(av for av, _name in options)
+    assert [row[1] for row in c.special_rows()][:2] == ["Strength", "Perception"]
+    assert c.add_actor_value_request(0, 10) == (False, "Unsupported actor value for request")
+
+
+def test_sync_state_skips_no_op_writes():
+    writes: list[str] = []
+
+    class _RecordingState(UiState):
+        def __setattr__(self, name, value):
+            writes.append(name)
+            super().__setattr__(name, value)
+
+    c = _controller({})
+    c.state = _RecordingState(target_level=c.target_level, max_level=c.max_level)
+    writes.clear()
+    c.refresh()
+    assert writes == []
+
+    c.state.max_level = 1
+    writes.clear()
+    c.refresh()
+    assert writes == ["max_level"]
+
+
+def test_add_trait_request_by_query_prefers_exact_match():
+    broad = _perk(0x7A01, "Almost Kamikaze", is_trait=True, min_level=1)
+    exact = _perk(0x7A02, "Kamikaze", is_trait=True, min_level=1)
+    c = _controller({}, perks={broad.form_id: broad, exact.form_id: exact})
+
+    assert c.add_trait_request_by_query("kamikaze") == (True, None)
+    assert c.selected_trait_ids() == {exact.form_id}
+
+
+def test_zero_books_gap_probe_is_memoized(monkeypatch):
+    from fnv_planner.optimizer.planner import GoalSpec, StartingConditions
+
+    c = _controller({int(AV.SCIENCE): 2})
+    calls = _count_plan_builds(monkeypatch)
+
+    start, goal = c._plan_inputs()[1:]
+    assert isinstance(start, StartingConditions) and isinstance(goal, GoalSpec)
+    first = c._no_books_gap_points(goal, start)
+    assert c._no_books_gap_points(goal, start) == first
+    assert len(calls) == 1
+
+    c.perks = {}
+    c._no_books_gap_points(goal, start)
+    assert len(calls) == 2
+
+
+def test_implant_target_prefers_attribute_order_over_text_order():
+    both = _perk(0x9301, "Implant", description="Trades Luck for Strength.", is_playable=False, is_hidden=True)
+    plain = _perk(0x9302, "Implant", description="Nothing to see here.", is_playable=False, is_hidden=True)
+    assert BuildController._implant_special_target(both) == int(AV.STRENGTH)
+    assert BuildController._implant_special_target(plain) is None
+
+
+def test_extract_max_skills_gap_points_sums_shortfalls():
+    unmet = ["Max skills unmet (32:81, 34:100)", "Other (45:120)"]
+    assert BuildController._extract_max_skills_gap_points(unmet) == 19
+    assert BuildController._extract_max_skills_gap_points([]) == 0
+
+
+def test_resolved_tagged_skills_tops_up_from_state_then_actor_value_order():
+    c = _controller({})
+    assert c.set_tagged_skill_requests({int(AV.SCIENCE)}) == (True, None)
+    state_tags = {int(AV.GUNS), int(AV.STRENGTH)}
+    assert c._resolved_tagged_skills(state_tags=state_tags) == {
+        int(AV.SCIENCE),
+        int(AV.GUNS),
+        int(AV.BARTER),
+    }
+
+
+def test_request_derived_lists_are_cached_until_requests_change(monkeypatch):
+    c = _controller({})
+    calls: list[int] = []
+    real_build = BuildController._build_goal_specs
+
+    def _counting_build(self):
+        calls.append(1)
+        return real_build(self)
+
+    monkeypatch.setattr(BuildController, "_build_goal_specs", _counting_build)
+
+    c.add_actor_value_request(int(AV.GUNS), 60, reason="gate")
+    specs = c._requests_as_goal_specs()
+    runs = len(calls)
+    assert c._requests_as_goal_specs() == specs
+    assert len(calls) == runs
+
+    c.add_actor_value_request(int(AV.SCIENCE), 50, reason="second")
+    assert [spec.actor_value for spec in c._requests_as_goal_specs()] == [
+        int(AV.GUNS),
+        int(AV.SCIENCE),
+    ]
+    assert len(calls) > runs
@@ -141,6 +141,20 @@ class TestCreationSPECIAL:
         with pytest.raises(ValueError, match="7 SPECIAL"):
             e.set_special(incomplete)
 
+    def test_target_level_reads_without_state_copy(self):
+        e = _engine()
+        _setup_creation(e)
+        e.set_target_level(7)
+        assert e.target_level == e.state.target_level == 7
+
+    def test_special_view_is_read_only(self):
+        e = _engine()
+        e.set_special(_balanced_special())
+        view = e.special
+        assert dict(view) == _balanced_special()
+        with pytest.raises(TypeError):
+            view[AV.STRENGTH] = 10  # type: ignore[index]
+
 
 class TestCreationTags:
     def test_valid_tags(self):
@@ -0,0 +1,30 @@
+"""Tests for the shared level -> actor value map helpers."""
+
+from fnv_planner.models.constants import ActorValue
+from fnv_planner.ui.controllers.level_maps import as_int_nested
+
+
+AV = ActorValue
+
+
+def test_as_int_nested_copies_plain_ints_and_coerces_the_rest():
+    plain = {2: {int(AV.SCIENCE): 1}}
+    copied = as_int_nested(plain)
+    assert copied == plain
+    assert copied[2] is not plain[2]
+
+    mixed = {"3": {AV.GUNS: 2.0}}
+    coerced = as_int_nested(mixed)
+    assert coerced == {3: {int(AV.GUNS): 2}}
+    assert type(next(iter(coerced[3].values()))) is int
+    assert as_int_nested({}) == {}
+
+
+def test_as_int_nested_samples_first_non_empty_row():
+    mixed = {2: {}, 3: {AV.GUNS: 2.0}}
+    coerced = as_int_nested(mixed)
+    assert coerced == {2: {}, 3: {int(AV.GUNS): 2}}
+    assert type(next(iter(coerced[3]))) is int
+    assert type(coerced[3][int(AV.GUNS)]) is int
+
+    assert as_int_nested({2: {}, 3: {}}) == {2: {}, 3: {}}
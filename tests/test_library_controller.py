@@ -0,0 +1,109 @@
+from fnv_planner.engine.build_engine import BuildEngine
+from fnv_planner.engine.ui_model import BuildUiModel
+from fnv_planner.graph.dependency_graph import DependencyGraph
+from fnv_planner.models.game_settings import GameSettings
+from fnv_planner.models.item import Armor, Weapon
+from fnv_planner.ui.controllers.library_controller import LibraryController
+from fnv_planner.ui.state import UiState
+
+
+def _armor(form_id: int, name: str, slot: int) -> Armor:
+    return Armor(
+        form_id=form_id,
+        editor_id=name.replace(" ", ""),
+        name=name,
+        value=10,
+        health=100,
+        weight=1.0,
+        damage_threshold=0.0,
+        equipment_slot=slot,
+        enchantment_form_id=None,
+        is_playable=True,
+    )
+
+
+def _weapon(form_id: int, name: str, slot: int) -> Weapon:
+    return Weapon(
+        form_id=form_id,
+        editor_id=name.replace(" ", ""),
+        name=name,
+        value=10,
+        health=100,
+        weight=1.0,
+        damage=10,
+        clip_size=6,
+        crit_damage=10,
+        crit_multiplier=1.0,
+        equipment_slot=slot,
+        enchantment_form_id=None,
+        is_playable=True,
+    )
+
+
+def _controller() -> LibraryController:
+    armors = {
+        0x10: _armor(0x10, "leather Armor", 2),
+        0x11: _armor(0x11, "Combat Armor", 2),
+        0x12: _armor(0x12, "Hat", 0),
+    }
+    weapons = {0x20: _weapon(0x20, "Varmint Rifle", 2)}
+    engine = BuildEngine(GameSettings.defaults(), DependencyGraph.build([]))
+    return LibraryController(
+        engine=engine,
+        ui_model=BuildUiModel(engine, armors, weapons),
+        armors=armors,
+        weapons=weapons,
+        state=UiState(),
+    )
+
+
+def test_catalog_items_sort_by_slot_kind_then_case_insensitive_name():
+    c = _controller()
+    assert [item.name for item in c.catalog_items()] == [
+        "Hat",
+        "Combat Armor",
+        "leather Armor",
+        "Varmint Rifle",
+    ]
+    assert [item.name for item in c.catalog_items(include_armor=False)] == ["Varmint Rifle"]
+    assert c.catalog_items(include_armor=False, include_weapons=False) == []
+    assert [item.name for item in c.catalog_items(query="armor", include_weapons=False)] == [
+        "Combat Armor",
+        "leather Armor",
+    ]
+
+
+def test_equipped_slots_resolve_names_through_merged_lookup():
+    c = _controller()
+    c.engine.set_equipment(2, 0x20)
+    c.engine.set_equipment(0, 0x12)
+    c.engine.set_equipment(5, 0x99)
+    assert c.equipped_slots() == [
+        (0, 0x12, "Hat"),
+        (2, 0x20, "Varmint Rifle"),
+        (5, 0x99, "Item 0x99"),
+    ]
+
+    c.weapons = {}
+    assert c.get_item(0x20) is None
+    assert c.get_item(0x10) is c.armors[0x10]
+
+
+def test_catalog_items_are_memoized_until_the_gear_catalog_changes(monkeypatch):
+    c = _controller()
+    calls = []
+    original = BuildUiModel.gear_catalog
+
+    def _counting(self, query=""):
+        calls.append(query)
+        return original(self, query)
+
+    monkeypatch.setattr(BuildUiModel, "gear_catalog", _counting)
+    first = c.catalog_items(query="Armor")
+    first.clear()
+    assert [item.name for item in c.catalog_items(query=" armor ")] == ["Combat Armor", "leather Armor"]
+    assert len(calls) == 1
+
+    c.ui_model.set_gear_catalog({0x30: _armor(0x30, "Metal Armor", 2)}, {})
+    assert [item.name for item in c.catalog_items(query="armor")] == ["Metal Armor"]
+    assert len(calls) == 2
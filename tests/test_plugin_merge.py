@@ -12,6 +12,7 @@ from fnv_planner.parser.plugin_merge import (
     default_vanilla_plugins,
     effective_vanilla_level_cap,
     has_non_base_level_cap_override,
+    mapped_plugins,
     parse_dict_merged,
     parse_records_merged,
     resolve_plugins_for_cli,
@@ -175,3 +176,17 @@ def test_banner_title_for_game_variant():
     assert banner_title_for_game(GAME_TTW) == "Tee Tee Double UWU"
     assert banner_title_for_game(GAME_FALLOUT_3) == "FO3 Planner"
     assert banner_title_for_game(GAME_FALLOUT_NV) == "FNV Planner"
+
+
+def test_mapped_plugins_closes_maps_on_exit(tmp_path):
+    plugin = tmp_path / "Base.esm"
+    plugin.write_bytes(b"TES4" + b"\x00" * 20)
+    empty = tmp_path / "Empty.esp"
+    empty.write_bytes(b"")
+
+    with mapped_plugins([plugin, empty]) as datas:
+        mapped, blank = datas
+        assert mapped[:4] == b"TES4"
+        assert blank == b""
+
+    assert mapped.closed
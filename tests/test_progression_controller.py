@@ -123,3 +123,81 @@ def test_progression_controller_renders_between_level_zero_cost_perk_label():
     assert label is not None
     assert "Between L1 and L2" in label
     assert "Challenge Reward [challenge]" in label
+
+
+def test_skill_books_timeline_label_uses_running_totals():
+    engine = _engine()
+    controller = ProgressionController(
+        engine=engine,
+        ui_model=BuildUiModel(engine),
+        perks={},
+        state=UiState(),
+    )
+    assert controller.skill_books_timeline_label_for_level(2) == "Skill books: none"
+
+    controller.set_skill_book_usage(
+        needed=3,
+        available=3,
+        rows=[],
+        by_level={2: {int(AV.SCIENCE): 1}, 4: {int(AV.SCIENCE): 1, int(AV.GUNS): 1}},
+    )
+    assert controller.skill_books_timeline_label_for_level(1) == "Skill books: none"
+    assert controller.skill_books_timeline_label_for_level(3) == (
+        "Skill books: none this level (cumulative: Science 1)"
+    )
+    assert controller.skill_books_timeline_label_for_level(4) == (
+        "Skill books: Science +1, Guns +1 (cumulative: Science 2, Guns 1)"
+    )
+
+
+def test_effective_skills_for_level_uses_running_book_points_and_clamps():
+    engine = _engine()
+    controller = ProgressionController(
+        engine=engine,
+        ui_model=BuildUiModel(engine),
+        perks={},
+        state=UiState(),
+    )
+    base = {int(AV.SCIENCE): 95, int(AV.GUNS): 40}
+    assert controller.effective_skills_for_level(5, base) == base
+
+    controller.set_skill_book_usage(
+        needed=2,
+        available=2,
+        rows=[],
+        points_by_level={2: {int(AV.SCIENCE): 3}, 4: {int(AV.SCIENCE): 3, int(AV.GUNS): 2}},
+    )
+    assert controller.effective_skills_for_level(1, base) == base
+    assert controller.effective_skills_for_level(3, base) == {int(AV.SCIENCE): 98, int(AV.GUNS): 40}
+    assert controller.effective_skills_for_level(9, base) == {int(AV.SCIENCE): 100, int(AV.GUNS): 42}
+    assert controller.effective_skills_for_level(1, {int(AV.GUNS): -5}) == {int(AV.GUNS): 0}
+    assert base == {int(AV.SCIENCE): 95, int(AV.GUNS): 40}
+
+
+def test_refresh_reclamps_only_when_bounds_or_target_change(monkeypatch):
+    engine = _engine()
+    controller = ProgressionController(
+        engine=engine,
+        ui_model=BuildUiModel(engine),
+        perks={},
+        state=UiState(),
+    )
+    calls: list[int] = []
+    real_clamp = ProgressionController._clamp_bounds
+
+    def _counting_clamp(self, target_level):
+        calls.append(target_level)
+        return real_clamp(self, target_level)
+
+    monkeypatch.setattr(ProgressionController, "_clamp_bounds", _counting_clamp)
+
+    controller.refresh()
+    controller.refresh()
+    controller.progression_rows()
+    assert calls == [2]
+
+    engine.set_target_level(5)
+    controller.refresh()
+    assert calls == [2, 5]
+    assert controller.state.target_level == 5
+    assert controller.to_level == 2
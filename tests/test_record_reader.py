@@ -6,7 +6,14 @@ from pathlib import Path
 
 import pytest
 
-from fnv_planner.parser.record_reader import iter_grup, read_grup
+from fnv_planner.parser.plugin_merge import map_plugin_file
+from fnv_planner.parser.record_reader import (
+    iter_grup,
+    iter_grups_multi,
+    iter_records_of_types,
+    read_grup,
+    read_grups,
+)
 
 
 ESM_PATH = Path(
@@ -144,12 +151,52 @@ def test_iter_grup_all_groups():
     assert ids == [10, 11]
 
 
+def test_read_grups_collects_several_labels_in_one_pass():
+    data = (
+        _build_tes4_header()
+        + _build_grup("AAAA", [_build_record("AAAA", 1, [("EDID", b"a\x00")])])
+        + _build_grup("SKIP", [_build_record("SKIP", 2, [("EDID", b"s\x00")])])
+        + _build_grup("BBBB", [_build_record("BBBB", 3, [("EDID", b"b\x00")])])
+        + _build_grup("AAAA", [_build_record("AAAA", 4, [("EDID", b"a2\x00")])])
+    )
+    by_label = read_grups(data, ["AAAA", "BBBB", "NOPE"])
+    assert {k: [r.header.form_id for r in v] for k, v in by_label.items()} == {
+        "AAAA": [1],
+        "BBBB": [3],
+        "NOPE": [],
+    }
+    pairs = [(lbl, r.header.form_id) for lbl, r in iter_grups_multi(data, {"AAAA"}, all_groups=True)]
+    assert pairs == [("AAAA", 1), ("AAAA", 4)]
+
+
+def test_iter_records_of_types_descends_nested_groups():
+    inner = _build_grup("CELL", [
+        _build_record("REFR", 2, [("NAME", b"\x01\x00\x00\x00")]),
+        _build_record("ACHR", 3, [("NAME", b"\x02\x00\x00\x00")], flags=0x0004_0000),
+    ])
+    data = (
+        _build_tes4_header()
+        + _build_grup("CELL", [_build_record("CELL", 1, [("EDID", b"c\x00")]), inner])
+        + _build_grup("BOOK", [_build_record("BOOK", 4, [("EDID", b"b\x00")])])
+    )
+    found = [(r.header.type, r.header.form_id) for r in iter_records_of_types(data, ("REFR", "ACHR"))]
+    assert found == [("REFR", 2), ("ACHR", 3)]
+
+
 def test_grup_not_found():
     data = _build_tes4_header() + _build_grup("TEST", [])
     with pytest.raises(ValueError, match="not found"):
         read_grup(data, "NOPE")
 
 
+def test_oversized_grup_raises():
+    grup = bytearray(_build_grup("TEST", [_build_record("TEST", 1, [("EDID", b"a\x00")])]))
+    struct.pack_into("<I", grup, 4, len(grup) + 100)
+    data = _build_tes4_header() + bytes(grup)
+    with pytest.raises(ValueError, match="exceed boundary"):
+        read_grup(data, "OTHR")
+
+
 def test_bad_tes4_header():
     data = b"NOPE" + b"\x00" * 100
     with pytest.raises(ValueError, match="Expected TES4"):
@@ -184,6 +231,27 @@ def test_multiple_subrecords():
     assert struct.unpack("<I", subs[2].data)[0] == 42
 
 
+def test_truncated_subrecord_raises():
+    rec = bytearray(_build_record("TEST", 1, [("EDID", b"test\x00")]))
+    # Claim a larger payload than the record data actually holds.
+    struct.pack_into("<H", rec, 24 + 4, 64)
+    data = _build_tes4_header() + _build_grup("TEST", [bytes(rec)])
+    with pytest.raises(ValueError, match="exceed boundary"):
+        read_grup(data, "TEST")
+
+
+def test_read_grup_from_mapped_plugin(tmp_path):
+    rec = _build_record("TEST", 7, [("EDID", b"mapped\x00")], flags=0x0004_0000)
+    path = tmp_path / "Mapped.esp"
+    path.write_bytes(_build_tes4_header() + _build_grup("TEST", [rec]))
+
+    records = read_grup(map_plugin_file(path), "TEST")
+
+    assert [r.header.form_id for r in records] == [7]
+    assert type(records[0].subrecords[0].data) is bytes
+    assert records[0].subrecords[0].data == b"mapped\x00"
+
+
 def test_tes4_with_data():
     """TES4 header with actual subrecord data should be skipped properly."""
     tes4_sub = struct.pack("<4sH", b"HEDR", 4) + struct.pack("<I", 0)
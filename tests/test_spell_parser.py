@@ -1,9 +1,8 @@
 import struct
 
 from fnv_planner.models.records import Record, RecordHeader, Subrecord
-from fnv_planner.models.spell import SpellEffect
-from fnv_planner.models.spell import Spell
 from fnv_planner.parser.spell_parser import (
+    iter_spells,
     linked_spell_names_by_form,
     linked_spell_stat_bonuses_by_form,
     parse_spell,
@@ -47,24 +46,34 @@ def test_parse_spell_marks_conditions_present():
     assert len(spell.effects) == 1
 
 
-def test_linked_spell_helpers_exclude_conditional_by_default(monkeypatch):
-    conditional = Spell(
-        form_id=1,
-        editor_id="ConditionalSpell",
-        name="Conditional",
-        effects=[],
-        has_conditions=True,
-    )
-    unconditional = Spell(
-        form_id=2,
-        editor_id="FlatSpell",
-        name="Flat Bonus",
-        effects=[],
-        has_conditions=False,
+def _plugin_with_spell(form_id: int, subrecords: list[tuple[bytes, bytes]]) -> bytes:
+    body = b"".join(struct.pack("<4sH", sig, len(data)) + data for sig, data in subrecords)
+    record = struct.pack("<4sIIIIHH", b"SPEL", len(body), 0, form_id, 0, 0, 0) + body
+    grup = struct.pack("<4sI4sIII", b"GRUP", 24 + len(record), b"SPEL", 0, 0, 0) + record
+    return struct.pack("<4sIIIIHH", b"TES4", 0, 0, 0, 0, 0, 0) + grup
+
+
+def test_iter_spells_yields_rows_and_merges_last_plugin_wins():
+    base = _plugin_with_spell(
+        0x10,
+        [
+            (b"EDID", b"BaseSpell\x00"),
+            (b"EFID", struct.pack("<I", 0xBEEF)),
+            (b"EFIT", _efit_data(actor_value=32, magnitude=5)),
+        ],
     )
+    patch = _plugin_with_spell(0x10, [(b"EDID", b"PatchedSpell\x00"), (b"FULL", b"Patched\x00")])
+
+    assert list(iter_spells(base)) == [(0x10, "BaseSpell", False, [(0xBEEF, 5.0, 32)])]
+    assert linked_spell_names_by_form([base, patch]) == {0x10: "Patched"}
+
+
+def test_linked_spell_helpers_exclude_conditional_by_default(monkeypatch):
+    conditional = (1, "Conditional", True, [])
+    unconditional = (2, "Flat Bonus", False, [])
 
     def _fake_parse_records_merged(_plugin_datas, parser_fn, **_kwargs):
-        if parser_fn.__name__ == "parse_all_spells":
+        if parser_fn.__name__ == "parse_all_spell_rows":
             return [conditional, unconditional]
         return []
 
@@ -77,28 +86,13 @@ def test_linked_spell_helpers_exclude_conditional_by_default(monkeypatch):
 
 
 def test_linked_spell_bonus_map_excludes_conditional_by_default(monkeypatch):
-    conditional = Spell(
-        form_id=1,
-        editor_id="ConditionalSpell",
-        name="Conditional",
-        effects=[],
-        has_conditions=True,
-    )
-    unconditional = Spell(
-        form_id=2,
-        editor_id="FlatSpell",
-        name="Flat Bonus",
-        effects=[],
-        has_conditions=False,
-    )
-
-    conditional.effects.append(SpellEffect(mgef_form_id=10, magnitude=15.0, actor_value=42))
-    unconditional.effects.append(SpellEffect(mgef_form_id=10, magnitude=3.0, actor_value=32))
+    conditional = (1, "Conditional", True, [(10, 15.0, 42)])
+    unconditional = (2, "Flat Bonus", False, [(10, 3.0, 32)])
 
     mgef = type("M", (), {"form_id": 10, "is_value_modifier": True, "actor_value": 32})()
 
     def _fake_parse_records_merged(_plugin_datas, parser_fn, **_kwargs):
-        if parser_fn.__name__ == "parse_all_spells":
+        if parser_fn.__name__ == "parse_all_spell_rows":
             return [conditional, unconditional]
         if parser_fn.__name__ == "parse_all_mgefs":
             return [mgef]
@@ -110,3 +104,18 @@ def test_linked_spell_bonus_map_excludes_conditional_by_default(monkeypatch):
     assert bonuses == {2: {32: 3.0}}
     bonuses_all = linked_spell_stat_bonuses_by_form([b"fake"], include_conditional=True)
     assert bonuses_all == {1: {32: 15.0}, 2: {32: 3.0}}
+
+
+def test_linked_spell_helpers_reuse_supplied_spell_rows(monkeypatch):
+    rows = [(1, "Conditional", True, [(10, 15.0, 42)]), (2, "Flat Bonus", False, [(10, 3.0, 32)])]
+    mgef = type("M", (), {"form_id": 10, "is_value_modifier": True, "actor_value": 32})()
+
+    def _fake_parse_records_merged(_plugin_datas, parser_fn, **_kwargs):
+        if parser_fn.__name__ == "parse_all_spell_rows":
+            raise AssertionError("spell rows should not be re-parsed")
+        return [mgef]
+
+    monkeypatch.setattr("fnv_planner.parser.spell_parser.parse_records_merged", _fake_parse_records_merged)
+
+    assert linked_spell_names_by_form([b"fake"], spell_rows=rows) == {2: "Flat Bonus"}
+    assert linked_spell_stat_bonuses_by_form([b"fake"], spell_rows=rows) == {2: {32: 3.0}}
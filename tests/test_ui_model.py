@@ -215,3 +215,31 @@ def test_diagnostics_reports_equipment_conditional_effect_exclusions():
     catalog = ui.gear_catalog("conditional")
     assert len(catalog) == 1
     assert catalog[0].excluded_conditional_effects == 2
+
+
+def test_gear_catalog_builds_once_and_resets_on_new_catalog():
+    engine = _engine()
+
+    def _armor(form_id: int, name: str) -> Armor:
+        return Armor(
+            form_id=form_id,
+            editor_id=f"Armor{form_id:X}",
+            name=name,
+            value=1,
+            health=1,
+            weight=1.0,
+            damage_threshold=0.0,
+            equipment_slot=2,
+            enchantment_form_id=None,
+            is_playable=True,
+        )
+
+    ui = BuildUiModel(engine, armors={0xA1: _armor(0xA1, "Leather Armor")})
+    first = ui.gear_catalog()
+    assert [c.name for c in ui.gear_catalog("  LEATHER ")] == ["Leather Armor"]
+    assert first[0].name_lower == first[0].name.lower()
+    assert ui.gear_catalog()[0] is first[0]
+    assert ui.gear_catalog("metal") == []
+
+    ui.set_gear_catalog({0xA2: _armor(0xA2, "Metal Armor")}, {})
+    assert [c.name for c in ui.gear_catalog("metal")] == ["Metal Armor"]
@@ -1,3 +1,4 @@
+from fnv_planner.ui.controllers.build_controller import BuildController
 from fnv_planner.webui.export_state import build_webui_state
 
 
@@ -20,5 +21,24 @@ def test_build_webui_state_shape():
     assert "stats" in first
     assert "skills" in first
     assert "crit_damage_potential" in first["stats"]
+    assert list(first["skills"])[:2] == ["Barter", "Energy Weapons"]
     assert "request_entries" in state["build"]
     assert "gear" in state["library"]
+    assert state["library"]["gear_version"] == 0
+
+
+def test_build_webui_state_skill_books_match_build_controller(monkeypatch):
+    calls = {"rows": 0}
+    original = BuildController.skill_book_rows
+
+    def _counting(self):
+        calls["rows"] += 1
+        return original(self)
+
+    monkeypatch.setattr(BuildController, "skill_book_rows", _counting)
+    state = build_webui_state()
+
+    books = state["build"]["skill_books"]
+    assert calls["rows"] == 1
+    assert books["needed"] == sum(row["needed"] for row in books["rows"])
+    assert all(isinstance(row["needed"], int) for row in books["rows"])
@@ -0,0 +1,68 @@
+import pytest
+
+from fnv_planner.webui.server import ActionResult, BackgroundRuntime, WebUiRuntime
+
+
+class _StubRuntime:
+    def snapshot(self) -> dict:
+        return {"app": {"target_level": 1}}
+
+    def apply(self, path: str, payload: dict) -> ActionResult:
+        return ActionResult(ok=True, message=path)
+
+
+def test_background_runtime_delegates_once_loaded():
+    runtime = BackgroundRuntime(_StubRuntime)
+
+    assert runtime.snapshot() == {"app": {"target_level": 1}}
+    assert runtime.apply("/api/replan", {}).message == "/api/replan"
+
+
+def test_background_runtime_reraises_bootstrap_failure():
+    def _boom():
+        raise FileNotFoundError("no plugins")
+
+    runtime = BackgroundRuntime(_boom)
+
+    with pytest.raises(RuntimeError, match="no plugins"):
+        runtime.snapshot()
+
+
+def test_runtime_snapshot_is_reused_until_an_action_is_applied():
+    runtime = WebUiRuntime(include_max_crit=False)
+
+    first = runtime.snapshot()
+    again = runtime.snapshot()
+    assert again is not first
+    assert again["build"] is first["build"]
+    assert again["generated_at"] >= first["generated_at"]
+    again["build"] = None
+    assert runtime.snapshot()["build"] is first["build"]
+
+    runtime.apply("/api/requests/meta", {"kind": "max_crit", "enabled": True})
+    second = runtime.snapshot()
+    assert second is not first
+    assert second["build"]["meta"]["max_crit"] is True
+    assert first["build"]["meta"]["max_crit"] is False
+
+
+def test_runtime_startup_meta_requests_share_one_replan(monkeypatch):
+    from fnv_planner.ui.controllers import build_controller
+
+    calls: list[int] = []
+    real_plan_build = build_controller.plan_build
+
+    def _counting_plan_build(*args, **kwargs):
+        calls.append(1)
+        return real_plan_build(*args, **kwargs)
+
+    monkeypatch.setattr(build_controller, "plan_build", _counting_plan_build)
+    WebUiRuntime(include_max_skills=False, include_max_crit=False, include_max_crit_damage=False)
+    baseline = len(calls)
+    calls.clear()
+
+    runtime = WebUiRuntime(include_max_skills=True, include_max_crit=True, include_max_crit_damage=True)
+
+    assert len(calls) == baseline + 1
+    meta = runtime.snapshot()["build"]["meta"]
+    assert meta["max_skills"] and meta["max_crit"] and meta["max_crit_damage"]
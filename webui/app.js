@@ -5,6 +5,7 @@ let buildPerkQuery = "";
 let gearQuery = "";
 let showArmor = true;
 let showWeapons = true;
+let gearSearchTimer = 0;
 
 function h(value) {
   return String(value ?? "")
@@ -52,16 +53,12 @@ async function postJson(path, payload) {
     throw new Error(body?.message || `Request failed (${res.status})`);
   }
   appState = body.state;
-  renderAll();
+  scheduleRender();
   if (body.message) {
     showMessage(body.message, "ok");
   }
 }
 
-function rowMetric(label, value) {
-  return `<p class="metric"><strong>${h(label)}:</strong> ${n(value)}</p>`;
-}
-
 function perkStatusLabel(status) {
   if (status === "none") return "Not Selected";
   if (status === "red") return "Primary Conflict";
@@ -69,122 +66,228 @@ function perkStatusLabel(status) {
   return "Compatible";
 }
 
-function statsCard(title, stats) {
+const STAT_METRICS = [
+  ["HP", "hit_points"],
+  ["AP", "action_points"],
+  ["Carry", "carry_weight"],
+  ["Crit %", "crit_chance"],
+  ["Crit Dmg", "crit_damage_potential"],
+  ["SP/Level", "skill_points_per_level"],
+];
+
+function statsCard(title) {
   return `
     <article class="card">
       <h3>${h(title)}</h3>
-      ${rowMetric("HP", stats.hit_points)}
-      ${rowMetric("AP", stats.action_points)}
-      ${rowMetric("Carry", stats.carry_weight)}
-      ${rowMetric("Crit %", stats.crit_chance)}
-      ${rowMetric("Crit Dmg", stats.crit_damage_potential)}
-      ${rowMetric("SP/Level", stats.skill_points_per_level)}
+      ${STAT_METRICS.map(([label, key]) => `<p class="metric"><strong>${h(label)}:</strong> <span data-stat="${key}"></span></p>`).join("")}
     </article>
   `;
 }
 
+// The card markup is written once; refreshes only touch the value cells,
+// looked up by stat key on first use.
+function updateStatsCard(container, stats) {
+  if (!container.__cells) {
+    container.__cells = new Map(
+      Array.from(container.querySelectorAll("[data-stat]"), (cell) => [cell.dataset.stat, cell]),
+    );
+  }
+  STAT_METRICS.forEach(([, key]) => {
+    const v = stats[key];
+    setText(container.__cells.get(key), typeof v === "number" ? fmt.format(v) : String(v ?? "-"));
+  });
+}
+
+// Writes only when the value differs from what was last rendered into the
+// node, so unchanged labels do not trigger a re-layout.
+function setText(node, text) {
+  if (node && node.textContent !== text) node.textContent = text;
+}
+
+function setHtml(node, html) {
+  if (node && node.__html !== html) {
+    node.innerHTML = html;
+    node.__html = html;
+  }
+}
+
+// Drops every child past `count`: a single replaceChildren() when the list is
+// emptied, otherwise one Range deletion of the whole tail.
+function truncateChildren(container, count) {
+  const kids = container.children;
+  if (kids.length <= count) return;
+  if (count === 0) {
+    container.replaceChildren();
+    return;
+  }
+  const range = document.createRange();
+  range.setStartAfter(kids[count - 1]);
+  range.setEndAfter(container.lastChild);
+  range.deleteContents();
+}
+
+const ROW_CHUNK = 20;
+
+// Reuses the container's existing row elements by position and rewrites only
+// rows whose markup changed.
+// Rows past the first chunk are synced on later frames so long lists do not
+// stall the page; a newer sync of the same container cancels the older one.
+// Rows a chunk adds are built in a fragment and attached in one append.
+function syncChildren(container, rows, tag) {
+  if (container.__syncFrame) {
+    cancelAnimationFrame(container.__syncFrame);
+    container.__syncFrame = 0;
+  }
+  const kids = container.children;
+  let start = 0;
+
+  function step() {
+    const end = Math.min(rows.length, start + ROW_CHUNK);
+    const live = kids.length;
+    const fresh = document.createDocumentFragment();
+    for (let i = start; i < end; i += 1) {
+      const row = rows[i];
+      let node = kids[i];
+      if (i >= live) {
+        node = document.createElement(tag);
+        fresh.appendChild(node);
+      }
+      const className = row.className || "";
+      if (node.className !== className) node.className = className;
+      if (node.__html !== row.html) setHtml(node, row.html);
+    }
+    if (fresh.firstChild) container.appendChild(fresh);
+    start = end;
+    if (start < rows.length) {
+      container.__syncFrame = requestAnimationFrame(step);
+      return;
+    }
+    container.__syncFrame = 0;
+    truncateChildren(container, rows.length);
+  }
+
+  step();
+}
+
 function requestText(build, index) {
   const row = build.requests.find((r) => r.index === index);
   return row ? row.text : `Request ${index}`;
 }
 
+// Lowercased name/category pairs for the current perk list, plus the last
+// query's matches so that typing more characters only rescans those.
+let perkSearchIndex = null;
+
+function perkSearchMatches(perks, q) {
+  if (!perkSearchIndex || perkSearchIndex.perks !== perks) {
+    perkSearchIndex = {
+      perks,
+      keys: perks.map((p) => [p.name.toLowerCase(), p.category.toLowerCase()]),
+      query: "",
+      matches: null,
+    };
+  }
+  const index = perkSearchIndex;
+  if (index.matches === null || index.query !== q) {
+    const pool = index.matches !== null && index.query && q.startsWith(index.query)
+      ? index.matches
+      : perks.map((_p, i) => i);
+    index.matches = pool.filter((i) => index.keys[i][0].includes(q) || index.keys[i][1].includes(q));
+    index.query = q;
+  }
+  return index.matches;
+}
+
+function perkRowHtml(perk) {
+  const status = String(perk.request_status || "none");
+  return `
+    <td>
+      <label>
+        <input type="checkbox" data-perk-id="${perk.id}" ${perk.selected ? "checked" : ""} />
+        ${h(perk.name)}
+      </label>
+    </td>
+    <td>${h(perk.category)}</td>
+    <td><span class="status-chip status-chip--${h(status)}">${h(perkStatusLabel(status))}</span></td>
+    <td>${perk.id}</td>
+  `;
+}
+
+// One row per perk is kept in the table and refreshed only when a new state
+// arrives; the search box just toggles `hidden` on the existing rows.
+function syncPerkRows(body, perks) {
+  if (body.__perks === perks) return;
+  body.__perks = perks;
+  const kids = body.children;
+  const live = kids.length;
+  // New rows are filled in off-document and inserted with a single append.
+  const fresh = document.createDocumentFragment();
+  perks.forEach((perk, i) => {
+    let row = kids[i];
+    if (i >= live) {
+      row = document.createElement("tr");
+      fresh.appendChild(row);
+    }
+    const status = String(perk.request_status || "none");
+    const rowClass = perk.selected && status !== "none" ? `perk-row perk-row--${status}` : "perk-row";
+    if (row.className !== rowClass) row.className = rowClass;
+    row.title = String(perk.request_status_reason || "");
+    const html = perkRowHtml(perk);
+    setHtml(row, html);
+    // A rejected toggle leaves the markup unchanged, so reset the live box.
+    const box = row.querySelector("input[data-perk-id]");
+    if (box && box.checked !== Boolean(perk.selected)) box.checked = Boolean(perk.selected);
+  });
+  if (fresh.firstChild) body.appendChild(fresh);
+  truncateChildren(body, perks.length);
+}
+
 function drawBuildPerkPicker(build) {
   const perks = appState.library.perks;
   const q = buildPerkQuery.trim().toLowerCase();
-  const filtered = q
-    ? perks.filter((p) => p.name.toLowerCase().includes(q) || p.category.toLowerCase().includes(q))
-    : perks;
-
   const body = document.querySelector("#perk-picker-body");
   const count = document.querySelector("#perk-picker-count");
   if (!body || !count) return;
-  count.textContent = `${filtered.length} / ${perks.length}`;
 
-  body.innerHTML = filtered.slice(0, 400).map((perk) => {
-    const status = String(perk.request_status || "none");
-    const statusLabel = perkStatusLabel(status);
-    const statusReason = String(perk.request_status_reason || "");
-    const rowClass = perk.selected && status !== "none" ? `perk-row perk-row--${h(status)}` : "perk-row";
-    return `
-      <tr class="${rowClass}" title="${h(statusReason)}">
-        <td>
-          <label>
-            <input type="checkbox" data-perk-id="${perk.id}" ${perk.selected ? "checked" : ""} />
-            ${h(perk.name)}
-          </label>
-        </td>
-        <td>${h(perk.category)}</td>
-        <td><span class="status-chip status-chip--${h(status)}">${h(statusLabel)}</span></td>
-        <td>${perk.id}</td>
-      </tr>
-    `;
-  }).join("");
-
-  body.querySelectorAll("input[data-perk-id]").forEach((node) => {
-    node.addEventListener("change", async () => {
-      const perkId = Number(node.getAttribute("data-perk-id"));
-      try {
-        await postJson("/api/requests/perk-toggle", {
-          perk_id: perkId,
-          selected: node.checked,
-        });
-      } catch (err) {
-        showMessage(err.message, "bad");
-      }
-    });
-  });
+  syncPerkRows(body, perks);
+  // Same rows and same query (typically both empty): visibility is already right.
+  if (body.__filterPerks === perks && body.__filterQuery === q) return;
+  body.__filterPerks = perks;
+  body.__filterQuery = q;
+
+  const visible = new Uint8Array(perks.length);
+  const matches = q ? perkSearchMatches(perks, q) : null;
+  const total = matches ? matches.length : perks.length;
+  const shown = Math.min(total, 400);
+  for (let k = 0; k < shown; k += 1) {
+    visible[matches ? matches[k] : k] = 1;
+  }
+  const rows = body.children;
+  for (let i = 0; i < rows.length; i += 1) {
+    const hide = !visible[i];
+    if (rows[i].hidden !== hide) rows[i].hidden = hide;
+  }
+  setText(count, `${total} / ${perks.length}`);
 }
 
-function renderBuild() {
-  const panel = document.querySelector("#panel-build");
-  const build = appState.build;
-  const requestEntries = build.request_entries;
-
-  const requestItems = requestEntries.map((entry) => {
-    return `
-      <li class="request-row">
-        <span>${h(requestText(build, entry.index))}</span>
-        <span class="row-actions">
-          <button type="button" data-request-action="up" data-index="${entry.index}">Up</button>
-          <button type="button" data-request-action="down" data-index="${entry.index}">Down</button>
-          <button type="button" data-request-action="remove" data-index="${entry.index}">Remove</button>
-        </span>
-      </li>
-    `;
-  }).join("");
-
-  const selectedPerks = build.selected_perks
-    .map((p) => `<span class="pill">L${p.level} ${h(p.name)} <small>${h(p.source)}</small></span>`)
-    .join("");
-
-  const actorOptions = build.request_controls.actor_values
-    .map((opt) => `<option value="${opt.actor_value}" data-max="${opt.max}">${h(opt.name)} (max ${opt.max})</option>`)
-    .join("");
-
-  panel.innerHTML = `
+function buildPanelShell() {
+  return `
     <section class="grid">
-      ${statsCard("Current", build.now)}
-      ${statsCard("Target", build.target)}
-      <article class="card">
-        <h3>Status</h3>
-        <p class="metric ${build.valid ? "ok" : "bad"}"><strong>Valid:</strong> ${build.valid}</p>
-        <p class="metric ${build.feasible ? "ok" : "bad"}"><strong>Feasible:</strong> ${build.feasible}</p>
-        <p class="metric"><strong>Message:</strong> ${h(build.feasibility_message)}</p>
-        <p class="metric"><strong>Books:</strong> ${build.skill_books.needed} / ${build.skill_books.available}</p>
-        <p class="metric"><strong>SPECIAL:</strong> ${build.special.used}/${build.special.budget} (remaining ${build.special.remaining})</p>
-      </article>
+      <div id="build-now">${statsCard("Current")}</div>
+      <div id="build-target">${statsCard("Target")}</div>
+      <article class="card" id="build-status"></article>
     </section>
 
-    <article class="card" style="margin-top:12px">
+    <article class="card card--spaced">
       <h3>Planner Controls</h3>
       <div class="controls">
-        <label><input type="checkbox" id="meta-max-skills" ${build.meta.max_skills ? "checked" : ""} /> Max Skills</label>
-        <label><input type="checkbox" id="meta-max-crit" ${build.meta.max_crit ? "checked" : ""} /> Max Crit</label>
-        <label><input type="checkbox" id="meta-max-crit-dmg" ${build.meta.max_crit_damage ? "checked" : ""} /> Max Crit Dmg</label>
+        <label><input type="checkbox" id="meta-max-skills" /> Max Skills</label>
+        <label><input type="checkbox" id="meta-max-crit" /> Max Crit</label>
+        <label><input type="checkbox" id="meta-max-crit-dmg" /> Max Crit Dmg</label>
       </div>
       <form id="actor-request-form" class="controls">
         <label>AV</label>
-        <select id="actor-value-select">${actorOptions}</select>
+        <select id="actor-value-select"></select>
         <select id="actor-operator">
           <option value=">=">&gt;=</option>
           <option value="=">=</option>
@@ -207,12 +310,13 @@ function renderBuild() {
       </form>
     </article>
 
-    <article class="card" style="margin-top:12px">
+    <article class="card card--spaced">
       <h3>Priority Requests</h3>
-      <ol>${requestItems || "<li>No requests.</li>"}</ol>
+      <ol id="request-list"></ol>
+      <p id="request-empty">No requests.</p>
     </article>
 
-    <article class="card" style="margin-top:12px">
+    <article class="card card--spaced">
       <h3>Perk Menu</h3>
       <div class="perk-status-legend">
         <span><i class="legend-swatch legend-green"></i>Green (selected): compatible with primary and secondary requests</span>
@@ -221,7 +325,7 @@ function renderBuild() {
       </div>
       <div class="controls">
         <label for="perk-picker-search">Search</label>
-        <input id="perk-picker-search" type="search" value="${h(buildPerkQuery)}" placeholder="Search perks" />
+        <input id="perk-picker-search" type="search" placeholder="Search perks" />
         <output id="perk-picker-count"></output>
       </div>
       <div class="table-wrap">
@@ -232,84 +336,51 @@ function renderBuild() {
       </div>
     </article>
 
-    <article class="card" style="margin-top:12px">
+    <article class="card card--spaced">
       <h3>Selected Perks</h3>
-      <div>${selectedPerks || "<small>No perks selected.</small>"}</div>
+      <div id="selected-perks"></div>
+      <small id="selected-perks-empty">No perks selected.</small>
     </article>
   `;
+}
 
+function wireBuildPanel(panel) {
   const actorSelect = panel.querySelector("#actor-value-select");
   const actorValueInput = panel.querySelector("#actor-value-number");
-  const actorForm = panel.querySelector("#actor-request-form");
-  const critForm = panel.querySelector("#crit-dmg-form");
+
+  // Filled by renderBuild whenever the option list changes, so a selection
+  // change is a map lookup rather than a walk over the option's attributes.
+  panel.actorMaxByAv = new Map();
 
   function syncActorMax() {
-    const opt = actorSelect?.selectedOptions?.[0];
-    if (!opt || !actorValueInput) return;
-    const max = Number(opt.getAttribute("data-max") || "100");
-    actorValueInput.max = String(max);
+    if (!actorSelect?.value || !actorValueInput) return;
+    const max = panel.actorMaxByAv.get(Number(actorSelect.value)) ?? 100;
+    const maxText = String(max);
+    if (actorValueInput.max === maxText && Number(actorValueInput.value) <= max) return;
+    actorValueInput.max = maxText;
     if (Number(actorValueInput.value) > max) {
       actorValueInput.value = String(max);
     }
   }
-
-  if (actorSelect) {
-    actorSelect.addEventListener("change", syncActorMax);
-  }
-  syncActorMax();
-
-  panel.querySelectorAll("button[data-request-action]").forEach((btn) => {
-    btn.addEventListener("click", async () => {
-      const action = btn.getAttribute("data-request-action");
-      const index = Number(btn.getAttribute("data-index"));
+  panel.syncActorMax = syncActorMax;
+  actorSelect?.addEventListener("change", syncActorMax);
+
+  const metaToggles = [
+    ["#meta-max-skills", "max_skills"],
+    ["#meta-max-crit", "max_crit"],
+    ["#meta-max-crit-dmg", "max_crit_damage"],
+  ];
+  metaToggles.forEach(([selector, kind]) => {
+    panel.querySelector(selector)?.addEventListener("change", async (ev) => {
       try {
-        if (action === "remove") {
-          await postJson("/api/requests/remove", { index });
-        } else if (action === "up") {
-          await postJson("/api/requests/move", { index, delta: -1 });
-        } else if (action === "down") {
-          await postJson("/api/requests/move", { index, delta: 1 });
-        }
+        await postJson("/api/requests/meta", { kind, enabled: ev.target.checked });
       } catch (err) {
         showMessage(err.message, "bad");
       }
     });
   });
 
-  panel.querySelector("#meta-max-skills")?.addEventListener("change", async (ev) => {
-    try {
-      await postJson("/api/requests/meta", {
-        kind: "max_skills",
-        enabled: ev.target.checked,
-      });
-    } catch (err) {
-      showMessage(err.message, "bad");
-    }
-  });
-
-  panel.querySelector("#meta-max-crit")?.addEventListener("change", async (ev) => {
-    try {
-      await postJson("/api/requests/meta", {
-        kind: "max_crit",
-        enabled: ev.target.checked,
-      });
-    } catch (err) {
-      showMessage(err.message, "bad");
-    }
-  });
-
-  panel.querySelector("#meta-max-crit-dmg")?.addEventListener("change", async (ev) => {
-    try {
-      await postJson("/api/requests/meta", {
-        kind: "max_crit_damage",
-        enabled: ev.target.checked,
-      });
-    } catch (err) {
-      showMessage(err.message, "bad");
-    }
-  });
-
-  actorForm?.addEventListener("submit", async (ev) => {
+  panel.querySelector("#actor-request-form")?.addEventListener("submit", async (ev) => {
     ev.preventDefault();
     const payload = {
       actor_value: Number(actorSelect.value),
@@ -325,7 +396,7 @@ function renderBuild() {
     }
   });
 
-  critForm?.addEventListener("submit", async (ev) => {
+  panel.querySelector("#crit-dmg-form")?.addEventListener("submit", async (ev) => {
     ev.preventDefault();
     const payload = {
       operator: panel.querySelector("#crit-dmg-operator")?.value || ">=",
@@ -340,84 +411,343 @@ function renderBuild() {
     }
   });
 
+  // One listener for every Up/Down/Remove button; the index is read from the
+  // clicked button, so rows can be reused without rebinding.
+  panel.querySelector("#request-list").addEventListener("click", async (ev) => {
+    const btn = ev.target.closest("button[data-request-action]");
+    if (!btn) return;
+    const action = btn.dataset.requestAction;
+    const index = Number(btn.dataset.index);
+    try {
+      if (action === "remove") {
+        await postJson("/api/requests/remove", { index });
+      } else if (action === "up") {
+        await postJson("/api/requests/move", { index, delta: -1 });
+      } else if (action === "down") {
+        await postJson("/api/requests/move", { index, delta: 1 });
+      }
+    } catch (err) {
+      showMessage(err.message, "bad");
+    }
+  });
+
+  panel.querySelector("#perk-picker-body").addEventListener("change", async (ev) => {
+    const node = ev.target.closest("input[data-perk-id]");
+    if (!node) return;
+    try {
+      await postJson("/api/requests/perk-toggle", {
+        perk_id: Number(node.dataset.perkId),
+        selected: node.checked,
+      });
+    } catch (err) {
+      showMessage(err.message, "bad");
+    }
+  });
+
   const perkSearch = panel.querySelector("#perk-picker-search");
-  perkSearch?.addEventListener("input", () => {
+  perkSearch.value = buildPerkQuery;
+  perkSearch.addEventListener("input", () => {
     buildPerkQuery = perkSearch.value;
-    drawBuildPerkPicker(build);
+    drawBuildPerkPicker(appState.build);
   });
+}
+
+// Rows dropped from a list are parked on the container instead of discarded
+// and handed back out before any new element is created.
+function takePooledRow(container, create) {
+  const pool = container.__pool;
+  const row = pool && pool.length ? pool.pop() : create();
+  container.appendChild(row);
+  return row;
+}
+
+function releaseRowsAfter(container, count) {
+  const pool = container.__pool || (container.__pool = []);
+  while (container.children.length > count) {
+    const row = container.lastElementChild;
+    row.remove();
+    pool.push(row);
+  }
+}
+
+function createPerkPill() {
+  const pill = document.createElement("span");
+  pill.className = "pill";
+  pill.append(document.createTextNode(""), document.createElement("small"));
+  return pill;
+}
+
+function syncSelectedPerks(container, perks) {
+  const kids = container.children;
+  perks.forEach((p, i) => {
+    const pill = kids[i] || takePooledRow(container, createPerkPill);
+    const label = `L${p.level} ${p.name} `;
+    if (pill.firstChild.data !== label) pill.firstChild.data = label;
+    setText(pill.lastChild, String(p.source));
+  });
+  releaseRowsAfter(container, perks.length);
+}
+
+// Request rows are cloned from the <template> in index.html, which the
+// browser parsed once, and then only have their text and indexes updated.
+// Their buttons carry no listeners; see the delegated handler in wireBuildPanel.
+function syncRequestRows(list, build) {
+  const template = document.querySelector("#request-row-template");
+  const entries = build.request_entries;
+  const kids = list.children;
+  entries.forEach((entry, i) => {
+    const row = kids[i] || takePooledRow(list, () => template.content.firstElementChild.cloneNode(true));
+    setText(row.querySelector(".request-text"), requestText(build, entry.index));
+    const index = String(entry.index);
+    row.querySelectorAll("button[data-request-action]").forEach((btn) => {
+      if (btn.dataset.index !== index) btn.dataset.index = index;
+    });
+  });
+  releaseRowsAfter(list, entries.length);
+}
+
+function renderBuild() {
+  const panel = document.querySelector("#panel-build");
+  const build = appState.build;
+
+  // The panel skeleton and its form handlers are created once; refreshes only
+  // update the parts that carry state, so typed input and focus survive.
+  if (!panel.dataset.ready) {
+    panel.innerHTML = buildPanelShell();
+    wireBuildPanel(panel);
+    panel.dataset.ready = "1";
+  }
+
+  updateStatsCard(panel.querySelector("#build-now"), build.now);
+  updateStatsCard(panel.querySelector("#build-target"), build.target);
+  setHtml(panel.querySelector("#build-status"), `
+    <h3>Status</h3>
+    <p class="metric ${build.valid ? "ok" : "bad"}"><strong>Valid:</strong> ${build.valid}</p>
+    <p class="metric ${build.feasible ? "ok" : "bad"}"><strong>Feasible:</strong> ${build.feasible}</p>
+    <p class="metric"><strong>Message:</strong> ${h(build.feasibility_message)}</p>
+    <p class="metric"><strong>Books:</strong> ${build.skill_books.needed} / ${build.skill_books.available}</p>
+    <p class="metric"><strong>SPECIAL:</strong> ${build.special.used}/${build.special.budget} (remaining ${build.special.remaining})</p>
+  `);
+
+  panel.querySelector("#meta-max-skills").checked = build.meta.max_skills;
+  panel.querySelector("#meta-max-crit").checked = build.meta.max_crit;
+  panel.querySelector("#meta-max-crit-dmg").checked = build.meta.max_crit_damage;
+
+  const actorSelect = panel.querySelector("#actor-value-select");
+  const actorOptions = build.request_controls.actor_values
+    .map((opt) => `<option value="${opt.actor_value}">${h(opt.name)} (max ${opt.max})</option>`)
+    .join("");
+  if (actorSelect.__html !== actorOptions) {
+    const selected = actorSelect.value;
+    actorSelect.innerHTML = actorOptions;
+    actorSelect.__html = actorOptions;
+    panel.actorMaxByAv = new Map(
+      build.request_controls.actor_values.map((opt) => [Number(opt.actor_value), Number(opt.max)]),
+    );
+    if (selected) actorSelect.value = selected;
+    panel.syncActorMax();
+  }
+
+  syncRequestRows(panel.querySelector("#request-list"), build);
+  panel.querySelector("#request-empty").hidden = build.request_entries.length > 0;
+
+  syncSelectedPerks(panel.querySelector("#selected-perks"), build.selected_perks);
+  panel.querySelector("#selected-perks-empty").hidden = build.selected_perks.length > 0;
+
   drawBuildPerkPicker(build);
 }
 
+function progressionRowHtml(r) {
+  const skills = Object.entries(r.skills)
+    .slice(0, 4)
+    .map(([k, v]) => `${h(k)} ${v}`)
+    .join(" | ");
+  return `
+    <td>L${r.level}</td>
+    <td>${h(r.perk_label)}</td>
+    <td>${h(r.perk_reason || "")}</td>
+    <td>${r.spent_skill_points}</td>
+    <td>${r.unspent_skill_points}</td>
+    <td>${n(r.stats.crit_chance)}</td>
+    <td>${n(r.stats.crit_damage_potential)}</td>
+    <td>${skills}</td>
+  `;
+}
+
+// Shows rows up to `level`; rows past it stay in the table, just hidden.
+function showProgressionUpTo(panel, level) {
+  setText(panel.querySelector("#preview-level-value"), String(level));
+  const rows = appState.progression.rows;
+  const trs = panel.querySelector("#progression-body").children;
+  for (let i = 0; i < trs.length; i += 1) {
+    const hide = rows[i].level > level;
+    if (trs[i].hidden !== hide) trs[i].hidden = hide;
+  }
+}
+
 function renderProgression() {
   const panel = document.querySelector("#panel-progression");
   const rows = appState.progression.rows;
   const maxLevel = appState.app.target_level;
 
-  panel.innerHTML = `
-    <div class="controls">
-      <label for="preview-level">Preview Level</label>
-      <input id="preview-level" name="preview-level" type="range" min="1" max="${maxLevel}" value="${maxLevel}" />
-      <output id="preview-level-value">${maxLevel}</output>
-      <small>${h(appState.progression.skill_books_summary)}</small>
-    </div>
-    <div class="table-wrap">
-      <table>
-        <thead>
-          <tr>
-            <th>Level</th>
-            <th>Perk</th>
-            <th>Reason</th>
-            <th>Spent</th>
-            <th>Unspent</th>
-            <th>Crit %</th>
-            <th>Crit Dmg</th>
-            <th>Skills (sample)</th>
-          </tr>
-        </thead>
-        <tbody id="progression-body"></tbody>
-      </table>
-    </div>
-  `;
+  if (!panel.dataset.ready) {
+    panel.innerHTML = `
+      <div class="controls">
+        <label for="preview-level">Preview Level</label>
+        <input id="preview-level" name="preview-level" type="range" min="1" />
+        <output id="preview-level-value"></output>
+        <small id="progression-books"></small>
+      </div>
+      <div class="table-wrap">
+        <table>
+          <thead>
+            <tr>
+              <th>Level</th>
+              <th>Perk</th>
+              <th>Reason</th>
+              <th>Spent</th>
+              <th>Unspent</th>
+              <th>Crit %</th>
+              <th>Crit Dmg</th>
+              <th>Skills (sample)</th>
+            </tr>
+          </thead>
+          <tbody id="progression-body"></tbody>
+        </table>
+      </div>
+    `;
+    const slider = panel.querySelector("#preview-level");
+    slider.addEventListener("input", () => showProgressionUpTo(panel, Number(slider.value)));
+    panel.dataset.ready = "1";
+  }
 
+  setText(panel.querySelector("#progression-books"), appState.progression.skill_books_summary);
+
+  // One row per level is kept across states; a row is only re-rendered when
+  // its own markup changed, and the slider merely hides later levels.
   const body = panel.querySelector("#progression-body");
+  const trs = body.children;
+  const live = trs.length;
+  const fresh = document.createDocumentFragment();
+  rows.forEach((r, i) => {
+    let tr = trs[i];
+    if (i >= live) {
+      tr = document.createElement("tr");
+      fresh.appendChild(tr);
+    }
+    setHtml(tr, progressionRowHtml(r));
+  });
+  if (fresh.firstChild) body.appendChild(fresh);
+  truncateChildren(body, rows.length);
+
   const slider = panel.querySelector("#preview-level");
-  const output = panel.querySelector("#preview-level-value");
-
-  function draw(level) {
-    output.textContent = String(level);
-    const visible = rows.filter((r) => r.level <= level);
-    body.innerHTML = visible
-      .map((r) => {
-        const skills = Object.entries(r.skills)
-          .slice(0, 4)
-          .map(([k, v]) => `${h(k)} ${v}`)
-          .join(" | ");
-        return `
-          <tr>
-            <td>L${r.level}</td>
-            <td>${h(r.perk_label)}</td>
-            <td>${h(r.perk_reason || "")}</td>
-            <td>${r.spent_skill_points}</td>
-            <td>${r.unspent_skill_points}</td>
-            <td>${n(r.stats.crit_chance)}</td>
-            <td>${n(r.stats.crit_damage_potential)}</td>
-            <td>${skills}</td>
-          </tr>
-        `;
-      })
-      .join("");
+  if (slider.max !== String(maxLevel)) {
+    slider.max = String(maxLevel);
+    slider.value = String(maxLevel);
   }
+  showProgressionUpTo(panel, Number(slider.value));
+}
+
+// Formatted catalog rows by id and equipped flag; gear fields are fixed for
+// a given catalog, so this is only cleared when the catalog itself changes.
+const gearRowCache = new Map();
 
-  slider.addEventListener("input", () => draw(Number(slider.value)));
-  draw(maxLevel);
+function gearRowHtml(item) {
+  const key = `${item.id}:${item.equipped ? 1 : 0}`;
+  let html = gearRowCache.get(key);
+  if (html === undefined) {
+    html = formatGearRow(item);
+    gearRowCache.set(key, html);
+  }
+  return html;
 }
 
-function renderLibrary() {
-  const panel = document.querySelector("#panel-library");
-  const gear = appState.library.gear;
-  const equipped = appState.library.equipped;
+function formatGearRow(item) {
+  const details = [];
+  if (item.conditional_effects > 0) {
+    details.push(`${item.conditional_effects} conditional`);
+  }
+  if (item.excluded_conditional_effects > 0) {
+    details.push(`${item.excluded_conditional_effects} excluded`);
+  }
+  if (details.length === 0) {
+    details.push(`wt ${n(item.weight)}`);
+  }
+  return `
+    <tr>
+      <td>${h(item.name)}</td>
+      <td>${h(item.kind)}</td>
+      <td>${item.slot}</td>
+      <td>${h(details.join(" | "))}</td>
+      <td><button type="button" data-equip-id="${item.id}">${item.equipped ? "Equipped" : "Equip"}</button></td>
+    </tr>
+  `;
+}
+
+// Lowercased gear names, computed once per gear list rather than per keystroke.
+let gearNameIndex = { gear: null, names: [] };
 
-  const equippedRows = equipped.map((item) => {
+function gearNamesLower(gear) {
+  if (gearNameIndex.gear !== gear) {
+    gearNameIndex = { gear, names: gear.map((item) => item.name.toLowerCase()) };
+  }
+  return gearNameIndex.names;
+}
+
+// The last filter's result; a query that extends the previous one under the
+// same toggles can only narrow it, so only those matches are rescanned.
+let lastGearFilter = null;
+
+function gearMatches(gear, q) {
+  const last = lastGearFilter;
+  const narrowing = last
+    && last.gear === gear
+    && last.showArmor === showArmor
+    && last.showWeapons === showWeapons
+    && q.startsWith(last.q);
+  if (narrowing && last.q === q) return last.matches;
+  const names = gearNamesLower(gear);
+  const pool = narrowing ? last.matches : gear.map((_item, i) => i);
+  const matches = pool.filter((i) => {
+    const kind = gear[i].kind;
+    if (!showArmor && kind === "armor") return false;
+    if (!showWeapons && kind === "weapon") return false;
+    return !q || names[i].includes(q);
+  });
+  lastGearFilter = { gear, showArmor, showWeapons, q, matches };
+  return matches;
+}
+
+const GEAR_PAGE = 60;
+
+// Only the first page of catalog rows is created up front; a sentinel row
+// at the end pulls in the next page when it scrolls into view.
+const gearPageObserver = new IntersectionObserver((entries) => {
+  entries.forEach((entry) => {
+    if (!entry.isIntersecting) return;
+    gearPageObserver.unobserve(entry.target);
+    const body = entry.target.parentElement;
+    entry.target.remove();
+    if (body) appendGearPage(body);
+  });
+});
+
+function appendGearPage(body) {
+  const rows = body.__gearRows || [];
+  const end = Math.min(rows.length, body.__gearShown + GEAR_PAGE);
+  body.insertAdjacentHTML("beforeend", rows.slice(body.__gearShown, end).map(gearRowHtml).join(""));
+  body.__gearShown = end;
+  if (end < rows.length) {
+    const sentinel = document.createElement("tr");
+    sentinel.className = "gear-more";
+    sentinel.innerHTML = `<td colspan="5"><small>Loading more…</small></td>`;
+    body.appendChild(sentinel);
+    gearPageObserver.observe(sentinel);
+  }
+}
+
+function equippedRowsHtml(equipped) {
+  const rows = equipped.map((item) => {
     const effects = (item.effects || []).map((x) => h(x)).join("; ");
     return `
       <tr>
@@ -429,125 +759,173 @@ function renderLibrary() {
       </tr>
     `;
   }).join("");
+  return rows || "<tr><td colspan='5'>No gear equipped.</td></tr>";
+}
 
-  panel.innerHTML = `
-    <article class="card">
-      <h3>Equipped Gear</h3>
-      <div class="table-wrap">
-        <table>
-          <thead><tr><th>Slot</th><th>Kind</th><th>Name</th><th>Effects</th><th>Action</th></tr></thead>
-          <tbody id="equipped-body">${equippedRows || "<tr><td colspan='5'>No gear equipped.</td></tr>"}</tbody>
-        </table>
-      </div>
-    </article>
+function drawGear() {
+  const panel = document.querySelector("#panel-library");
+  const body = panel.querySelector("#gear-body");
+  const gear = appState.library.gear;
+  const q = gearQuery.trim().toLowerCase();
+  const filtered = gearMatches(gear, q).map((i) => gear[i]);
+
+  setText(panel.querySelector("#gear-count"), `${filtered.length} / ${gear.length}`);
+  gearPageObserver.disconnect();
+  body.replaceChildren();
+  body.__gearRows = filtered;
+  body.__gearShown = 0;
+  appendGearPage(body);
+}
 
-    <article class="card" style="margin-top:12px">
-      <h3>Gear Catalog</h3>
-      <div class="controls">
-        <label for="gear-search">Search</label>
-        <input id="gear-search" type="search" value="${h(gearQuery)}" placeholder="Search gear" />
-        <label><input id="gear-armor" type="checkbox" ${showArmor ? "checked" : ""} /> Armor</label>
-        <label><input id="gear-weapons" type="checkbox" ${showWeapons ? "checked" : ""} /> Weapons</label>
-        <output id="gear-count"></output>
-      </div>
-      <div class="table-wrap">
-        <table>
-          <thead><tr><th>Name</th><th>Kind</th><th>Slot</th><th>Crit Dmg/Effects</th><th>Action</th></tr></thead>
-          <tbody id="gear-body"></tbody>
-        </table>
-      </div>
-    </article>
-  `;
+// Equipping or clearing a slot only flips `equipped` flags; when the catalog
+// version is unchanged, relabel the rendered Equip buttons in place and adopt
+// the new gear objects instead of rebuilding the table.
+function refreshEquipState(body, gear) {
+  gearNameIndex.gear = gear;
+  if (lastGearFilter) lastGearFilter.gear = gear;
+  const byId = new Map(gear.map((item) => [item.id, item]));
+  body.__gearRows = (body.__gearRows || []).map((item) => byId.get(item.id) || item);
+  body.querySelectorAll("button[data-equip-id]").forEach((btn) => {
+    const item = byId.get(Number(btn.dataset.equipId));
+    setText(btn, item && item.equipped ? "Equipped" : "Equip");
+  });
+}
 
-  panel.querySelectorAll("button[data-clear-slot]").forEach((btn) => {
-    btn.addEventListener("click", async () => {
-      try {
-        await postJson("/api/equipment/clear", { slot: Number(btn.getAttribute("data-clear-slot")) });
-      } catch (err) {
-        showMessage(err.message, "bad");
+function wireLibraryPanel(panel) {
+  // The panel outlives every re-render, so one listener serves every Clear
+  // and Equip button.
+  panel.addEventListener("click", async (ev) => {
+    const clear = ev.target.closest("button[data-clear-slot]");
+    const equip = ev.target.closest("button[data-equip-id]");
+    try {
+      if (clear) {
+        await postJson("/api/equipment/clear", { slot: Number(clear.dataset.clearSlot) });
+      } else if (equip) {
+        await postJson("/api/equipment/equip", { form_id: Number(equip.dataset.equipId) });
       }
-    });
+    } catch (err) {
+      showMessage(err.message, "bad");
+    }
   });
 
   const search = panel.querySelector("#gear-search");
   const armor = panel.querySelector("#gear-armor");
   const weapons = panel.querySelector("#gear-weapons");
-  const body = panel.querySelector("#gear-body");
-  const count = panel.querySelector("#gear-count");
-
-  function drawGear() {
-    const q = gearQuery.trim().toLowerCase();
-    const filtered = gear.filter((item) => {
-      if (!showArmor && item.kind === "armor") return false;
-      if (!showWeapons && item.kind === "weapon") return false;
-      if (q && !item.name.toLowerCase().includes(q)) return false;
-      return true;
-    });
-
-    count.textContent = `${filtered.length} / ${gear.length}`;
-    body.innerHTML = filtered.slice(0, 400).map((item) => {
-      const details = [];
-      if (item.conditional_effects > 0) {
-        details.push(`${item.conditional_effects} conditional`);
-      }
-      if (item.excluded_conditional_effects > 0) {
-        details.push(`${item.excluded_conditional_effects} excluded`);
-      }
-      if (details.length === 0) {
-        details.push(`wt ${n(item.weight)}`);
-      }
-      return `
-        <tr>
-          <td>${h(item.name)}</td>
-          <td>${h(item.kind)}</td>
-          <td>${item.slot}</td>
-          <td>${h(details.join(" | "))}</td>
-          <td><button type="button" data-equip-id="${item.id}">${item.equipped ? "Equipped" : "Equip"}</button></td>
-        </tr>
-      `;
-    }).join("");
-
-    body.querySelectorAll("button[data-equip-id]").forEach((btn) => {
-      btn.addEventListener("click", async () => {
-        try {
-          await postJson("/api/equipment/equip", { form_id: Number(btn.getAttribute("data-equip-id")) });
-        } catch (err) {
-          showMessage(err.message, "bad");
-        }
-      });
-    });
-  }
+  search.value = gearQuery;
+  armor.checked = showArmor;
+  weapons.checked = showWeapons;
 
-  search?.addEventListener("input", () => {
+  // Typing bursts collapse into one redraw once input pauses for 80 ms.
+  search.addEventListener("input", () => {
     gearQuery = search.value;
-    drawGear();
+    clearTimeout(gearSearchTimer);
+    gearSearchTimer = setTimeout(drawGear, 80);
   });
-  armor?.addEventListener("change", () => {
+  armor.addEventListener("change", () => {
     showArmor = armor.checked;
     drawGear();
   });
-  weapons?.addEventListener("change", () => {
+  weapons.addEventListener("change", () => {
     showWeapons = weapons.checked;
     drawGear();
   });
+}
+
+function renderLibrary() {
+  const panel = document.querySelector("#panel-library");
+  const gear = appState.library.gear;
+
+  if (!panel.dataset.ready) {
+    panel.innerHTML = `
+      <article class="card">
+        <h3>Equipped Gear</h3>
+        <div class="table-wrap">
+          <table>
+            <thead><tr><th>Slot</th><th>Kind</th><th>Name</th><th>Effects</th><th>Action</th></tr></thead>
+            <tbody id="equipped-body"></tbody>
+          </table>
+        </div>
+      </article>
+
+      <article class="card card--spaced">
+        <h3>Gear Catalog</h3>
+        <div class="controls">
+          <label for="gear-search">Search</label>
+          <input id="gear-search" type="search" placeholder="Search gear" />
+          <label><input id="gear-armor" type="checkbox" /> Armor</label>
+          <label><input id="gear-weapons" type="checkbox" /> Weapons</label>
+          <output id="gear-count"></output>
+        </div>
+        <div class="table-wrap">
+          <table>
+            <thead><tr><th>Name</th><th>Kind</th><th>Slot</th><th>Crit Dmg/Effects</th><th>Action</th></tr></thead>
+            <tbody id="gear-body"></tbody>
+          </table>
+        </div>
+      </article>
+    `;
+    wireLibraryPanel(panel);
+    panel.dataset.ready = "1";
+  }
+
+  setHtml(panel.querySelector("#equipped-body"), equippedRowsHtml(appState.library.equipped));
+
+  const body = panel.querySelector("#gear-body");
+  const catalogKey = appState.library.gear_version;
+  if (body.__catalogKey === catalogKey) {
+    refreshEquipState(body, gear);
+    return;
+  }
+  body.__catalogKey = catalogKey;
+  gearRowCache.clear();
   drawGear();
 }
 
 function renderDiagnostics() {
   const panel = document.querySelector("#panel-diagnostics");
   const rows = appState.build.diagnostics;
-  if (!rows.length) {
-    panel.innerHTML = `<article class="card"><h3>Diagnostics</h3><p class="ok">No diagnostics.</p></article>`;
-    return;
+  if (!panel.dataset.ready) {
+    panel.innerHTML = `
+      <article class="card">
+        <h3>Diagnostics</h3>
+        <p class="ok" id="diagnostics-empty">No diagnostics.</p>
+        <ul id="diagnostics-list"></ul>
+      </article>
+    `;
+    panel.dataset.ready = "1";
   }
-  panel.innerHTML = `
-    <article class="card">
-      <h3>Diagnostics</h3>
-      <ul>
-        ${rows.map((r) => `<li><strong>${h(r.severity)}</strong> ${h(r.code)}: ${h(r.message)}</li>`).join("")}
-      </ul>
-    </article>
-  `;
+  panel.querySelector("#diagnostics-empty").hidden = rows.length > 0;
+  syncChildren(
+    panel.querySelector("#diagnostics-list"),
+    rows.map((r) => ({ html: `<strong>${h(r.severity)}</strong> ${h(r.code)}: ${h(r.message)}` })),
+    "li",
+  );
+}
+
+const panelRenderers = {
+  build: () => renderBuild(),
+  progression: () => renderProgression(),
+  library: () => renderLibrary(),
+  diagnostics: () => renderDiagnostics(),
+};
+
+// The slice of state each panel draws from; a new state only re-renders the
+// panels whose slice differs from what they last saw.
+const panelStateKeys = {
+  build: (state) => JSON.stringify([state.build, state.library.perks]),
+  progression: (state) => JSON.stringify([state.progression, state.app.target_level]),
+  library: (state) => JSON.stringify([state.library.gear_version, state.library.equipped]),
+  diagnostics: (state) => JSON.stringify(state.build.diagnostics),
+};
+const panelSeenKeys = {};
+
+// Panels that are hidden when a new state arrives are only marked stale and
+// get rendered the first time their tab is shown.
+const stalePanels = new Set();
+
+function renderPanel(name) {
+  stalePanels.delete(name);
+  panelRenderers[name]();
 }
 
 function wireTabs() {
@@ -559,27 +937,65 @@ function wireTabs() {
       document.querySelectorAll(".panel").forEach((panel) => {
         panel.classList.toggle("active", panel.dataset.panel === target);
       });
+      if (appState && stalePanels.has(target)) {
+        renderPanel(target);
+      }
     });
   });
 }
 
 function renderAll() {
   if (!appState) return;
-  document.querySelector("#app-title").textContent = appState.app.banner_title || "FNV Planner";
-  const badge = document.querySelector("#app-game-badge");
-  if (badge) {
-    badge.textContent = String(appState.app.game_variant || "fallout-nv").toUpperCase();
-  }
-  document.querySelector("#app-meta").textContent = `${appState.app.plugin_mode} | target L${appState.app.target_level} | generated ${appState.generated_at}`;
-  renderBuild();
-  renderProgression();
-  renderLibrary();
-  renderDiagnostics();
+  setText(document.querySelector("#app-title"), appState.app.banner_title || "FNV Planner");
+  setText(
+    document.querySelector("#app-game-badge"),
+    String(appState.app.game_variant || "fallout-nv").toUpperCase(),
+  );
+  setText(document.querySelector("#app-meta"), `${appState.app.plugin_mode} | target L${appState.app.target_level} | generated ${appState.generated_at}`);
+  document.querySelectorAll(".panel").forEach((panel) => {
+    const name = panel.dataset.panel;
+    const key = panelStateKeys[name](appState);
+    if (panelSeenKeys[name] === key) return;
+    panelSeenKeys[name] = key;
+    if (panel.classList.contains("active")) {
+      renderPanel(name);
+    } else {
+      stalePanels.add(name);
+    }
+  });
+}
+
+// Bursts of actions (e.g. repeated Up clicks) each deliver a fresh state;
+// only the latest one needs painting, once per frame.
+let renderPending = false;
+
+function scheduleRender() {
+  if (renderPending) return;
+  renderPending = true;
+  requestAnimationFrame(() => {
+    renderPending = false;
+    renderAll();
+  });
+}
+
+// Resolves once the page is visible; a tab opened in the background fetches
+// its state right away but leaves the first render until it is shown.
+function whenVisible() {
+  if (!document.hidden) return Promise.resolve();
+  return new Promise((resolve) => {
+    const onChange = () => {
+      if (document.hidden) return;
+      document.removeEventListener("visibilitychange", onChange);
+      resolve();
+    };
+    document.addEventListener("visibilitychange", onChange);
+  });
 }
 
 async function main() {
   wireTabs();
   await fetchState();
+  await whenVisible();
   renderAll();
 }
 